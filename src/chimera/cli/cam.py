@@ -9,8 +9,6 @@ from chimera.core.exceptions import print_exception
 from chimera.core.version import chimera_version
 from chimera.interfaces.camera import CameraFeature, CameraStatus
 from chimera.interfaces.filterwheel import InvalidFilterPositionException
-from chimera.util.ds9 import DS9
-from chimera.util.image import Image
 
 from .cli import ChimeraCLI, ParameterType, action
 
@@ -420,6 +418,10 @@ class ChimeraCam(ChimeraCLI):
         help="Take an exposure with selected parameters",
     )
     def expose(self, options):
+        # heavy (astropy): only for the action that needs them, the others
+        # are scripted in tight loops (see test_cli_startup.py)
+        from chimera.util.image import Image
+
         camera = self.camera
 
         # first check binning
@@ -508,6 +510,8 @@ class ChimeraCam(ChimeraCLI):
             not self.options.disable_display and exp_times[0] >= 5
         ) or options.force_display:
             try:
+                from chimera.util.ds9 import DS9
+
                 ds9 = DS9()
             except OSError:
                 self.err("Problems starting DS9. DIsplay disabled.")
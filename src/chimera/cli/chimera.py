@@ -13,6 +13,7 @@ import threading
 from typing import Any
 
 import chimera.core.log
+from chimera.core import tracing
 from chimera.core.bus import Bus
 from chimera.core.chimera_config import ChimeraConfig
 from chimera.core.constants import CHIMERA_CONFIG_DEFAULT_FILENAME
@@ -61,6 +62,13 @@ class ChimeraCLI:
         if hasattr(signal, "SIGUSR1"):
             faulthandler.register(signal.SIGUSR1, all_threads=True)
 
+        if self.options.trace_file:
+            try:
+                tracing.configure(self.options.trace_file, self.options.trace_sample)
+            except (OSError, ValueError) as e:
+                log.error(f"Cannot trace to {self.options.trace_file}: {e}")
+                sys.exit(1)
+
     def parse_args(self):
         parser = argparse.ArgumentParser(
             prog="chimera",
@@ -99,6 +107,24 @@ class ChimeraCLI:
             metavar="FILE",
         )
 
+        trace_group = parser.add_argument_group("tracing")
+        trace_group.add_argument(
+            "--trace",
+            dest="trace_file",
+            help="Record request spans to FILE (Chrome trace format for .json, "
+            "JSON lines otherwise); summarize with chimera-ctl trace FILE.",
+            metavar="FILE",
+        )
+        trace_group.add_argument(
+            "--trace-sample",
+            dest="trace_sample",
+            type=float,
+            default=1.0,
+            help="Fraction of the traces starting here to record; "
+            "[default=%(default)s]",
+            metavar="RATE",
+        )
+
         misc_group = parser.add_argument_group("general")
         misc_group.add_argument(
             "-v",
@@ -132,7 +158,9 @@ class ChimeraCLI:
 
         try:
             self.bus = Bus(f"tcp://{self.options.host}:{self.options.port}")
-            self.manager = Manager(bus=self.bus, site=site)
+            self.manager = Manager(
+                bus=self.bus, site=site, scheduler=self.config.scheduler
+            )
         except ChimeraException:
             log.error(
                 "Chimera is already running on this machine. Use chimera-admin to manage it."
@@ -173,6 +201,7 @@ class ChimeraCLI:
                 path=path,
                 config=config,
                 start=start,
+                isolated=location in self.config.isolated,
             )
         except Exception:
             log.exception(f"error starting {location.path}")
@@ -199,6 +228,7 @@ class ChimeraCLI:
         self.manager.shutdown()
         # the bus goes down last: this wakes the selector and run_forever returns
         self.bus.shutdown()
+        tracing.shutdown()
         log.info("System shut down.")
 
 
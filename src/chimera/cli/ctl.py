@@ -11,6 +11,8 @@ from rich import box
 from rich.console import Console
 from rich.table import Table
 
+from chimera.core import tracing
+from chimera.core.metrics import STAGES
 from chimera.core.version import chimera_version
 
 from .cli import ChimeraCLI, ParameterType, action
@@ -26,6 +28,14 @@ def _fmt_age(seconds: float) -> str:
     return f"{int(seconds // 86400)}d{int((seconds % 86400) // 3600):02d}h"
 
 
+def _fmt_latency(seconds: float) -> str:
+    if seconds < 0.001:
+        return f"{seconds * 1e6:.0f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
 def _table(title: str, *columns: str) -> Table:
     table = Table(
         title=title,
@@ -64,7 +74,15 @@ class ChimeraCtl(ChimeraCLI):
                 default=False,
                 help="Dump the raw status as JSON",
                 help_group="CTL",
-            )
+            ),
+            dict(
+                name="prometheus",
+                long="prometheus",
+                type=ParameterType.BOOLEAN,
+                default=False,
+                help="Dump metrics in the Prometheus text format",
+                help_group="CTL",
+            ),
         )
 
     def run(self, cmdline_args: list[str]):
@@ -73,15 +91,23 @@ class ChimeraCtl(ChimeraCLI):
         # subcommand-style front end over the flag-based framework:
         #   chimera-ctl [status]
         #   chimera-ctl config [object]
+        #   chimera-ctl metrics
+        #   chimera-ctl trace FILE...
         if len(args) > 1 and not args[1].startswith("-"):
             subcommand = args.pop(1)
             match subcommand:
+                case "trace":
+                    # offline: reads trace files, needs no running system
+                    self._print_trace(args[1:])
+                    sys.exit(0)
                 case "status":
                     args.insert(1, "--status")
                 case "config":
                     if len(args) > 1 and not args[1].startswith("-"):
                         self._config_target = args.pop(1)
                     args.insert(1, "--show-config")
+                case "metrics":
+                    args.insert(1, "--metrics")
                 case _:
                     self.exit(f"Unknown command: {subcommand}")
 
@@ -139,6 +165,88 @@ class ChimeraCtl(ChimeraCLI):
                 table.add_row(key, str(value), f"[dim]{type(value).__name__}[/dim]")
             self._print_table(table, "no config")
 
+    @action(
+        help="Print request latencies per object, method and bus stage",
+        help_group="CTL",
+    )
+    def metrics(self, options: optparse.Values):
+        if options.prometheus:
+            # verbatim: the exposition format is line-oriented
+            sys.stdout.write(self.manager.get_metrics(prometheus=True))
+            return
+
+        metrics = self.manager.get_metrics()
+        if options.json:
+            self.out(json.dumps(metrics, indent=2))
+            return
+
+        table = _table(
+            f"Request latencies ({len(metrics['histograms'])})",
+            "object",
+            "method",
+            "stage",
+            "count",
+            "mean",
+            "p50",
+            "p99",
+            "max",
+        )
+        order = {stage: index for index, stage in enumerate(STAGES)}
+        histograms = sorted(
+            metrics["histograms"],
+            key=lambda h: (h["path"], h["method"], order.get(h["stage"], len(order))),
+        )
+        for h in histograms:
+            table.add_row(
+                h["path"],
+                h["method"],
+                h["stage"],
+                str(h["count"]),
+                _fmt_latency(h["sum"] / h["count"] if h["count"] else 0.0),
+                _fmt_latency(h["p50"]),
+                _fmt_latency(h["p99"]),
+                _fmt_latency(h["max"]),
+            )
+        self._print_table(table, "no requests recorded")
+
+        counters = _table("Counters", "name", "object", "method", "value")
+        for c in metrics["counters"]:
+            counters.add_row(c["name"], c["path"], c["method"], str(c["value"]))
+        self._print_table(counters, "no errors or rejections")
+
+    def _print_trace(self, paths: list[str]) -> None:
+        if not paths:
+            self.exit("Usage: chimera-ctl trace FILE...")
+        try:
+            spans = tracing.load(paths)
+        except OSError as e:
+            self.exit(f"Cannot read trace: {e}")
+
+        traces = {span["trace"] for span in spans}
+        breakdown = tracing.critical_path(spans)
+
+        table = _table(
+            f"Critical path ({len(spans)} spans in {len(traces)} traces)",
+            "span",
+            "kind",
+            "count",
+            "time",
+            "mean",
+            "share",
+        )
+        for (kind, name), entry in sorted(
+            breakdown.items(), key=lambda item: -item[1]["time"]
+        ):
+            table.add_row(
+                name,
+                kind,
+                str(entry["count"]),
+                _fmt_latency(entry["time"]),
+                _fmt_latency(entry["time"] / entry["count"]),
+                f"{entry['share']:.1%}",
+            )
+        self._print_table(table, "no spans recorded")
+
     def _print_status(self, status: dict[str, Any]) -> None:
         console = self._console
         system = status["system"]
@@ -164,6 +272,7 @@ class ChimeraCtl(ChimeraCLI):
             "[green]yes[/green]" if bus["running"] else "[red]no[/red]",
         )
         grid.add_row("inbox", f"{bus['inbox_size']} queued")
+        grid.add_row("expired", f"{bus.get('expired', 0)} dropped unexecuted")
         console.print(grid)
         console.print()
 
@@ -179,10 +288,25 @@ class ChimeraCtl(ChimeraCLI):
 
         # our own ephemeral bus shows up as a peer of the manager: mark it
         us = self.bus.url.bus
-        peers = _table(f"Peers ({len(bus['peers'])})", "bus")
+        peers = _table(
+            f"Peers ({len(bus['peers'])})",
+            "bus",
+            "idle",
+            "missed pongs",
+            "queued (max)",
+            "dropped",
+            "rejected",
+        )
         for peer in bus["peers"]:
-            marker = " [dim](us)[/dim]" if peer == us else ""
-            peers.add_row(f"{peer}{marker}")
+            marker = " [dim](us)[/dim]" if peer["bus"] == us else ""
+            peers.add_row(
+                f"{peer['bus']}{marker}",
+                _fmt_age(peer["idle"]),
+                str(peer["missed_pongs"]),
+                f"{peer['queued']} ({peer['high_water']})",
+                str(peer["dropped"]),
+                str(peer["rejected"]),
+            )
         self._print_table(peers, "no connected peers")
 
         mailboxes = bus["mailboxes"]
@@ -11,19 +11,6 @@ import sys
 import time
 from textwrap import indent
 
-import yaml
-from astropy.time import Time
-
-from chimera.controllers.scheduler.model import (
-    AutoFlat,
-    AutoFocus,
-    Autoguide,
-    Expose,
-    Point,
-    PointVerify,
-    Program,
-    Session,
-)
 from chimera.controllers.scheduler.states import State
 from chimera.controllers.scheduler.status import SchedulerStatus
 from chimera.core.constants import DEFAULT_PROGRAM_DATABASE
@@ -34,14 +21,29 @@ from chimera.util.position import Position
 
 from .cli import ChimeraCLI, action
 
-action_dict = {
-    "autofocus": AutoFocus,
-    "autoflat": AutoFlat,
-    "autoguide": Autoguide,
-    "pointverify": PointVerify,
-    "point": Point,
-    "expose": Expose,
-}
+# NOTE: the scheduler model (which opens, and creates, the program database
+# when imported), astropy and yaml are imported by the actions using them:
+# start, stop or info must not pay for them
+
+
+def _action_classes():
+    from chimera.controllers.scheduler.model import (
+        AutoFlat,
+        AutoFocus,
+        Autoguide,
+        Expose,
+        Point,
+        PointVerify,
+    )
+
+    return {
+        "autofocus": AutoFocus,
+        "autoflat": AutoFlat,
+        "autoguide": Autoguide,
+        "pointverify": PointVerify,
+        "point": Point,
+        "expose": Expose,
+    }
 
 
 class ChimeraSched(ChimeraCLI):
@@ -111,6 +113,8 @@ class ChimeraSched(ChimeraCLI):
         action_group="DB",
     )
     def new_database(self, options):
+        from chimera.controllers.scheduler.model import Program, Session
+
         # save a copy
         if os.path.exists(DEFAULT_PROGRAM_DATABASE):
             shutil.copy(
@@ -161,6 +165,13 @@ class ChimeraSched(ChimeraCLI):
         return implied
 
     def _generate_database_yaml(self, options):
+        import yaml
+        from astropy.time import Time
+
+        from chimera.controllers.scheduler.model import Program, Session
+
+        action_dict = _action_classes()
+
         with open(options.filename) as stream:
             try:
                 print("Loading %s" % options.filename, stream)
@@ -308,6 +319,13 @@ class ChimeraSched(ChimeraCLI):
         self.out("Restart the scheduler to run it with the new database.")
 
     def _generate_database_basic(self, options):
+        from chimera.controllers.scheduler.model import (
+            Expose,
+            Point,
+            Program,
+            Session,
+        )
+
         f = None
         try:
             f = open(options.filename)
@@ -452,6 +470,8 @@ class ChimeraSched(ChimeraCLI):
 
     @action(help="Monitor scheduler actions", help_group="RUN")
     def monitor(self, options):
+        from chimera.controllers.scheduler.model import Program, Session
+
         def program_begin_clbk(program_id):
             session = Session()
             program = session.query(Program).filter(Program.id == program_id).one()
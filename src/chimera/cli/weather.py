@@ -5,8 +5,6 @@
 import datetime
 import sys
 
-from astropy.time import Time
-
 from chimera.core.version import chimera_version
 from chimera.util.output import green, red
 
@@ -66,6 +64,9 @@ class ChimeraWeather(ChimeraCLI):
 
         self.out("=" * 80)
 
+        # astropy takes longer to import than the rest of this tool
+        from astropy.time import Time
+
         t = self.weatherstation.get_last_measurement_time()
         t = Time(t, format="fits")
         if datetime.datetime.now(datetime.UTC) - t.to_datetime(
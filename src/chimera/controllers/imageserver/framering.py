@@ -0,0 +1,260 @@
+"""Shared-memory frame ring: camera frames handed to co-located consumers
+(autoguider, quick-look analysis) without a round trip through the disk.
+
+The ring is one multiprocessing.shared_memory segment per ImageServer,
+split in equal slots. The ImageServer owns the bookkeeping: which slot
+holds which frame and how many consumers still use it. Cameras and
+consumers on the same host attach to the segment by name and write or map
+the pixels in place.
+
+A frame is described by a handle, a plain dict that travels over the bus:
+{"name", "slot", "seq", "offset", "shape", "dtype", "header"}. New frames
+go to the oldest slot nobody holds a reference to; when every slot is
+referenced, the oldest is overwritten anyway, so a slow consumer never
+blocks readout. Each slot records the sequence number of the frame in it:
+a consumer checks valid(handle) after using a view to know the frame was
+not overwritten meanwhile.
+"""
+
+import itertools
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+__all__ = ["FrameRing", "attach", "mapped_frame"]
+
+log = logging.getLogger(__name__)
+
+# frames start on page boundaries
+_ALIGN = 4096
+
+_names = itertools.count()
+
+
+def _header_size(slots: int) -> int:
+    # slot count, then one sequence number per slot
+    size = 8 * (1 + slots)
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class FrameRing:
+    """A ring of frame slots in shared memory. Built with create() by its
+    owner, or with attach() by any process on the host."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        self.slots = int(np.ndarray((1,), dtype=np.int64, buffer=shm.buf)[0])
+        # None once closed
+        self._seqs: np.ndarray | None = np.ndarray(
+            (self.slots,), dtype=np.int64, buffer=shm.buf, offset=8
+        )
+        self._data = _header_size(self.slots)
+        self.slot_size = (shm.size - self._data) // self.slots
+
+        # owner bookkeeping, by slot
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._refs = [0] * self.slots
+        self._reserved = [0] * self.slots
+        self._handles: list[dict[str, Any] | None] = [None] * self.slots
+        self.published = 0
+        self.overwritten = 0
+
+    @classmethod
+    def create(cls, slots: int, slot_size: int) -> "FrameRing":
+        slot_size = (slot_size + _ALIGN - 1) // _ALIGN * _ALIGN
+        shm = shared_memory.SharedMemory(
+            name=f"chimera_frames_{os.getpid()}_{next(_names)}",
+            create=True,
+            size=_header_size(slots) + slots * slot_size,
+        )
+        header = np.ndarray((1 + slots,), dtype=np.int64, buffer=shm.buf)
+        header[0] = slots
+        header[1:] = 0
+        del header
+        ring = cls(shm, owner=True)
+        with _attached_lock:
+            # the owner process maps it once too
+            _attached[ring.name] = ring
+        return ring
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    #
+    # owner side (the ImageServer)
+    #
+
+    def reserve(self, nbytes: int) -> dict[str, Any] | None:
+        """A slot for a new frame of nbytes: the oldest one nobody holds,
+        or the oldest of all when every one is held. Its previous frame is
+        invalid from now on. None if the frame does not fit in a slot."""
+        if nbytes > self.slot_size:
+            return None
+
+        with self._lock:
+            free = [slot for slot in range(self.slots) if not self._refs[slot]]
+            if not free:
+                # never wait for a slow consumer: it finds out with valid()
+                self.overwritten += 1
+                free = list(range(self.slots))
+            # the least recently reserved: a frame still being written by
+            # another camera is the newest, so it is taken last
+            slot = min(free, key=lambda slot: self._reserved[slot])
+
+            self._seq += 1
+            # 0 marks the slot being written: no handle matches it
+            self._seqs[slot] = 0
+            self._refs[slot] = 0
+            self._reserved[slot] = self._seq
+            self._handles[slot] = None
+
+            return {
+                "name": self.name,
+                "slot": slot,
+                "seq": self._seq,
+                "offset": self._data + slot * self.slot_size,
+            }
+
+    def publish(self, handle: dict[str, Any]) -> bool:
+        """Make a written frame visible. False if its slot was taken by a
+        newer frame before the writer finished."""
+        slot = handle["slot"]
+        with self._lock:
+            if (
+                handle["name"] != self.name
+                or self._reserved[slot] != handle["seq"]
+                or self._handles[slot]
+            ):
+                return False
+            self._seqs[slot] = handle["seq"]
+            self._handles[slot] = handle
+            self.published += 1
+            return True
+
+    def acquire(self, seq: int) -> dict[str, Any] | None:
+        """Take a reference to frame seq, keeping its slot out of reach of
+        new frames while any other slot is free. None if it is gone."""
+        with self._lock:
+            slot = self._slot(seq)
+            if slot is None:
+                return None
+            self._refs[slot] += 1
+            return self._handles[slot]
+
+    def release(self, seq: int) -> None:
+        with self._lock:
+            slot = self._slot(seq)
+            if slot is not None and self._refs[slot]:
+                self._refs[slot] -= 1
+
+    def latest(self) -> dict[str, Any] | None:
+        with self._lock:
+            handles = [handle for handle in self._handles if handle is not None]
+        return max(handles, key=lambda handle: handle["seq"], default=None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "slots": self.slots,
+                "slot_size": self.slot_size,
+                "published": self.published,
+                "overwritten": self.overwritten,
+                "references": sum(self._refs),
+            }
+
+    def _slot(self, seq: int) -> int | None:
+        for slot, handle in enumerate(self._handles):
+            if handle is not None and handle["seq"] == seq:
+                return slot
+        return None
+
+    #
+    # any process on the host
+    #
+
+    def write(self, handle: dict[str, Any], data: np.ndarray) -> dict[str, Any]:
+        """Copy data into the reserved slot; the handle, completed with the
+        frame layout, is what to publish."""
+        data = np.ascontiguousarray(data)
+        target = np.ndarray(
+            data.shape, dtype=data.dtype, buffer=self._shm.buf, offset=handle["offset"]
+        )
+        target[...] = data
+        return dict(handle, shape=list(data.shape), dtype=data.dtype.str)
+
+    def view(self, handle: dict[str, Any]) -> np.ndarray:
+        """The frame pixels, mapped read-only without copying. Check valid()
+        once done with them: a frame nobody holds can be overwritten."""
+        frame = np.ndarray(
+            tuple(handle["shape"]),
+            dtype=np.dtype(handle["dtype"]),
+            buffer=self._shm.buf,
+            offset=handle["offset"],
+        )
+        frame.flags.writeable = False
+        return frame
+
+    def valid(self, handle: dict[str, Any]) -> bool:
+        """Whether the slot still holds the frame of handle (never, once the
+        ring is closed)."""
+        seqs = self._seqs
+        return seqs is not None and int(seqs[handle["slot"]]) == handle["seq"]
+
+    def close(self) -> None:
+        """Unmap the segment (and remove it, on the owner). Views still
+        alive keep the mapping until they are garbage collected."""
+        # the last export of the buffer: the segment cannot close with it
+        self._seqs = None
+        try:
+            self._shm.close()
+        except BufferError:
+            log.debug(f"frame ring {self.name}: views still mapped")
+        with _attached_lock:
+            if _attached.get(self.name) is self:
+                del _attached[self.name]
+        if self.owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+_attached: dict[str, FrameRing] = {}
+_attached_lock = threading.Lock()
+
+
+def attach(name: str) -> FrameRing:
+    """The ring called name, mapped once per process. Raises
+    FileNotFoundError when it lives on another host (or is gone)."""
+    with _attached_lock:
+        ring = _attached.get(name)
+        if ring is None:
+            # not tracked: the owner alone removes the segment
+            shm = shared_memory.SharedMemory(name=name, track=False)
+            ring = _attached[name] = FrameRing(shm, owner=False)
+        return ring
+
+
+@contextmanager
+def mapped_frame(server: Any, handle: dict[str, Any]) -> Iterator[np.ndarray | None]:
+    """The pixels of a published frame for the duration of the block,
+    holding a reference to it on the image server (a proxy) so new frames
+    go to other slots while possible. Yields None if the frame is already
+    gone."""
+    if server.acquire_frame(handle["seq"]) is None:
+        yield None
+        return
+    try:
+        yield attach(handle["name"]).view(handle)
+    finally:
+        server.release_frame(handle["seq"])
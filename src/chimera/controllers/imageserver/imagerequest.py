@@ -112,7 +112,7 @@ class ImageRequest(dict):
 
         if self["wait_dome"]:
             dome = chimera_obj.get_proxy("/Dome/0")
-            if not dome.ping():
+            if not dome.exists():
                 log.info("No dome present, taking exposure without dome sync.")
                 return
             dome.sync_with_tel()
@@ -1,8 +1,12 @@
 import os
+import threading
 from collections import OrderedDict
+from typing import Any
 
+from chimera.controllers.imageserver.framering import FrameRing
 from chimera.controllers.imageserver.imageserverhttp import ImageServerHTTP
 from chimera.core.chimeraobject import ChimeraObject
+from chimera.core.event import event
 from chimera.util.image import Image
 
 
@@ -19,6 +23,13 @@ class ImageServer(ChimeraObject):
         "http_host": "default",
         "http_port": 7669,
         "max_images": 10,
+        # shared-memory ring handing frames to consumers on this host (see
+        # framering.py): slots * slot_size of /dev/shm (256 MiB as below),
+        # taken when the first frame comes. Frames bigger than a slot are
+        # not published
+        "frame_ring": False,
+        "frame_ring_slots": 4,
+        "frame_ring_slot_size": 64 * 1024 * 1024,
     }
 
     def __init__(self):
@@ -27,6 +38,11 @@ class ImageServer(ChimeraObject):
         self.images_by_id = OrderedDict()
         self.images_by_path = OrderedDict()
 
+        # created on first use: hosts without co-located cameras never
+        # allocate it
+        self._frames: FrameRing | None = None
+        self._frames_lock = threading.Lock()
+
     def __start__(self):
         if self["http_host"] == "default":
             self["http_host"] = self.__bus__.url.host
@@ -49,6 +65,11 @@ class ImageServer(ChimeraObject):
         for image in list(self.images_by_id.values()):
             self.unregister(image)
 
+        with self._frames_lock:
+            if self._frames is not None:
+                self._frames.close()
+                self._frames = None
+
     def _load_image_dir(self, dir):
         files_to_load = []
 
@@ -102,3 +123,65 @@ class ImageServer(ChimeraObject):
 
     def default_night_dir(self):
         return os.path.join(self["images_dir"], self["night_dir"])
+
+    #
+    # shared-memory frames
+    #
+
+    def _frame_ring(self) -> FrameRing | None:
+        if not self["frame_ring"]:
+            return None
+        with self._frames_lock:
+            if self._frames is None:
+                self._frames = FrameRing.create(
+                    self["frame_ring_slots"], self["frame_ring_slot_size"]
+                )
+            return self._frames
+
+    def get_frame_ring(self) -> str | None:
+        """The name of the shared-memory segment to attach to (see
+        framering.attach); None if frames are not shared."""
+        ring = self._frame_ring()
+        return ring.name if ring is not None else None
+
+    def reserve_frame(self, nbytes: int = 0) -> dict[str, Any] | None:
+        """A ring slot for a new frame of nbytes (see FrameRing.reserve);
+        None if the ring is disabled or the frame does not fit."""
+        ring = self._frame_ring()
+        return ring.reserve(nbytes) if ring is not None else None
+
+    def publish_frame(self, handle: dict[str, Any]) -> dict[str, Any] | None:
+        """Make a frame written to its reserved slot visible, and reserve
+        the slot for the writer's next one: a camera makes one call per
+        frame. The new reservation invalidates the oldest frame there.
+        None if the ring is disabled."""
+        ring = self._frame_ring()
+        if ring is None:
+            return None
+        if ring.publish(handle):
+            self.frame_ready(handle)
+        else:
+            self.log.debug(f"frame {handle['seq']} overwritten before publishing")
+        return ring.reserve(0)
+
+    def acquire_frame(self, seq: int) -> dict[str, Any] | None:
+        ring = self._frame_ring()
+        return ring.acquire(seq) if ring is not None else None
+
+    def release_frame(self, seq: int) -> None:
+        ring = self._frame_ring()
+        if ring is not None:
+            ring.release(seq)
+
+    def get_latest_frame(self) -> dict[str, Any] | None:
+        ring = self._frame_ring()
+        return ring.latest() if ring is not None else None
+
+    def get_frame_stats(self) -> dict[str, Any] | None:
+        with self._frames_lock:
+            return self._frames.stats() if self._frames is not None else None
+
+    @event
+    def frame_ready(self, handle: dict[str, Any]):
+        """A new frame is in the shared-memory ring: map it with
+        framering.mapped_frame(image_server, handle)."""
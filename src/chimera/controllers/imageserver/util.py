@@ -7,7 +7,7 @@ from chimera.core.exceptions import (
 def get_image_server(chimera_object) -> ImageServer:
     try:
         imgsrv = chimera_object.get_proxy("/ImageServer/0")
-        if not imgsrv.ping():
+        if not imgsrv.exists():
             return None
     except Exception:
         return None
@@ -1 +1,13 @@
-from chimera.controllers.scheduler.controller import Scheduler as Scheduler
+# the controller pulls in the whole scheduler (and its database): imported
+# on first use, so chimera-sched can use states and status alone
+def __getattr__(name):
+    if name == "Scheduler":
+        from chimera.controllers.scheduler.controller import Scheduler
+
+        # kept: the ClassLoader looks for it in the module dict
+        globals()["Scheduler"] = Scheduler
+        return Scheduler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["Scheduler"]
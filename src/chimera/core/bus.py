@@ -1,21 +1,46 @@
+import bisect
+import collections
 import enum
+import heapq
+import itertools
 import logging
 import os
 import queue
 import selectors
 import threading
 import time
-from collections.abc import Callable
-from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import (
+    CancelledError,
+    Future,
+    InvalidStateError,
+    ThreadPoolExecutor,
+)
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from typing import Any, NamedTuple
 
 import msgspec
 
-from chimera.core.constants import LOCK_ATTRIBUTE_NAME, MANAGER_LOCATION
+from chimera.core import tracing
+from chimera.core.cached import ResultCache
+from chimera.core.codec import CODECS, JSON, Codec, check, detect, negotiate
+from chimera.core.constants import (
+    CACHED_METHODS_ATTRIBUTE_NAME,
+    CONFIG_CHANGED_EVENT_NAME,
+    LOCK_ATTRIBUTE_NAME,
+    MANAGER_LOCATION,
+    STREAM_METHODS_ATTRIBUTE_NAME,
+    URGENT_ATTRIBUTE_NAME,
+)
 from chimera.core.exceptions import BusDeadException, RequestTimeoutException
+from chimera.core.metrics import Metrics
 from chimera.core.protocol import (
+    Batch,
+    BatchResponse,
+    Credit,
     Event,
+    EventFilter,
     Messages,
     Ping,
     Pong,
@@ -24,6 +49,7 @@ from chimera.core.protocol import (
     Request,
     Response,
     Subscribe,
+    TraceContext,
     Unsubscribe,
 )
 from chimera.core.transport import SendResult, Transport
@@ -38,14 +64,17 @@ _MAX_MISSED_PONGS = 3
 
 class PushResult(enum.StrEnum):
     """Outcome of Bus._push. Truthiness answers "may the caller still expect
-    delivery-or-timeout semantics?": OK and DROPPED (backpressure — the peer
-    is alive, a caller timeout covers the loss) are truthy; the definitive
-    failures are falsy, so `if not self._push(...)` reads as before."""
+    delivery-or-timeout semantics?": OK (sent, or queued for the peer) and
+    DROPPED (an event lost to backpressure — the peer is alive) are truthy;
+    the definitive failures, including a request rejected by a full peer
+    queue, are falsy, so `if not self._push(...)` reads as before."""
 
     OK = "ok"
-    # send buffer still full after retries: message dropped, peer alive
+    # peer send queue full: event dropped, peer alive
     DROPPED = "dropped"
-    # the message payload cannot be JSON-encoded for the wire
+    # peer send queue full: request (or reply) refused instead of queued
+    REJECTED = "rejected"
+    # the message payload cannot be encoded for the wire
     ENCODE_FAILED = "encode_failed"
     # could not create a transport to the destination bus
     NO_PEER = "no_peer"
@@ -81,6 +110,13 @@ def pool_stats(pool: ThreadPoolExecutor) -> dict[str, Any]:
 type PublisherId = str
 type SubscriberId = URL
 
+# where a request's Response goes: straight to the wire (Bus._push) or into
+# the batch it belongs to
+type Reply = Callable[[Response], PushResult]
+
+# one call in a request_many batch: (dst, method, args, kwargs)
+type Call = tuple[str | URL, str, list[Any], dict[str, Any]]
+
 
 class CallbackId:
     @classmethod
@@ -103,9 +139,125 @@ class Subscriber:
     callback: int
 
 
+class _EventGate:
+    """Publisher-side state of one filtered subscription: the EventFilter
+    plus what min_delta/min_interval compare against (the last event let
+    through). Only used under the bus pubsub lock."""
+
+    def __init__(self, filter: EventFilter):
+        self.filter = filter
+        self._last_value: Any = None
+        self._last_ts: float | None = None
+        # events this subscription did not receive
+        self.filtered = 0
+
+    def accepts(self, args: list[Any], kwargs: dict[str, Any], now: float) -> bool:
+        if self._matches(args, kwargs, now):
+            return True
+        self.filtered += 1
+        return False
+
+    def _matches(self, args: list[Any], kwargs: dict[str, Any], now: float) -> bool:
+        f = self.filter
+        if (
+            f.min_interval is not None
+            and self._last_ts is not None
+            and now - self._last_ts < f.min_interval
+        ):
+            return False
+
+        value = None
+        if f.arg is not None:
+            try:
+                value = f.value(args, kwargs)
+                if f.equals is not msgspec.UNSET and value != f.equals:
+                    return False
+                if f.above is not None and not value > f.above:
+                    return False
+                if f.below is not None and not value < f.below:
+                    return False
+                if (
+                    f.min_delta is not None
+                    and self._last_value is not None
+                    and abs(value - self._last_value) < f.min_delta
+                ):
+                    return False
+            except (LookupError, TypeError):
+                # the event does not carry the value the filter looks at
+                return False
+
+        self._last_value = value
+        self._last_ts = now
+        return True
+
+
+class _Conflator:
+    """Latest-value delivery for one subscription: a burst of events
+    collapses into the newest pending payload, and the callback runs at
+    most once at a time. However fast the publisher, one slot of memory
+    and at most one pool task per subscriber."""
+
+    def __init__(self, callable: Callable[..., None]):
+        self.callable = callable
+        self._lock = threading.Lock()
+        self._pending: Event | None = None
+        self._running = False
+        # payloads replaced by a newer one before delivery
+        self.coalesced = 0
+
+    def offer(self, event: Event, submit: Callable[..., Future[Any]]) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = event
+            if self._running:
+                # the running drain picks the new payload up when it is done
+                return
+            self._running = True
+        try:
+            submit(self._drain)
+        except RuntimeError:
+            # pool shut down: the bus is going away
+            with self._lock:
+                self._running = False
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                event = self._pending
+                self._pending = None
+                if event is None:
+                    self._running = False
+                    return
+            try:
+                tracing.run(
+                    event.trace,
+                    event.event,
+                    "event",
+                    self.callable,
+                    *event.args,
+                    **event.kwargs,
+                )
+            except Exception:
+                log.exception(f"error in event handler: {event.event}")
+
+
 class Callback(NamedTuple):
     id: int
     callable: Callable[..., None]
+    # set for conflated (latest-value) subscriptions
+    conflator: _Conflator | None = None
+
+
+class Dispatch(NamedTuple):
+    """A resolved method with its routing precomputed: what an object's
+    dispatch table holds (see ChimeraObject.__dispatch_table__).
+    resolve_request may return one instead of a bare callable."""
+
+    callable: Callable[..., Any]
+    locked: bool = False
+    urgent: bool = False
+    event: bool = False
 
 
 def _is_locked_method(method: Callable[..., Any]) -> bool:
@@ -117,30 +269,218 @@ def _is_locked_method(method: Callable[..., Any]) -> bool:
     return getattr(func, LOCK_ATTRIBUTE_NAME, False) is True
 
 
+def _advertised(method: Callable[..., Any], attribute: str) -> list[str] | None:
+    """Names the object a resolved method belongs to lists in attribute
+    (its @cached or generator methods)."""
+    # a bound method, a chimera MethodWrapperDispatcher, or a ProxyMethod
+    # relaying to an isolated object (see chimera.core.worker)
+    instance = (
+        getattr(method, "__self__", None)
+        or getattr(method, "instance", None)
+        or getattr(method, "proxy", None)
+    )
+    return getattr(instance, attribute, None)
+
+
+def _is_urgent_method(method: Callable[..., Any]) -> bool:
+    """@urgent (locked) methods jump ahead in their object's lane."""
+    func = getattr(method, "func", method)
+    return getattr(func, URGENT_ATTRIBUTE_NAME, False) is True
+
+
 class _Peer:
-    """One outbound connection: its own transport, its own lock and its own
-    health state — a slow or black-holed peer stalls only its own senders,
-    never traffic to healthy peers."""
+    """One outbound connection: its own transport, its own lock, its own
+    send queue and its own health state — a slow or black-holed peer stalls
+    only its own senders, never traffic to healthy peers.
+
+    Senders never wait on backpressure: when nng cannot take a message it
+    goes to the bounded queue (drained by the bus _Writer), and when that is
+    full too, events make room by dropping the oldest queued event while
+    anything else is rejected back to the caller.
 
-    def __init__(self, transport: Transport):
+    Large replies take a second link to the same peer, the bulk link (see
+    Bus._send_bulk), with a queue of its own drained after the control
+    one."""
+
+    def __init__(self, transport: Transport, queue_size: int = 4096):
         self.transport = transport
         self.lock = threading.Lock()
         self.missed_pongs = 0
+        # (frame, droppable) in send order; guarded by lock
+        self.queue: collections.deque[tuple[bytes, bool]] = collections.deque()
+        self.queue_size = queue_size
+        self.high_water = 0
+        self.dropped = 0
+        self.rejected = 0
+        # monotonic time of the last message sent (health pings excluded):
+        # what idle reaping and the LRU cap go by
+        self.last_used = time.monotonic()
+        # closed by the reaper: a sender racing it dials again
+        self.reaped = False
+        self.closed = False
+        # dialed on the first large reply; guarded by lock
+        self.bulk: Transport | None = None
+        self.bulk_queue: collections.deque[bytes] = collections.deque()
+        self.bulk_sent = 0
+
+    def enqueue(self, data: bytes, droppable: bool) -> "PushResult":
+        """Queue a frame nng could not take (call with lock held)."""
+        if len(self.queue) >= self.queue_size:
+            if not droppable:
+                self.rejected += 1
+                return PushResult.REJECTED
+
+            # events are only worth their latest values: make room by
+            # dropping the oldest queued event, never a request or reply
+            oldest = next(
+                (index for index, (_, dropme) in enumerate(self.queue) if dropme),
+                None,
+            )
+            self.dropped += 1
+            if oldest is None:
+                return PushResult.DROPPED
+            del self.queue[oldest]
+
+        self.queue.append((data, droppable))
+        self.high_water = max(self.high_water, len(self.queue))
+        return PushResult.OK
+
+    def drain(self) -> bool:
+        """Send queued frames until nng pushes back, control frames first.
+        True once both queues are empty. Frames the transport reports dead
+        are dropped: the peer is gone or going, and eviction cleans up
+        after it."""
+        with self.lock:
+            while self.queue:
+                data, _ = self.queue[0]
+                result = self.transport.send(data)
+                if result is SendResult.AGAIN:
+                    return False
+                self.queue.popleft()
+                if result is SendResult.DEAD:
+                    self.dropped += 1
+
+            while self.bulk_queue:
+                if self.bulk is None:
+                    # closed: nothing will ever take them
+                    self.dropped += len(self.bulk_queue)
+                    self.bulk_queue.clear()
+                    break
+                result = self.bulk.send(self.bulk_queue[0])
+                if result is SendResult.AGAIN:
+                    return False
+                self.bulk_queue.popleft()
+                if result is SendResult.DEAD:
+                    self.dropped += 1
+                else:
+                    self.bulk_sent += 1
+            return True
+
+    def pending(self) -> bool:
+        """Whether frames are queued (call with lock held)."""
+        return bool(self.queue or self.bulk_queue)
+
+    def send_fds(self) -> list[int]:
+        return [
+            transport.send_fd()
+            for transport in (self.transport, self.bulk)
+            if transport is not None
+        ]
+
+    def close(self) -> None:
+        """Close both links (call with lock held)."""
+        self.closed = True
+        self.transport.close()
+        if self.bulk is not None:
+            self.bulk.close()
+            self.bulk = None
+
+
+class _Route(NamedTuple):
+    """How a request was routed, for its stage timings: the resource that
+    handles it, when it left the dispatch thread and what it waits on
+    (pool_wait, lane_wait or urgent_wait) before it runs. deadline is the local
+    time.monotonic() after which the caller has given up on it."""
+
+    resource: str
+    at: float
+    wait: str
+    deadline: float | None = None
+
+
+type _LaneItem = tuple[Request, Callable[..., Any], Reply, _Route] | None
+
+
+class _LaneQueue(queue.Queue[_LaneItem]):
+    """A bounded FIFO with a fast lane: put_urgent items come out before
+    every normal one (FIFO among themselves) and never block or fail."""
+
+    def _init(self, maxsize: int) -> None:
+        super()._init(maxsize)
+        self.urgent: collections.deque[_LaneItem] = collections.deque()
+
+    def _qsize(self) -> int:
+        return len(self.queue) + len(self.urgent)
+
+    def _get(self) -> _LaneItem:
+        if self.urgent:
+            return self.urgent.popleft()
+        return super()._get()
+
+    def put_urgent(self, item: _LaneItem) -> None:
+        with self.not_full:
+            self.urgent.append(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
 
 
 class _ObjectLane:
     """A per-object FIFO for @lock methods: one worker thread executes them
-    one at a time, in arrival order. A hung method stacks bounded queue
-    entries here instead of pool workers."""
+    one at a time, in arrival order (@urgent ones first). A hung method
+    stacks bounded queue entries here instead of pool workers."""
 
     def __init__(self, maxsize: int):
-        self.queue: queue.Queue[tuple[Request, Callable[..., Any]] | None] = (
-            queue.Queue(maxsize=maxsize)
-        )
+        self.queue = _LaneQueue(maxsize=maxsize)
         self.closed = False
         self.thread: threading.Thread | None = None
 
 
+class _BatchCollector:
+    """Gathers the responses of one Batch. Each request is routed on its own
+    (lane or pool, exactly like a single request); the last one to answer
+    sends the combined BatchResponse."""
+
+    def __init__(self, batch: Batch, push: Callable[[Messages], PushResult]):
+        self._batch = batch
+        self._push = push
+        self._slots = {
+            request.id: index for index, request in enumerate(batch.requests)
+        }
+        self._responses: list[Response | None] = [None] * len(batch.requests)
+        self._pending = len(batch.requests)
+        self._lock = threading.Lock()
+
+    def reply(self, response: Response) -> PushResult:
+        # checked one by one: an unencodable result must fail its own slot,
+        # not the whole batch on the wire
+        try:
+            check(response)
+        except Exception:
+            log.exception(f"bus: serialization issue in batch: {response}")
+            return PushResult.ENCODE_FAILED
+
+        with self._lock:
+            index = self._slots.get(response.id)
+            if index is None or self._responses[index] is not None:
+                return PushResult.OK
+            self._responses[index] = response
+            self._pending -= 1
+            if self._pending:
+                return PushResult.OK
+
+        return self._push(self._batch.ok([r for r in self._responses if r is not None]))
+
+
 class _Mailbox:
     """A single-waiter reply box for one in-flight request/ping."""
 
@@ -158,6 +498,398 @@ class _Mailbox:
         self._queue.put(message)
 
 
+class _FutureMailbox(_Mailbox):
+    """A reply box that resolves a Future instead of parking a waiter thread.
+    Resolution is handed to `run` (the handler pool): done-callbacks are
+    user code and must never run on the selector or dispatch threads."""
+
+    # delivered at most once: _Mailboxes drops it on delivery
+    one_shot = True
+
+    def __init__(
+        self,
+        dst_bus: str,
+        future: Future[Response],
+        what: str,
+        run: Callable[[Callable[[], None]], None],
+    ):
+        super().__init__(dst_bus)
+        self.future = future
+        self._what = what
+        self._run = run
+
+    def put(self, message: Messages | None) -> None:
+        if isinstance(message, Response):
+            self._run(lambda: self._resolve(result=message))
+        else:
+            self._run(
+                lambda: self._resolve(
+                    error=BusDeadException(f"bus died while waiting for {self._what}")
+                )
+            )
+
+    def expire(self, timeout: float) -> None:
+        self._run(
+            lambda: self._resolve(
+                error=RequestTimeoutException(
+                    f"no response for {self._what} after {timeout}s"
+                )
+            )
+        )
+
+    def _resolve(
+        self, result: Response | None = None, error: Exception | None = None
+    ) -> None:
+        # a response, expire() and a dead peer can each resolve it, on
+        # different pool threads, and the caller may have cancelled it: the
+        # first one wins
+        try:
+            if error is not None:
+                self.future.set_exception(error)
+            else:
+                self.future.set_result(result)
+        except InvalidStateError:
+            pass
+
+
+class _Stream:
+    """Server side of a streamed result: the credit its caller granted."""
+
+    def __init__(self, credit: int):
+        self._cond = threading.Condition()
+        self._credit = credit
+        self.cancelled = False
+
+    def grant(self, credit: int) -> None:
+        with self._cond:
+            self._credit += credit
+            self._cond.notify()
+
+    def cancel(self) -> None:
+        with self._cond:
+            self.cancelled = True
+            self._cond.notify()
+
+    def acquire(self) -> bool:
+        """Wait for credit to send one more item; False once cancelled."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._credit > 0 or self.cancelled)
+            if self.cancelled:
+                return False
+            self._credit -= 1
+            return True
+
+
+class ResponseStream:
+    """Caller side of a streamed result (see Bus.request_stream): iterates
+    the item Responses as they arrive, granting the server more credit as
+    they are consumed. The final Response ends the iteration; an error is
+    yielded first, for the caller to raise. Closing the stream before its
+    end (or leaving a `with` block) cancels the remote generator."""
+
+    def __init__(
+        self,
+        bus: "Bus",
+        request: Request,
+        mailbox: _Mailbox,
+        timeout: float | None,
+    ):
+        assert request.window is not None
+        self._bus = bus
+        self._request = request
+        self._mailbox = mailbox
+        self._timeout = timeout
+        # top the window up once half of it was consumed: one Credit per
+        # window/2 items keeps the server busy without a message per item
+        self._refill = max(1, request.window // 2)
+        self._consumed = 0
+        self._done = False
+
+    def __iter__(self) -> "ResponseStream":
+        return self
+
+    def __next__(self) -> Response:
+        if self._done:
+            raise StopIteration
+
+        if self._consumed >= self._refill:
+            self._bus._push(
+                Protocol.credit(request=self._request, credit=self._consumed)
+            )
+            self._consumed = 0
+
+        try:
+            response = self._mailbox.get(timeout=self._timeout)
+        except queue.Empty:
+            self.close()
+            raise RequestTimeoutException(
+                f"no item from {self._request.method} on {self._request.dst} "
+                f"after {self._timeout}s"
+            ) from None
+
+        if response is None or not isinstance(response, Response):
+            self._finish()
+            raise BusDeadException(
+                f"bus died while streaming {self._request.method} "
+                f"from {self._request.dst}"
+            )
+
+        if response.more:
+            self._consumed += 1
+            return response
+
+        self._finish()
+        if response.code != 200:
+            return response
+        raise StopIteration
+
+    def close(self) -> None:
+        if self._done:
+            return
+        self._finish()
+        self._bus._push(Protocol.credit(request=self._request, cancel=True))
+
+    def _finish(self) -> None:
+        self._done = True
+        self._bus._mailboxes.unregister(self._request.id)
+
+    def __enter__(self) -> "ResponseStream":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class _Writer:
+    """Drains peer send queues from a single, lazily started thread. It
+    sleeps on the backlogged peers' nng send fds (readable when the socket
+    can take a message again), so queued frames move as soon as there is
+    room, without any sender ever sleeping on backpressure."""
+
+    # also retry this often: transports without a send fd, and a guard
+    # against a missed readiness edge
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, name: str):
+        self._name = name
+        self._lock = threading.Lock()
+        self._backlog: set[_Peer] = set()
+        self._closed = False
+        # set while the thread runs; guarded by lock
+        self._thread: threading.Thread | None = None
+        self._waker_r, self._waker_w = os.pipe()
+        # written under the lock: never block there on a full pipe (one
+        # pending byte wakes the thread as well as many)
+        os.set_blocking(self._waker_w, False)
+
+    def wake(self, peer: _Peer) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._backlog.add(peer)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._wake_thread()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._backlog.clear()
+            thread = self._thread
+            if thread is None:
+                self._close_pipe()
+            else:
+                # closed by the thread on its way out: a send stuck past
+                # the join below must not find its fds reused
+                self._wake_thread()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1)
+
+    def _wake_thread(self) -> None:
+        # call with the lock held, pipe still open
+        try:
+            os.write(self._waker_w, b"\0")
+        except OSError:
+            pass
+
+    def _close_pipe(self) -> None:
+        os.close(self._waker_r)
+        os.close(self._waker_w)
+
+    def _run(self) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(self._waker_r, selectors.EVENT_READ)
+        watched: dict[int, _Peer] = {}
+        try:
+            while True:
+                with self._lock:
+                    if self._closed:
+                        return
+                    backlog = list(self._backlog)
+
+                for peer in backlog:
+                    if peer.drain():
+                        with self._lock:
+                            # a sender may have queued again since drain()
+                            if not peer.pending():
+                                self._backlog.discard(peer)
+
+                # (re)watch the fds of whoever is still backlogged; a closed
+                # transport has no fd and is simply retried until dropped
+                with self._lock:
+                    backlog = list(self._backlog)
+                fds = {}
+                for peer in backlog:
+                    for fd in peer.send_fds():
+                        if isinstance(fd, int) and fd >= 0:
+                            fds[fd] = peer
+                for fd in watched.keys() - fds.keys():
+                    selector.unregister(fd)
+                for fd in fds.keys() - watched.keys():
+                    selector.register(fd, selectors.EVENT_READ)
+                watched = fds
+
+                for key, _ in selector.select(
+                    timeout=self.POLL_INTERVAL if backlog else None
+                ):
+                    if key.fd == self._waker_r:
+                        os.read(self._waker_r, 4096)
+        except Exception:
+            log.exception("bus: peer writer failed")
+        finally:
+            selector.close()
+            with self._lock:
+                # after a failure, the next wake() starts another thread
+                self._thread = None
+                if self._closed:
+                    self._close_pipe()
+
+
+class _Deadlines:
+    """Runs callbacks at their deadlines from a single, lazily started
+    thread: how future-based requests time out without a thread each."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._heap: list[tuple[float, int, Callable[[], None]]] = []
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def add(self, delay: float, callback: Callable[[], None]) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            heapq.heappush(
+                self._heap, (time.monotonic() + delay, next(self._order), callback)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._heap.clear()
+            self._cond.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        _, _, callback = heapq.heappop(self._heap)
+                        break
+                    self._cond.wait(delay)
+            try:
+                callback()
+            except Exception:
+                log.exception("bus: deadline callback failed")
+
+
+class Resolution(NamedTuple):
+    """What an object URL resolved to: the object's own URL, its @cached and
+    its generator methods."""
+
+    url: str
+    cached: frozenset[str] = frozenset()
+    streams: frozenset[str] = frozenset()
+
+
+def _resolution(pong: Pong) -> Resolution | None:
+    if not pong.ok or not pong.resolved_url:
+        return None
+    return Resolution(
+        pong.resolved_url, frozenset(pong.cached or ()), frozenset(pong.streams or ())
+    )
+
+
+class _Resolution(NamedTuple):
+    bus: str
+    resolved: Resolution | None
+    expires: float
+
+
+class _ResolutionCache:
+    """What object URLs resolved to (None: nothing answers there), each
+    answer good until it expires. Found objects rarely move, misses are
+    kept briefly: an instrument may show up any moment."""
+
+    def __init__(self, ttl: float, negative_ttl: float):
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._entries: dict[str, _Resolution] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> tuple[bool, Resolution | None]:
+        """(hit, resolution): a hit with None is a cached miss."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return False, None
+            if entry.expires <= time.monotonic():
+                del self._entries[url]
+                return False, None
+            return True, entry.resolved
+
+    def put(self, url: str, bus: str, resolved: Resolution | None) -> None:
+        ttl = self._ttl if resolved is not None else self._negative_ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[url] = _Resolution(bus, resolved, time.monotonic() + ttl)
+
+    def invalidate(self, bus: str) -> None:
+        """Forget every answer about objects on bus."""
+        with self._lock:
+            for url in [url for url, e in self._entries.items() if e.bus == bus]:
+                del self._entries[url]
+
+    def stats(self) -> dict[str, int]:
+        now = time.monotonic()
+        with self._lock:
+            live = [e for e in self._entries.values() if e.expires > now]
+        found = sum(1 for e in live if e.resolved is not None)
+        return {"found": found, "missing": len(live) - found}
+
+
 class _Mailboxes:
     """Reply mailboxes keyed by request id.
 
@@ -173,8 +905,11 @@ class _Mailboxes:
         self._lock = threading.Lock()
         self._closed = False
 
-    def register(self, key: int, dst_bus: str) -> _Mailbox:
-        mailbox = _Mailbox(dst_bus)
+    def register(
+        self, key: int, dst_bus: str, mailbox: _Mailbox | None = None
+    ) -> _Mailbox:
+        if mailbox is None:
+            mailbox = _Mailbox(dst_bus)
         with self._lock:
             if self._closed:
                 # bus is dead: the waiter wakes immediately with None
@@ -190,11 +925,23 @@ class _Mailboxes:
     def deliver(self, key: int, message: Messages) -> bool:
         with self._lock:
             mailbox = self._boxes.get(key)
+            if getattr(mailbox, "one_shot", False):
+                # nobody will unregister it: its reader is a Future
+                del self._boxes[key]
         if mailbox is None:
             return False
         mailbox.put(message)
         return True
 
+    def expire(self, key: int, timeout: float) -> None:
+        """Time out a future-based request that is still pending."""
+        with self._lock:
+            mailbox = self._boxes.get(key)
+            if not isinstance(mailbox, _FutureMailbox):
+                return
+            del self._boxes[key]
+        mailbox.expire(timeout)
+
     def stats(self) -> list[dict[str, Any]]:
         """Pending mailboxes as JSON-safe entries, ages in seconds."""
         now = time.monotonic()
@@ -204,11 +951,16 @@ class _Mailboxes:
                 for key, box in self._boxes.items()
             ]
 
-    def fail_peer(self, dst_bus: str) -> None:
-        """Wake every request pending on dst_bus with None: the peer is gone
-        and its replies will never arrive."""
+    def fail_peer(self, dst_bus: str, before: float | None = None) -> None:
+        """Wake every request pending on dst_bus (registered before the
+        given time) with None: the peer is gone and its replies will never
+        arrive."""
         with self._lock:
-            keys = [key for key, box in self._boxes.items() if box.dst_bus == dst_bus]
+            keys = [
+                key
+                for key, box in self._boxes.items()
+                if box.dst_bus == dst_bus and (before is None or box.created < before)
+            ]
             boxes = [self._boxes.pop(key) for key in keys]
         for mailbox in boxes:
             mailbox.put(None)
@@ -233,9 +985,34 @@ class Bus:
         lane_idle_timeout: float = 60.0,
         health_interval: float = 30.0,
         health_timeout: float = 2.0,
+        codecs: tuple[str, ...] = ("msgpack", "json"),
+        peer_idle_timeout: float | None = 300.0,
+        max_peers: int | None = 256,
+        peer_queue_size: int = 4096,
+        bulk_threshold: int | None = 256 * 1024,
+        resolve_ttl: float = 60.0,
+        negative_resolve_ttl: float = 10.0,
     ):
         self.url = create_url(url, cls="Bus")
 
+        # bound first: on tcp port 0 the address (and so every thread name
+        # below) is only known once listening
+        self._inbound: Transport = create_transport(self.url.bus)
+        self._inbound.bind()
+        if self._inbound.url != self.url.bus:
+            self.url = create_url(self._inbound.url, cls="Bus", name=self.url.name)
+
+        # in thread names, telling this bus's threads from other buses' in
+        # the process: the tcp port, or the inproc name / ipc path (their
+        # port is always 0)
+        self._tag = str(self.url.port) if self.url.port else self.url.host
+
+        # wire codecs we offer to peers, in preference order. JSON is always
+        # kept as the last resort: peers that predate negotiation speak it
+        self._codecs = [name for name in codecs if name in CODECS]
+        if JSON.name not in self._codecs:
+            self._codecs.append(JSON.name)
+
         # tiered dispatch: requests and event callbacks (arbitrary user code,
         # can block) run on the bounded handler pool; pings and publish
         # fan-out (small, framework-only work that still touches sockets) run
@@ -243,11 +1020,11 @@ class Bus:
         # liveness checks or event distribution
         self._handler_pool = ThreadPoolExecutor(
             max_workers=handler_pool_size,
-            thread_name_prefix=f"chimera-bus-handler-{self.url.port}",
+            thread_name_prefix=f"chimera-bus-handler-{self._tag}",
         )
         self._control_pool = ThreadPoolExecutor(
             max_workers=control_pool_size,
-            thread_name_prefix=f"chimera-bus-control-{self.url.port}",
+            thread_name_prefix=f"chimera-bus-control-{self._tag}",
         )
 
         self._running = threading.Event()
@@ -269,17 +1046,37 @@ class Bus:
         self._lane_queue_size = lane_queue_size
         self._lane_idle_timeout = lane_idle_timeout
 
+        # requests dropped unexecuted because their caller had timed out
+        self._expired = 0
+        self._expired_lock = threading.Lock()
+
+        # streamed results being sent, by (caller bus, request id)
+        self._streams: dict[tuple[str, int], _Stream] = {}
+        self._streams_lock = threading.Lock()
+
         # inbound messages to be dispatched by _process_queue
         self._inbox: queue.SimpleQueue[Messages | None] = queue.SimpleQueue()
 
         # reply mailboxes for in-flight requests/pings, keyed by request id
         self._mailboxes = _Mailboxes()
 
+        # timeouts of future-based requests (submit_request)
+        self._deadlines = _Deadlines(f"chimera-bus-deadlines-{self._tag}")
+
         # callbacks represent the subscriber-side of the pubsub model, where we can have references to the callbacks
         self._callbacks: dict[EventId, dict[Subscriber, Callback]] = {}
 
-        # subscribers represent the publisher-side of the pubsub model, where we don't have references to the callbacks
-        self._subscribers: dict[EventId, set[Subscriber]] = {}
+        # subscribers represent the publisher-side of the pubsub model, where we don't have references to the callbacks,
+        # each with its filter gate (None when the subscriber wants every event)
+        self._subscribers: dict[EventId, dict[Subscriber, _EventGate | None]] = {}
+
+        # the latest events of publishers that keep a history (@event
+        # history), replayed to subscribers asking for it
+        self._history: dict[EventId, collections.deque[Publish]] = {}
+
+        # subscribers still being sent their replay: live events wait here,
+        # so they arrive after it
+        self._replaying: dict[Subscriber, list[Publish]] = {}
 
         # client-side map from what the user subscribed to the wire token,
         # keyed by (pub, event): unsubscribe finds the entry by callable
@@ -291,21 +1088,50 @@ class Bus:
 
         self._pubsub_lock = threading.Lock()
 
-        self._inbound: Transport = create_transport(self.url.bus)
-        self._inbound.bind()
-
         # outbound peers, one connection each; the map lock guards only the
         # map — dialing and sending happen under each peer's own lock
         self._peers: dict[str, _Peer] = {}
         self._peers_lock = threading.Lock()
 
+        # outbound connection policy: links unused for peer_idle_timeout are
+        # closed (checked every health_interval), and beyond max_peers the
+        # least recently used one goes. Short-lived clients (every CLI run
+        # is a new bus) would otherwise leave an fd and nng pipe behind each
+        self._peer_idle_timeout = peer_idle_timeout
+        self._max_peers = max(1, max_peers) if max_peers is not None else None
+
+        # frames nng could not take right away wait in each peer's bounded
+        # queue (sized to absorb event bursts of a few thousand without
+        # dropping); one writer thread drains them all
+        self._peer_queue_size = peer_queue_size
+        self._writer = _Writer(f"chimera-bus-writer-{self._tag}")
+
+        # encoded replies at least this big (catalogs, arrays) go through
+        # the peer's bulk link, never in front of control messages; None
+        # sends everything over the control link
+        self._bulk_threshold = bulk_threshold
+
+        # proxy resolution answers (resolve()), shared by every proxy on this
+        # bus; a peer's entries go when its link is evicted or reaped
+        self._resolutions = _ResolutionCache(resolve_ttl, negative_resolve_ttl)
+
+        # memoized results of @cached methods, by object URL, each dropped
+        # when its object publishes a config change (see result_cache())
+        self._result_caches: dict[str, ResultCache] = {}
+        self._result_caches_lock = threading.Lock()
+
+        # per stage, object and method latency histograms (see STAGES)
+        self.metrics = Metrics()
+
         # health check: the backstop for silent partitions that never emit a
         # pipe-removal event (no FIN/RST — pipe eviction cannot see those)
         self._health_interval = health_interval
         self._health_timeout = health_timeout
 
-        self._encoder = msgspec.json.Encoder()
-        self._decoder = msgspec.json.Decoder(Messages)
+        # codec agreed with each peer bus during ping/pong, keyed by bus
+        # address. Kept apart from _peers: the answering side learns the
+        # codec before it has dialed back. Unknown peers get JSON.
+        self._peer_codecs: dict[str, Codec] = {}
 
     def _wake_selector(self) -> None:
         try:
@@ -326,6 +1152,8 @@ class Bus:
         self._wake_selector()
         self._mailboxes.close_all()
         self._inbox.put(None)
+        # generator methods waiting for credit would hold their workers
+        self._cancel_streams()
 
         if self._bus_started.is_set():
             # the selector-loop thread owns teardown on its way out; wait for
@@ -355,6 +1183,7 @@ class Bus:
         self._running.clear()
         self._mailboxes.close_all()
         self._inbox.put(None)
+        self._cancel_streams()
 
         dispatch = getattr(self, "_dispatch_thread", None)
         if dispatch is not None and dispatch is not threading.current_thread():
@@ -364,6 +1193,9 @@ class Bus:
         if health is not None and health is not threading.current_thread():
             health.join(timeout=5)
 
+        self._deadlines.close()
+        self._writer.close()
+
         # stop the lanes: a sentinel wakes each worker; short join only —
         # they are daemon threads, so a truly hung instrument method cannot
         # block the interpreter from exiting
@@ -403,10 +1235,11 @@ class Bus:
         # snapshot under the lock: a concurrent peer eviction may still
         # mutate the map while we tear down
         with self._peers_lock:
-            outbound = [peer.transport for peer in self._peers.values()]
+            outbound = list(self._peers.values())
             self._peers.clear()
-        for socket in outbound:
-            socket.close()
+        for peer in outbound:
+            with peer.lock:
+                peer.close()
 
         self._teardown_finished.set()
 
@@ -431,26 +1264,50 @@ class Bus:
                     "publisher": event_id.publisher,
                     "event": event_id.event,
                     "subscribers": len(subs),
+                    "filtered": sum(gate.filtered for gate in subs.values() if gate),
                 }
                 for event_id, subs in self._subscribers.items()
             ]
+            history = {
+                f"{event_id.publisher}.{event_id.event}": len(events)
+                for event_id, events in self._history.items()
+            }
             callbacks = [
                 {
                     "publisher": event_id.publisher,
                     "event": event_id.event,
                     "callbacks": len(cbs),
+                    "coalesced": sum(
+                        cb.conflator.coalesced for cb in cbs.values() if cb.conflator
+                    ),
                 }
                 for event_id, cbs in self._callbacks.items()
             ]
 
+        now = time.monotonic()
         with self._peers_lock:
-            peers = list(self._peers.keys())
+            peers = [
+                {
+                    "bus": bus,
+                    "idle": now - peer.last_used,
+                    "missed_pongs": peer.missed_pongs,
+                    "queued": len(peer.queue),
+                    "high_water": peer.high_water,
+                    "dropped": peer.dropped,
+                    "rejected": peer.rejected,
+                    "bulk_queued": len(peer.bulk_queue),
+                    "bulk_sent": peer.bulk_sent,
+                }
+                for bus, peer in self._peers.items()
+            ]
+            codecs = {bus: codec.name for bus, codec in self._peer_codecs.items()}
 
         with self._lanes_lock:
             lanes = [
                 {
                     "path": path,
                     "queued": lane.queue.qsize(),
+                    "urgent": len(lane.queue.urgent),
                     "alive": lane.thread.is_alive() if lane.thread else False,
                     "id": lane.thread.native_id if lane.thread else None,
                 }
@@ -466,11 +1323,19 @@ class Bus:
             "inbox_size": self._inbox.qsize(),
             "mailboxes": self._mailboxes.stats(),
             "peers": peers,
+            "codecs": codecs,
+            "resolutions": self._resolutions.stats(),
+            "result_caches": {
+                url: len(cache) for url, cache in list(self._result_caches.items())
+            },
             "subscribers": subscribers,
+            "event_history": history,
             "callbacks": callbacks,
             "handler_pool": pool_stats(self._handler_pool),
             "control_pool": pool_stats(self._control_pool),
             "lanes": lanes,
+            "expired": self._expired,
+            "streams": len(self._streams),
         }
 
     def __del__(self):
@@ -486,11 +1351,13 @@ class Bus:
                     if sub.subscriber.bus == bus_url
                 }
                 for sub in dead_subscribers:
-                    self._subscribers[event_id].discard(sub)
+                    del self._subscribers[event_id][sub]
                     # Also clean up from callbacks if this is our local bus
                     if event_id in self._callbacks and sub in self._callbacks[event_id]:
                         del self._callbacks[event_id][sub]
 
+                    self._replaying.pop(sub, None)
+
                 # Clean up empty event_ids
                 if not self._subscribers[event_id]:
                     del self._subscribers[event_id]
@@ -502,7 +1369,11 @@ class Bus:
     def _ping_peer(self, dst_bus: str) -> bool:
         """True if the peer answered anything at all within the health
         timeout — even a not-found Pong proves the bus over there is alive."""
-        ping = Protocol.ping(src=self.url.url, dst=f"{dst_bus}{MANAGER_LOCATION}")
+        ping = Protocol.ping(
+            src=self.url.url,
+            dst=f"{dst_bus}{MANAGER_LOCATION}",
+            codecs=self._codecs,
+        )
         mailbox = self._mailboxes.register(ping.id, ping.dst_bus)
         try:
             if not self._push(ping):
@@ -530,49 +1401,121 @@ class Bus:
             )
             if peer.missed_pongs >= _MAX_MISSED_PONGS:
                 log.warning(f"bus: peer {dst_bus} unresponsive, evicting")
-                self._evict_peer(dst_bus)
+                self._evict_peer(dst_bus, peer.transport)
 
     def _health_loop(self) -> None:
         while not self._shutdown_done.wait(self._health_interval):
             try:
+                # reap first: no point pinging a link we are about to close
+                self._reap_peers()
                 self._health_check_once()
             except Exception:
                 log.exception("bus: health check failed")
 
-    def _schedule_peer_eviction(self, dst_bus: str) -> None:
+    def _reap_peers(self) -> None:
+        """Close outbound links idle for longer than peer_idle_timeout, then
+        the least recently used ones beyond max_peers. Unlike eviction the
+        peer is not considered gone: its subscriptions and pending requests
+        stay, and the next send simply dials again. Links to subscribers are
+        never idle-reaped (events may be rare, and the health check must
+        keep watching them) and are the last ones the cap closes."""
+        with self._pubsub_lock:
+            subscribed = {
+                sub.subscriber.bus
+                for subs in self._subscribers.values()
+                for sub in subs
+            }
+
+        now = time.monotonic()
+        with self._peers_lock:
+            victims = []
+            if self._peer_idle_timeout is not None:
+                victims = [
+                    bus
+                    for bus, peer in self._peers.items()
+                    if bus not in subscribed
+                    and now - peer.last_used >= self._peer_idle_timeout
+                ]
+
+            if self._max_peers is not None:
+                excess = len(self._peers) - len(victims) - self._max_peers
+                if excess > 0:
+                    candidates = sorted(
+                        (bus for bus in self._peers if bus not in victims),
+                        key=lambda bus: (bus in subscribed, self._peers[bus].last_used),
+                    )
+                    victims.extend(candidates[:excess])
+
+            reaped = [(bus, self._peers.pop(bus)) for bus in victims]
+            for bus in victims:
+                # renegotiated on the next ping: keeps the map bounded too
+                self._peer_codecs.pop(bus, None)
+
+        for bus, peer in reaped:
+            log.debug(f"bus: closing idle outbound link to {bus}")
+            # the next proxy pings again, renegotiating the codec on the way
+            self._resolutions.invalidate(bus)
+            with peer.lock:
+                peer.reaped = True
+                peer.close()
+
+    def _schedule_peer_eviction(self, dst_bus: str, transport: Transport) -> None:
         # called from a transport worker thread on connection loss: hand off
         # immediately, socket operations are not allowed in that context
         if self.is_dead():
             return
         try:
             # eviction is control work: it must run even when handlers are wedged
-            self._control_pool.submit(self._evict_peer, dst_bus)
+            self._control_pool.submit(self._evict_peer, dst_bus, transport)
         except RuntimeError:
             # pool already shut down: the bus is going away anyway
             pass
 
-    def _evict_peer(self, dst_bus: str) -> None:
+    def _evict_peer(self, dst_bus: str, transport: Transport | None = None) -> None:
         """A peer connection was lost: drop the outbound link, its
-        subscriptions and every request still waiting on it. The peer
-        reconnects implicitly on the next send to it (and reconnecting
-        subscribers must re-subscribe)."""
+        subscriptions, what its objects resolved to and every request still
+        waiting on it. The peer reconnects implicitly on the next send to it
+        (and reconnecting subscribers must re-subscribe). Given the
+        transport that saw the loss, only that link is evicted: a late
+        disconnect of an old link must not take down its replacement."""
+        # requests made from now on dial a new link: only older ones are lost
+        lost = time.monotonic()
         with self._peers_lock:
-            peer = self._peers.pop(dst_bus, None)
+            peer = self._peers.get(dst_bus)
+            if transport is not None and (
+                peer is None or peer.transport is not transport
+            ):
+                # that link is already gone (and maybe replaced)
+                return
+            self._peers.pop(dst_bus, None)
+            # a restarted peer may be an older build: renegotiate on the
+            # next ping, JSON until then
+            self._peer_codecs.pop(dst_bus, None)
+
+        # a restarted peer may host other objects, or none, and knows
+        # nothing of our config-change subscriptions
+        self._resolutions.invalidate(dst_bus)
+        self._forget_result_caches(dst_bus, notify=False)
 
         if peer is None:
             # already evicted, or racing our own shutdown
             return
 
         log.debug(f"bus: peer disconnected, evicting: {dst_bus}")
-        peer.transport.close()
+        self._mailboxes.fail_peer(dst_bus, before=lost)
         self._cleanup_dead_subscribers(dst_bus)
-        self._mailboxes.fail_peer(dst_bus)
+        self._cancel_streams(dst_bus)
+        # last: closing both links can take a while, and the peer may be
+        # back meanwhile
+        with peer.lock:
+            peer.close()
 
-    def _push(self, message: Messages) -> PushResult:
+    def _push(self, message: Messages, bulk: bool = False) -> PushResult:
         """Hand a message to its destination. Falsy results mean the message
         definitively could not be delivered — and say why; backpressure drops
         (DROPPED) are truthy: the peer is alive and a caller timeout covers
-        the loss."""
+        the loss. Large replies go through the bulk link, any message does
+        with bulk (when the bus has one)."""
         if self.is_dead():
             log.warning("push failed, bus is dead, not accepting new messages")
             return PushResult.BUS_DEAD
@@ -580,16 +1523,21 @@ class Bus:
         if message.dst_bus == self.url.bus:
             # NOTE: we don't need to serialize/deserialize messages sent locally
             #       but we must check if they are serializable, otherwise code won't
-            #       work when sending to remote buses.
+            #       work when sending to remote buses. The message object itself
+            #       is handed over: array payloads are shared, never copied.
             try:
-                _ = self._encoder.encode(message)
+                check(message)
             except Exception:
                 log.exception(
                     f"bus: serialization issue, won't work on remote buses: {message}"
                 )
 
             # FIXME: this could block if you send too much without receiving.
-            if isinstance(message, Response) or isinstance(message, Pong):
+            if isinstance(message, Pong) and message.codec is not None:
+                # the answer to one of our pings: the codec the peer picked
+                self._set_peer_codec(message.src_bus, message.codec)
+
+            if isinstance(message, (Response, BatchResponse, Pong)):
                 if not self._mailboxes.deliver(message.id, message):
                     # nobody is waiting: late reply after a timeout/unregister,
                     # or a stray id — drop it loudly, never resurrect a queue
@@ -598,65 +1546,164 @@ class Bus:
                         f"(id={message.id}, src={message.src})"
                     )
             else:
+                # stamp the arrival: dispatch latency is measured from here
+                _ = message.received
                 self._inbox.put(message)
             return PushResult.OK
         else:
             # encode outside every lock
             try:
-                message_bytes = self._encoder.encode(message)
+                message_bytes = self._peer_codec(message.dst_bus).encode(message)
             except Exception:
                 log.exception(f"bus: failed to encode message: {message}")
                 return PushResult.ENCODE_FAILED
 
-            peer = self._get_peer(message.dst_bus)
+            # health pings do not count as use: they would keep every idle
+            # link alive forever
+            touch = not isinstance(message, Ping)
+            peer = self._get_peer(message.dst_bus, touch=touch)
             if peer is None:
                 return PushResult.NO_PEER
 
-            with peer.lock:
-                result = peer.transport.send(message_bytes)
-                if result is SendResult.AGAIN:
-                    # backpressure beyond the socket buffer: a short bounded
-                    # retry absorbs sustained bursts; only this peer's
-                    # senders wait
-                    for _ in range(3):
-                        time.sleep(0.01)
-                        result = peer.transport.send(message_bytes)
-                        if result is not SendResult.AGAIN:
-                            break
+            droppable = isinstance(message, Event)
+            send = (
+                self._send_bulk
+                if self._bulk_threshold is not None
+                and (
+                    bulk
+                    or isinstance(message, (Response, BatchResponse))
+                    and len(message_bytes) >= self._bulk_threshold
+                )
+                else self._send
+            )
+            result = send(peer, message_bytes, droppable)
+            if result is PushResult.SEND_DEAD and peer.reaped:
+                # raced the reaper closing this link: dial again, once
+                peer = self._get_peer(message.dst_bus, touch=touch)
+                if peer is None:
+                    return PushResult.NO_PEER
+                result = send(peer, message_bytes, droppable)
 
             match result:
-                case SendResult.OK:
-                    return PushResult.OK
-                case SendResult.AGAIN:
-                    # still full: drop this message but never evict — a slow
-                    # peer is not a dead one
+                case PushResult.DROPPED | PushResult.REJECTED:
+                    # queue full: never evict — a slow peer is not a dead one
                     log.warning(
-                        f"bus: send buffer full for {message.dst_bus}, "
-                        f"dropping {type(message).__name__}"
+                        f"bus: send queue full for {message.dst_bus}, "
+                        f"{result} {type(message).__name__}"
                     )
-                    return PushResult.DROPPED
-                case SendResult.DEAD:
+                case PushResult.SEND_DEAD:
                     # if the peer is really gone the transport will notify
                     # us and _evict_peer does the cleanup
                     log.warning(
                         f"bus: send failed to {message.dst_bus}, "
                         f"dropping {type(message).__name__}"
                     )
-                    return PushResult.SEND_DEAD
+            return result
+
+    def _push_stream(self, response: Response) -> PushResult:
+        """Reply of a streamed result. The links to a peer are not ordered
+        with each other: were large items to take the bulk link and the
+        rest the control one, the final Response could overtake items still
+        in flight and end the caller's iteration early. Every message of a
+        stream takes the bulk link instead."""
+        return self._push(response, bulk=True)
+
+    def _send(self, peer: _Peer, data: bytes, droppable: bool) -> PushResult:
+        with peer.lock:
+            if not peer.queue:
+                # the common case: straight into nng, no thread hop
+                match peer.transport.send(data):
+                    case SendResult.OK:
+                        return PushResult.OK
+                    case SendResult.DEAD:
+                        return PushResult.SEND_DEAD
+
+            # nng is full, or earlier frames are still queued and this one
+            # must keep its place behind them
+            result = peer.enqueue(data, droppable)
+
+        if result is PushResult.OK:
+            self._writer.wake(peer)
+        return result
+
+    def _send_bulk(self, peer: _Peer, data: bytes, droppable: bool) -> PushResult:
+        """Send a large frame through the peer's bulk link: a connection of
+        its own to the same inbox, so the frame neither waits behind control
+        messages nor holds them up (the receiving socket takes turns between
+        links, and each has its own send buffer). Queued frames move only
+        once the control queue is empty."""
+        if peer.bulk is None and not self._dial_bulk(peer):
+            return PushResult.NO_PEER
+
+        with peer.lock:
+            if peer.bulk is None:
+                # closed meanwhile: evicted or reaped
+                return PushResult.SEND_DEAD
+            if not peer.bulk_queue:
+                match peer.bulk.send(data):
+                    case SendResult.OK:
+                        peer.bulk_sent += 1
+                        return PushResult.OK
+                    case SendResult.DEAD:
+                        return PushResult.SEND_DEAD
+            if len(peer.bulk_queue) >= peer.queue_size:
+                peer.rejected += 1
+                return PushResult.REJECTED
+            peer.bulk_queue.append(data)
+
+        self._writer.wake(peer)
+        return PushResult.OK
+
+    def _dial_bulk(self, peer: _Peer) -> bool:
+        # dialed outside the peer lock, like the control link: control
+        # senders must not wait on it
+        transport = create_transport(peer.transport.url)
+        # no on_disconnect: the control link alone decides when the peer is
+        # gone, and eviction closes both
+        try:
+            transport.connect()
+        except Exception as e:
+            log.warning(f"bus: failed to open bulk link to {peer.transport.url}: {e}")
+            return False
 
-    def _get_peer(self, dst_bus: str) -> _Peer | None:
+        with peer.lock:
+            if peer.bulk is None and not peer.closed:
+                peer.bulk = transport
+                return True
+            dialed = peer.bulk is not None
+        # lost a race: another sender dialed it first, or the peer is closed
+        transport.close()
+        return dialed
+
+    def _peer_codec(self, dst_bus: str) -> Codec:
+        return self._peer_codecs.get(dst_bus, JSON)
+
+    def _set_peer_codec(self, dst_bus: str, name: str) -> None:
+        if dst_bus == self.url.bus or name not in self._codecs:
+            # local delivery never encodes; never adopt a codec we did not offer
+            return
+        with self._peers_lock:
+            if self._peer_codecs.get(dst_bus, JSON).name != name:
+                log.debug(f"bus: using {name} codec for {dst_bus}")
+            self._peer_codecs[dst_bus] = CODECS[name]
+
+    def _get_peer(self, dst_bus: str, touch: bool = True) -> _Peer | None:
         with self._peers_lock:
             peer = self._peers.get(dst_bus)
         if peer is not None:
+            if touch:
+                peer.last_used = time.monotonic()
             return peer
 
         # dial outside the map lock: a black-holed peer blocking in connect
-        # must not freeze senders to healthy peers (H1)
-        # TODO: define some policy to handle closing of these sockets when not in use
+        # must not freeze senders to healthy peers (H1). Idle links are
+        # closed by _reap_peers
         transport = create_transport(dst_bus)
         # peer loss is detected by the transport (pipe removal) and handled
         # off the transport thread; the send path itself never evicts
-        transport.on_disconnect = lambda: self._schedule_peer_eviction(dst_bus)
+        transport.on_disconnect = lambda: self._schedule_peer_eviction(
+            dst_bus, transport
+        )
         try:
             transport.connect()
         except Exception as e:
@@ -672,9 +1719,16 @@ class Bus:
                 # lost a connect race: keep the winner's connection
                 transport.close()
                 return existing
-            peer = _Peer(transport)
+            peer = _Peer(transport, self._peer_queue_size)
             self._peers[dst_bus] = peer
-            return peer
+            over_cap = (
+                self._max_peers is not None and len(self._peers) > self._max_peers
+            )
+
+        if over_cap:
+            # the new link is the most recently used: never the one to go
+            self._reap_peers()
+        return peer
 
     def _pop(self, /, timeout: float | None = None) -> Messages | None:
         message = self._inbox.get(block=True, timeout=timeout)
@@ -707,14 +1761,14 @@ class Bus:
 
             self._dispatch_thread = threading.Thread(
                 target=self._process_queue,
-                name=f"chimera-bus-dispatch-{self.url.port}",
+                name=f"chimera-bus-dispatch-{self._tag}",
                 daemon=True,
             )
             self._dispatch_thread.start()
 
             self._health_thread = threading.Thread(
                 target=self._health_loop,
-                name=f"chimera-bus-health-{self.url.port}",
+                name=f"chimera-bus-health-{self._tag}",
                 daemon=True,
             )
             self._health_thread.start()
@@ -749,8 +1803,9 @@ class Bus:
                 # crash the loop — recv() returns None in both cases
                 while (recv_bytes := self._inbound.recv()) is not None:
                     # FIXME: this could fail, check and push back errors if needed.
+                    # peers pick their codec independently: detect per frame
                     try:
-                        message: Messages = self._decoder.decode(recv_bytes)
+                        message: Messages = detect(recv_bytes).decode(recv_bytes)
                     except msgspec.DecodeError:
                         log.exception(f"bus: failed to decode message: {recv_bytes}")
                         continue
@@ -771,25 +1826,89 @@ class Bus:
         ping = Protocol.ping(
             src=parse_url(src).url,
             dst=parse_url(dst).url,
+            codecs=self._codecs,
         )
 
         mailbox = self._mailboxes.register(ping.id, ping.dst_bus)
         try:
             if not self._push(ping):
                 # peer is unreachable: don't wait out the timeout
-                return ping.pong(ok=False)
-
-            try:
-                response = mailbox.get(timeout=timeout)
-            except queue.Empty:
-                return ping.pong(ok=False)
-            if response is None or not isinstance(response, Pong):
-                return None
-
-            return response
+                pong = ping.pong(ok=False)
+            else:
+                try:
+                    response = mailbox.get(timeout=timeout)
+                except queue.Empty:
+                    response = ping.pong(ok=False)
+                if response is None or not isinstance(response, Pong):
+                    return None
+                pong = response
         finally:
             self._mailboxes.unregister(ping.id)
 
+        # every answer refreshes the resolution cache
+        self._resolutions.put(ping.dst, ping.dst_bus, _resolution(pong))
+        return pong
+
+    def resolve(
+        self,
+        *,
+        src: str | URL,
+        dst: str | URL,
+        timeout: float = 5.0,
+    ) -> Resolution | None:
+        """The object answering at dst (its get_location()), None if nothing
+        does. Pings only on a cache miss: found objects are
+        remembered for resolve_ttl, misses for negative_resolve_ttl, so
+        proxies created over and over (and absent instruments) cost no
+        round trips. Raises BusDeadException if this bus dies meanwhile."""
+        dst = parse_url(dst)
+        hit, resolved = self._resolutions.get(dst.url)
+        if hit:
+            return resolved
+
+        pong = self.ping(src=src, dst=dst, timeout=timeout)
+        if pong is None:
+            raise BusDeadException("bus is dead")
+        return _resolution(pong)
+
+    def forget_resolutions(self, bus: str | None = None) -> None:
+        """Drop what objects on bus (default: this one) resolved to. The
+        Manager calls it when objects come and go."""
+        self._resolutions.invalidate(bus or self.url.bus)
+        self._forget_result_caches(bus or self.url.bus, notify=True)
+
+    def result_cache(self, url: URL) -> ResultCache:
+        """Memoized results of the @cached methods of the object at url (as
+        resolved), shared by every proxy to it on this bus and dropped
+        whenever the object publishes a config change."""
+        with self._result_caches_lock:
+            cache = self._result_caches.get(url.url)
+            if cache is not None:
+                return cache
+            cache = self._result_caches[url.url] = ResultCache()
+
+        self.subscribe(
+            sub=self.url,
+            pub=url,
+            event=CONFIG_CHANGED_EVENT_NAME,
+            callback=cache.invalidate,
+        )
+        return cache
+
+    def _forget_result_caches(self, bus: str, *, notify: bool) -> None:
+        with self._result_caches_lock:
+            urls = [url for url in self._result_caches if parse_url(url).bus == bus]
+            caches = [(url, self._result_caches.pop(url)) for url in urls]
+
+        for url, cache in caches:
+            # an evicted peer is not told: it is gone, and forgot us anyway
+            self._drop_subscription(
+                pub=url,
+                event=CONFIG_CHANGED_EVENT_NAME,
+                callback=cache.invalidate,
+                notify=notify,
+            )
+
     def request(
         self,
         *,
@@ -801,6 +1920,7 @@ class Bus:
         # no default timeout: instrument operations (slew, expose, ...) can
         # legitimately take unbounded time; callers opt in per call or proxy
         timeout: float | None = None,
+        trace: TraceContext | None = None,
     ) -> Response:
         request = Protocol.request(
             src=parse_url(src).url,
@@ -808,14 +1928,16 @@ class Bus:
             method=method,
             args=args or [],
             kwargs=kwargs or {},
+            timeout=timeout,
+            trace=trace,
         )
 
         mailbox = self._mailboxes.register(request.id, request.dst_bus)
+        started = time.monotonic()
         try:
-            if not self._push(request):
+            if not (result := self._push(request)):
                 raise BusDeadException(
-                    f"cannot send request {method} to {request.dst}: "
-                    "bus or peer is dead"
+                    f"cannot send request {method} to {request.dst}: {result}"
                 )
 
             try:
@@ -830,10 +1952,216 @@ class Bus:
                     f"bus died while waiting for {method} on {request.dst}"
                 )
 
+            self._observe_round_trip(request, started)
             return response
         finally:
             self._mailboxes.unregister(request.id)
 
+    def request_stream(
+        self,
+        *,
+        src: str | URL,
+        dst: str | URL,
+        method: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        trace: TraceContext | None = None,
+        window: int = 16,
+    ) -> ResponseStream:
+        """Call a generator method and iterate its items as the remote
+        object produces them, never more than window of them in flight.
+        timeout is the longest wait for each item. Close the stream (or use
+        it in a `with` block) to stop the remote generator early."""
+        request = Protocol.request(
+            src=parse_url(src).url,
+            dst=parse_url(dst).url,
+            method=method,
+            args=args or [],
+            kwargs=kwargs or {},
+            timeout=timeout,
+            trace=trace,
+            window=max(1, window),
+        )
+
+        mailbox = self._mailboxes.register(request.id, request.dst_bus)
+        if not (result := self._push(request)):
+            self._mailboxes.unregister(request.id)
+            raise BusDeadException(
+                f"cannot send request {method} to {request.dst}: {result}"
+            )
+        return ResponseStream(self, request, mailbox, timeout)
+
+    def request_many(
+        self,
+        *,
+        src: str | URL,
+        calls: Iterable[Call],
+        timeout: float | None = None,
+        trace: TraceContext | None = None,
+    ) -> list[Response]:
+        """Send many calls at once and wait for all of them: one Batch
+        message (and one round trip) per destination bus. Responses come
+        back in call order; each call fails or succeeds on its own. The
+        timeout bounds the whole batch."""
+        src_url = parse_url(src).url
+        requests = [
+            Protocol.request(
+                src=src_url,
+                dst=parse_url(dst).url,
+                method=method,
+                args=list(args),
+                kwargs=dict(kwargs),
+                timeout=timeout,
+                trace=trace,
+            )
+            for dst, method, args, kwargs in calls
+        ]
+
+        by_bus: dict[str, list[Request]] = {}
+        for request in requests:
+            by_bus.setdefault(request.dst_bus, []).append(request)
+
+        # (mailbox key, mailbox) for every message in flight
+        pending: list[tuple[int, _Mailbox]] = []
+        started = time.monotonic()
+        try:
+            for dst_bus, group in by_bus.items():
+                # a peer that never negotiated a codec may predate batches:
+                # pipeline its requests instead (send all, then wait all)
+                messages: list[Batch | Request]
+                if dst_bus == self.url.bus or self._peer_codec(dst_bus) is not JSON:
+                    messages = [Protocol.batch(src=src_url, requests=group)]
+                else:
+                    messages = list(group)
+
+                for message in messages:
+                    mailbox = self._mailboxes.register(message.id, dst_bus)
+                    pending.append((message.id, mailbox))
+                    if not self._push(message):
+                        raise BusDeadException(
+                            f"cannot send {len(group)} requests to {dst_bus}: "
+                            "bus or peer is dead"
+                        )
+
+            deadline = None if timeout is None else time.monotonic() + timeout
+            responses: dict[int, Response] = {}
+            for _, mailbox in pending:
+                remaining = (
+                    None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+                try:
+                    reply = mailbox.get(timeout=remaining)
+                except queue.Empty:
+                    raise RequestTimeoutException(
+                        f"no response for {len(requests)} batched requests "
+                        f"after {timeout}s"
+                    ) from None
+
+                match reply:
+                    case BatchResponse():
+                        for response in reply.responses:
+                            responses[response.id] = response
+                    case Response():
+                        responses[reply.id] = reply
+                    case _:
+                        raise BusDeadException(
+                            "bus died while waiting for batched requests"
+                        )
+
+            for request in requests:
+                if request.id in responses:
+                    self._observe_round_trip(request, started)
+
+            return [
+                responses.get(request.id)
+                or request.error(LookupError(f"no response for {request.method}"))
+                for request in requests
+            ]
+        finally:
+            for key, _ in pending:
+                self._mailboxes.unregister(key)
+
+    def submit_request(
+        self,
+        *,
+        src: str | URL,
+        dst: str | URL,
+        method: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        trace: TraceContext | None = None,
+    ) -> Future[Response]:
+        """request() without blocking: the Response arrives in the returned
+        Future, which fails with RequestTimeoutException/BusDeadException
+        like request() raises. No thread waits for it, so any number of
+        requests can be in flight; done-callbacks run on the handler pool."""
+        request = Protocol.request(
+            src=parse_url(src).url,
+            dst=parse_url(dst).url,
+            method=method,
+            args=args or [],
+            kwargs=kwargs or {},
+            timeout=timeout,
+            trace=trace,
+        )
+
+        future: Future[Response] = Future()
+        mailbox = _FutureMailbox(
+            request.dst_bus,
+            future,
+            f"{method} on {request.dst}",
+            self._run_detached,
+        )
+        self._mailboxes.register(request.id, request.dst_bus, mailbox)
+
+        started = time.monotonic()
+        future.add_done_callback(
+            lambda f: (
+                self._observe_round_trip(request, started)
+                if not f.cancelled() and f.exception() is None
+                else None
+            )
+        )
+
+        if not self._push(request):
+            self._mailboxes.unregister(request.id)
+            # a dead peer may have resolved it already
+            mailbox._resolve(
+                error=BusDeadException(
+                    f"cannot send request {method} to {request.dst}: "
+                    "bus or peer is dead"
+                )
+            )
+            return future
+
+        if timeout is not None:
+            self._deadlines.add(
+                timeout, lambda: self._mailboxes.expire(request.id, timeout)
+            )
+
+        # a cancelled future no longer needs its mailbox
+        future.add_done_callback(
+            lambda f: self._mailboxes.unregister(request.id) if f.cancelled() else None
+        )
+        return future
+
+    def _observe_round_trip(self, request: Request, started: float) -> None:
+        self.metrics.observe(
+            "round_trip",
+            parse_url(request.dst).path,
+            request.method,
+            time.monotonic() - started,
+        )
+
+    def _run_detached(self, fn: Callable[[], None]) -> None:
+        try:
+            self._handler_pool.submit(fn)
+        except RuntimeError:
+            # pool already shut down: the bus is going away, finish inline
+            fn()
+
     def subscribe(
         self,
         *,
@@ -841,7 +2169,16 @@ class Bus:
         pub: str | URL,
         event: str,
         callback: Callable[..., None],
+        conflate: bool = False,
+        filter: EventFilter | None = None,
+        replay: int = 0,
     ):
+        """Call callback for every `event` published by pub. With conflate,
+        a slow callback skips stale payloads: only the newest pending one is
+        delivered, and never concurrently with itself. A filter is checked
+        by the publisher bus: events it rejects are never sent here. With
+        replay, up to that many of the latest events (if the publisher keeps
+        a history of them) are delivered first."""
         pub_url = parse_url(pub)
         sub_url = parse_url(sub)
         event_id = EventId(pub_url.url, event)
@@ -860,7 +2197,7 @@ class Bus:
             # this subscription cannot fire into the registration gap (M6)
             subscriber = Subscriber(sub_url, token)
             self._callbacks.setdefault(event_id, {})[subscriber] = Callback(
-                token, callback
+                token, callback, _Conflator(callback) if conflate else None
             )
 
         push_result = self._push(
@@ -869,6 +2206,8 @@ class Bus:
                 pub=pub_url.url,
                 event=event,
                 callback=token,
+                filter=filter,
+                replay=replay,
             )
         )
         if not push_result:
@@ -887,6 +2226,16 @@ class Bus:
         event: str,
         callback: Callable[..., None],
     ):
+        self._drop_subscription(pub=pub, event=event, callback=callback, notify=True)
+
+    def _drop_subscription(
+        self,
+        *,
+        pub: str | URL,
+        event: str,
+        callback: Callable[..., None],
+        notify: bool,
+    ) -> None:
         pub_url = parse_url(pub)
         event_id = EventId(pub_url.url, event)
         registry_key = (pub_url.url, event)
@@ -919,6 +2268,9 @@ class Bus:
                 if not event_callbacks:
                     del self._callbacks[event_id]
 
+        if not notify:
+            return
+
         self._push(
             Protocol.unsubscribe(
                 sub=entry_sub.url,
@@ -935,7 +2287,11 @@ class Bus:
         event: str,
         args: list[Any] | None = None,
         kwargs: dict[str, Any] | None = None,
+        history: int = 0,
     ) -> None:
+        """Send event to the subscribers of pub. With history, this bus
+        keeps the latest that many events for subscribers asking for a
+        replay."""
         # TODO: should we return something to confirm delivery?
         self._push(
             Protocol.publish(
@@ -943,6 +2299,9 @@ class Bus:
                 event=event,
                 args=args or [],
                 kwargs=kwargs or {},
+                # events fired from traced work carry the span along
+                trace=tracing.current(),
+                history=history,
             )
         )
 
@@ -964,6 +2323,8 @@ class Bus:
                         self._handle_subscribe(message)
                     case Unsubscribe():
                         self._handle_unsubscribe(message)
+                    case Credit():
+                        self._handle_credit(message)
                     case Ping():
                         _ = self._control_pool.submit(self._handle_ping, message)
                     case Publish():
@@ -972,6 +2333,8 @@ class Bus:
                         # routed inline (resolve + pick a lane/pool); the
                         # actual execution never happens on this thread
                         self._route_request(message)
+                    case Batch():
+                        self._route_batch(message)
                     case Event():
                         _ = self._handler_pool.submit(self._handle_event, message)
                     case _:
@@ -992,11 +2355,30 @@ class Bus:
     ) -> tuple[str | None, Callable[..., Any] | None]:
         return None, None
 
-    def _route_request(self, request: Request) -> None:
+    def _route_batch(self, batch: Batch) -> None:
+        """Runs inline on the dispatch thread: every request in the batch is
+        routed like a single one, their responses are gathered into one
+        BatchResponse."""
+        if not batch.requests:
+            self._control_pool.submit(self._push, batch.ok([]))
+            return
+
+        collector = _BatchCollector(batch, self._push)
+        for request in batch.requests:
+            self._route_request(request, collector.reply, batch.received)
+
+    def _route_request(
+        self,
+        request: Request,
+        reply: Reply | None = None,
+        received: float | None = None,
+    ) -> None:
         """Runs inline on the dispatch thread: resolve and route, never
         execute. Resolution is a dict lookup (framework code, microseconds);
         routing must not depend on the handler pool, or a wedged pool would
         starve the locked-method lanes it feeds."""
+        if reply is None:
+            reply = self._push_stream if request.window is not None else self._push
         try:
             dst = parse_url(request.dst)
 
@@ -1005,51 +2387,248 @@ class Bus:
 
             if not resource:
                 self._control_pool.submit(
-                    self._push, request.not_found(f"'{dst.cls}' not found")
+                    reply, request.not_found(f"'{dst.cls}' not found")
                 )
                 return
 
             if not method:
                 self._control_pool.submit(
-                    self._push,
+                    reply,
                     request.not_found(f"'{dst.cls}.{request.method}' not found"),
                 )
                 return
 
-            if _is_locked_method(method):
-                self._enqueue_lane(resource, request, method)
+            now = time.monotonic()
+            if received is None:
+                received = request.received
+            self.metrics.observe("dispatch", resource, request.method, now - received)
+
+            deadline = None if request.timeout is None else received + request.timeout
+            if request.window is not None:
+                # opened in arrival order: no Credit from the caller can
+                # get here first, not even a cancel sent right away
+                self._open_stream(request)
+            if isinstance(method, Dispatch):
+                method, locked, urgent = method.callable, method.locked, method.urgent
+            else:
+                locked = _is_locked_method(method)
+                urgent = locked and _is_urgent_method(method)
+            if locked:
+                wait = "urgent_wait" if urgent else "lane_wait"
+                route = _Route(resource, now, wait, deadline)
+                self._enqueue_lane(resource, request, method, reply, route)
             else:
-                self._handler_pool.submit(self._execute_request, request, method)
+                route = _Route(resource, now, "pool_wait", deadline)
+                self._handler_pool.submit(
+                    self._execute_request, request, method, reply, route
+                )
         except Exception as e:
             log.exception("error routing request")
-            self._control_pool.submit(self._push, request.error(e))
+            self._close_stream(request)
+            self._control_pool.submit(reply, request.error(e))
 
-    def _execute_request(self, request: Request, method: Callable[..., Any]) -> None:
+    def _execute_request(
+        self,
+        request: Request,
+        method: Callable[..., Any],
+        reply: Reply | None = None,
+        route: _Route | None = None,
+    ) -> None:
+        reply = reply or self._push
         try:
-            try:
-                result = method(*request.args, **request.kwargs)
-            except Exception as e:
-                self._push(request.error(e))
-                return
-
-            if self._push(request.ok(result)) is PushResult.ENCODE_FAILED:
-                # the payload is the problem: answer with an all-string error
-                # (always encodable) instead of leaving the caller blocked on
-                # a reply that will never arrive
-                self._push(
-                    request.error(
-                        TypeError(
-                            f"result of {request.method}() is not serializable "
-                            f"({type(result).__name__})"
+            started = time.monotonic()
+            if route is not None:
+                self.metrics.observe(
+                    route.wait, route.resource, request.method, started - route.at
+                )
+                if route.deadline is not None and started >= route.deadline:
+                    # the caller timed out while this sat in a queue: running
+                    # it now would only hold the object from fresh work
+                    self._expire_request(request, reply, route, started)
+                    return
+
+            with self._server_span(request, route, started) as span:
+                trace = span.context if span is not None else None
+                try:
+                    result = method(*request.args, **request.kwargs)
+                    if isinstance(result, Generator):
+                        if request.window is None:
+                            # not asked for a stream (batches, futures, older
+                            # peers): every item at once
+                            result = list(result)
+                        elif not self._stream_result(request, result, reply, trace):
+                            # cancelled, or the caller is gone: nobody to answer
+                            if route is not None:
+                                self.metrics.count(
+                                    "cancelled", route.resource, request.method
+                                )
+                            return
+                        else:
+                            # every item was sent: the final reply ends it
+                            result = None
+                except Exception as e:
+                    executed = time.monotonic()
+                    if span is not None:
+                        span.attrs["error"] = type(e).__name__
+                    reply(request.error(e, trace))
+                    if route is not None:
+                        self.metrics.count("errors", route.resource, request.method)
+                        self._observe_execution(route, request, started, executed)
+                    return
+
+                executed = time.monotonic()
+                if reply(request.ok(result, trace)) is PushResult.ENCODE_FAILED:
+                    # the payload is the problem: answer with an all-string
+                    # error (always encodable) instead of leaving the caller
+                    # blocked on a reply that will never arrive
+                    reply(
+                        request.error(
+                            TypeError(
+                                f"result of {request.method}() is not "
+                                f"serializable ({type(result).__name__})"
+                            ),
+                            trace,
                         )
                     )
-                )
+            if route is not None:
+                self._observe_execution(route, request, started, executed)
         except Exception:
             log.exception("error executing request")
+        finally:
+            self._close_stream(request)
+
+    def _open_stream(self, request: Request) -> None:
+        assert request.window is not None
+        with self._streams_lock:
+            self._streams[(request.src_bus, request.id)] = _Stream(
+                max(1, request.window)
+            )
+
+    def _close_stream(self, request: Request) -> None:
+        if request.window is None:
+            return
+        with self._streams_lock:
+            self._streams.pop((request.src_bus, request.id), None)
+
+    def _cancel_streams(self, bus: str | None = None) -> None:
+        """Cancel the streams to the callers on bus (default: all of them)."""
+        with self._streams_lock:
+            streams = [
+                stream
+                for (caller, _), stream in self._streams.items()
+                if bus is None or caller == bus
+            ]
+        for stream in streams:
+            stream.cancel()
+
+    def _stream_result(
+        self,
+        request: Request,
+        items: Generator[Any, None, Any],
+        reply: Reply,
+        trace: TraceContext | None,
+    ) -> bool:
+        """Send the items of a generator method one Response at a time, as
+        they are produced. The generator is only advanced when the caller
+        has credit left: a slow consumer paces the producer instead of
+        piling items up in queues. True once the items ran out; False if
+        the caller cancelled (or went away). The generator is closed either
+        way, so its cleanup runs; its errors propagate."""
+        with self._streams_lock:
+            stream = self._streams.get((request.src_bus, request.id))
+        if stream is None:
+            # closed by shutdown or eviction before it started
+            items.close()
+            return False
+
+        try:
+            while stream.acquire():
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return True
+
+                result = reply(request.item(item, trace))
+                if result is PushResult.ENCODE_FAILED:
+                    raise TypeError(
+                        f"item of {request.method}() is not serializable "
+                        f"({type(item).__name__})"
+                    )
+                if not result:
+                    return False
+            return False
+        finally:
+            items.close()
+
+    def _handle_credit(self, message: Credit) -> None:
+        with self._streams_lock:
+            stream = self._streams.get((message.src_bus, message.id))
+        if stream is None:
+            # finished meanwhile
+            return
+        if message.cancel:
+            stream.cancel()
+        else:
+            stream.grant(message.credit)
+
+    def _server_span(
+        self, request: Request, route: _Route | None, started: float
+    ) -> AbstractContextManager[tracing.Span | None]:
+        """The span of a traced request on this bus: the method runs as its
+        current span, so the calls it makes join the caller's trace."""
+        if request.trace is None:
+            return nullcontext()
+        resource = route.resource if route else parse_url(request.dst).path
+        attrs: dict[str, Any] = {"bus": self.url.bus}
+        if route is not None:
+            attrs[route.wait] = started - route.at
+        return tracing.span(
+            f"{resource}.{request.method}", "server", request.trace, **attrs
+        )
+
+    def _expire_request(
+        self, request: Request, reply: Reply, route: _Route, now: float
+    ) -> None:
+        with self._expired_lock:
+            self._expired += 1
+        self.metrics.count("expired", route.resource, request.method)
+        log.debug(
+            f"bus: dropping expired {request.method} on {route.resource} "
+            f"({now - route.at:.3f}s queued)"
+        )
+        # nobody waits for it anymore, but a batch still needs every answer
+        reply(
+            request.expired(
+                f"{request.method} expired after {request.timeout}s before it could run"
+            )
+        )
+
+    def _observe_execution(
+        self, route: _Route, request: Request, started: float, executed: float
+    ) -> None:
+        self.metrics.observe(
+            "execute", route.resource, request.method, executed - started
+        )
+        self.metrics.observe(
+            "reply", route.resource, request.method, time.monotonic() - executed
+        )
 
     def _enqueue_lane(
-        self, resource: str, request: Request, method: Callable[..., Any]
+        self,
+        resource: str,
+        request: Request,
+        method: Callable[..., Any],
+        reply: Reply | None = None,
+        route: _Route | None = None,
     ) -> None:
+        reply = reply or self._push
+        if route is None:
+            urgent = _is_urgent_method(method)
+            route = _Route(
+                resource, time.monotonic(), "urgent_wait" if urgent else "lane_wait"
+            )
+        else:
+            urgent = route.wait == "urgent_wait"
         with self._lanes_lock:
             lane = self._lanes.get(resource)
             if lane is None or lane.closed:
@@ -1057,14 +2636,19 @@ class Bus:
                 lane.thread = threading.Thread(
                     target=self._lane_worker,
                     args=(resource, lane),
-                    name=f"chimera-bus-lane-{self.url.port}{resource}",
+                    name=f"chimera-bus-lane-{self._tag}{resource}",
                     daemon=True,
                 )
                 self._lanes[resource] = lane
                 lane.thread.start()
 
+            if urgent:
+                # safety commands must never be refused for a full lane
+                lane.queue.put_urgent((request, method, reply, route))
+                return
+
             try:
-                lane.queue.put_nowait((request, method))
+                lane.queue.put_nowait((request, method, reply, route))
                 return
             except queue.Full:
                 pass
@@ -1075,8 +2659,10 @@ class Bus:
             f"bus: lane full for {resource} ({self._lane_queue_size} pending), "
             f"rejecting {request.method}"
         )
+        self.metrics.count("busy", resource, request.method)
+        self._close_stream(request)
         self._control_pool.submit(
-            self._push,
+            reply,
             request.busy(f"{resource} busy: {self._lane_queue_size} requests pending"),
         )
 
@@ -1099,8 +2685,8 @@ class Bus:
                 # shutdown sentinel
                 return
 
-            request, method = item
-            self._execute_request(request, method)
+            request, method, reply, route = item
+            self._execute_request(request, method, reply, route)
 
     def callbacks(self, /, event_id: EventId) -> dict[Subscriber, Callback]:
         with self._pubsub_lock:
@@ -1108,19 +2694,33 @@ class Bus:
 
     def subscribers(self, /, event_id: EventId) -> set[Subscriber]:
         with self._pubsub_lock:
-            return set(self._subscribers.get(event_id, ()))
+            return set(self._subscribers.get(event_id, {}))
 
     def _handle_ping(self, message: Ping) -> None:
         try:
+            # the first ping between two buses settles their wire codec; a
+            # ping without codecs comes from an old JSON-only peer
+            codec = negotiate(message.codecs, self._codecs)
+            self._set_peer_codec(message.src_bus, codec)
+
             # resolve the dst URL and return the resolved URL in the pong
             dst_url = parse_url(message.dst)
             cls, method = self.resolve_request(dst_url.path, "get_location")
+            if isinstance(method, Dispatch):
+                method = method.callable
             if cls is not None and method is not None:
                 resolved_url = method()
-                pong = message.pong(ok=True, resolved_url=resolved_url)
+                pong = message.pong(
+                    ok=True,
+                    resolved_url=resolved_url,
+                    codec=codec,
+                    # advertised so callers memoize or stream them (see Proxy)
+                    cached=_advertised(method, CACHED_METHODS_ATTRIBUTE_NAME),
+                    streams=_advertised(method, STREAM_METHODS_ATTRIBUTE_NAME),
+                )
                 self._push(pong)
             else:
-                self._push(message.pong(ok=False))
+                self._push(message.pong(ok=False, codec=codec))
         except Exception:
             log.exception("error handling ping")
             # still answer: a reachable bus must never look silently
@@ -1133,22 +2733,68 @@ class Bus:
 
     def _handle_subscribe(self, message: Subscribe):
         try:
+            replay: list[Publish] = []
             with self._pubsub_lock:
                 event_id = EventId(message.pub, message.event)
                 subscriber = Subscriber(parse_url(message.sub), message.callback)
-                self._subscribers.setdefault(event_id, set()).add(subscriber)
+                gate = _EventGate(message.filter) if message.filter else None
+                self._subscribers.setdefault(event_id, {})[subscriber] = gate
+
+                history = self._history.get(event_id)
+                if message.replay > 0 and history:
+                    # filtered as published, by their own timestamps, on a
+                    # gate of their own: the live one starts afresh
+                    past = _EventGate(message.filter) if message.filter else None
+                    replay = [
+                        event
+                        for event in list(history)[-message.replay :]
+                        if past is None
+                        or past.accepts(event.args, event.kwargs, event.ts / 1e9)
+                    ]
+                if replay:
+                    # registered in the same critical section: no live event
+                    # can get ahead of the replay
+                    self._replaying[subscriber] = []
+
+            if replay:
+                _ = self._control_pool.submit(self._replay, subscriber, replay)
         except Exception:
             log.exception("error handling subscribe")
 
+    def _replay(self, subscriber: Subscriber, events: list[Publish]) -> None:
+        """Send subscriber the events it asked to be replayed, then the live
+        ones published meanwhile, in order."""
+        try:
+            while events:
+                for event in events:
+                    self._push(
+                        event.callback(
+                            dst=subscriber.subscriber.bus,
+                            event=event.event,
+                            args=event.args,
+                            kwargs=event.kwargs,
+                            callbacks=[subscriber.callback],
+                        )
+                    )
+                with self._pubsub_lock:
+                    events = self._replaying.pop(subscriber, [])
+                    if events:
+                        self._replaying[subscriber] = []
+        except Exception:
+            log.exception("error replaying events")
+            with self._pubsub_lock:
+                self._replaying.pop(subscriber, None)
+
     def _handle_unsubscribe(self, message: Unsubscribe):
         try:
             with self._pubsub_lock:
                 event_id = EventId(message.pub, message.event)
                 subscriber = Subscriber(parse_url(message.sub), message.callback)
 
+                self._replaying.pop(subscriber, None)
                 subscribers = self._subscribers.get(event_id)
                 if subscribers is not None:
-                    subscribers.discard(subscriber)
+                    subscribers.pop(subscriber, None)
                     if not subscribers:
                         del self._subscribers[event_id]
         except Exception:
@@ -1158,24 +2804,51 @@ class Bus:
         try:
             event_id = EventId(message.pub, message.event)
 
-            # snapshot under the lock: subscribe/unsubscribe mutate the set
-            # concurrently and an unlocked iteration silently drops the event
+            # snapshot under the lock: subscribe/unsubscribe mutate the map
+            # concurrently and an unlocked iteration silently drops the event.
+            # Filters are checked here too: their gates are stateful
+            now = time.monotonic()
+            accepted: dict[str, list[int]] = {}
+            rejected: set[str] = set()
             with self._pubsub_lock:
-                subscribers = set(self._subscribers.get(event_id, ()))
-
-            # no subscribers for this event
-            if not subscribers:
-                return
-
-            # unique set of buses where we have subscribers
-            urls = set([sub.subscriber.bus for sub in subscribers])
-
-            for url in urls:
+                if message.history > 0:
+                    history = self._history.get(event_id)
+                    if history is None or history.maxlen != message.history:
+                        history = self._history[event_id] = collections.deque(
+                            history or (), maxlen=message.history
+                        )
+                    if not history or history[-1].ts <= message.ts:
+                        history.append(message)
+                    elif len(history) < message.history or history[0].ts < message.ts:
+                        # publishes are handled on a pool and may come out of
+                        # order: the history keeps the order they were made in
+                        if len(history) == message.history:
+                            history.popleft()
+                        bisect.insort(history, message, key=lambda event: event.ts)
+                else:
+                    self._history.pop(event_id, None)
+
+                for sub, gate in self._subscribers.get(event_id, {}).items():
+                    bus = sub.subscriber.bus
+                    if gate is None or gate.accepts(message.args, message.kwargs, now):
+                        pending = self._replaying.get(sub)
+                        if pending is None:
+                            accepted.setdefault(bus, []).append(sub.callback)
+                            continue
+                        # sent by _replay once the replay is out
+                        pending.append(message)
+                    rejected.add(bus)
+
+            # one event per bus with (accepted) subscribers; it names the
+            # callbacks only when a filter (or a replay) held some back on
+            # that bus
+            for url, callbacks in accepted.items():
                 event = message.callback(
                     dst=url,
                     event=message.event,
                     args=message.args,
                     kwargs=message.kwargs,
+                    callbacks=callbacks if url in rejected else None,
                 )
                 self._push(event)
         except Exception:
@@ -1187,17 +2860,29 @@ class Bus:
 
             # snapshot under the lock (see _handle_publish)
             with self._pubsub_lock:
-                callables = [
-                    callback.callable
-                    for callback in self._callbacks.get(event_id, {}).values()
-                ]
+                callbacks = list(self._callbacks.get(event_id, {}).values())
+
+            for callback in callbacks:
+                if event.callbacks is not None and callback.id not in event.callbacks:
+                    # held back by its filter on the publisher
+                    continue
+
+                if callback.conflator is not None:
+                    callback.conflator.offer(event, self._handler_pool.submit)
+                    continue
 
-            for callable in callables:
+                callable = callback.callable
                 # exceptions inside event handlers are invisible to the
                 # publisher: observe them via a (free) done-callback instead
                 # of burning a second pool task on it
                 event_future = self._handler_pool.submit(
-                    callable, *event.args, **event.kwargs
+                    tracing.run,
+                    event.trace,
+                    event.event,
+                    "event",
+                    callable,
+                    *event.args,
+                    **event.kwargs,
                 )
                 event_future.add_done_callback(self._log_event_result(event))
         except Exception:
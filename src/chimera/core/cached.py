@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: 2026-present Paulo Henrique Silva <ph.silva@gmail.com>
+
+
+import functools
+import threading
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from chimera.core.constants import (
+    CACHED_ATTRIBUTE_NAME,
+    MEMOIZE_ATTRIBUTE_NAME,
+    MEMOS_ATTRIBUTE_NAME,
+)
+
+__all__ = ["cached", "memoize", "forget_memos", "ResultCache", "call_key"]
+
+
+def cached(method: Callable[..., Any]):
+    """
+    Cached annotation.
+
+    The result of a call is reused for the same arguments until the object
+    configuration changes, on the object itself and in the proxies to it.
+    Only for methods whose answer depends on nothing but the configuration
+    (capabilities, sizes, lists of modes). Overrides in subclasses stay
+    cached. None is never kept: it is what the interface placeholders
+    answer before a driver is connected. Callers must treat the results as
+    read-only; proxies hand each caller its own copy.
+    """
+
+    setattr(method, CACHED_ATTRIBUTE_NAME, True)
+    return method
+
+
+def memoize(*keys: str):
+    """
+    Memoize annotation, as @memoize("key", ...).
+
+    The result of a call is reused for the same arguments until one of the
+    named config keys changes: for values derived from a few options that
+    are needed over and over (a WCS rotation for every frame, limits for
+    every slew). Local to the object, unlike @cached: proxies do not see
+    it. As with @cached, None is not kept. Callers must treat the results
+    as read-only.
+    """
+
+    depends = frozenset(keys)
+
+    def decorator(method: Callable[..., Any]):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any):
+            memos = self.__dict__.setdefault(MEMOS_ATTRIBUTE_NAME, {})
+            memo = memos.get(name)
+            if memo is None:
+                # a misspelled key would never invalidate anything
+                for key in depends:
+                    self.__config_proxy__[key]
+                memo = memos.setdefault(name, (depends, ResultCache()))
+            cache = memo[1]
+
+            key = call_key(name, args, kwargs)
+            if key is None:
+                return method(self, *args, **kwargs)
+
+            hit, result, generation = cache.get(key)
+            if hit:
+                return result
+            result = method(self, *args, **kwargs)
+            cache.put(key, result, generation)
+            return result
+
+        setattr(wrapper, MEMOIZE_ATTRIBUTE_NAME, depends)
+        return wrapper
+
+    return decorator
+
+
+def forget_memos(instance: Any, keys: Iterable[str]) -> None:
+    """Drop the @memoize results of instance that depend on any of keys."""
+    keys = set(keys)
+    for depends, cache in list(
+        instance.__dict__.get(MEMOS_ATTRIBUTE_NAME, {}).values()
+    ):
+        if keys & depends:
+            cache.invalidate()
+
+
+def call_key(
+    method: str, args: tuple[Any, ...] | list[Any], kwargs: dict[str, Any]
+) -> Hashable | None:
+    """What identifies a call in a ResultCache; None if its arguments are
+    not hashable (such calls are never cached)."""
+    key = (method, tuple(args), tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class ResultCache:
+    """Results by call key, dropped all at once by invalidate(). A result
+    computed while an invalidation happened is not stored: it may come from
+    the old configuration. Neither is None, which usually means "not known
+    yet" (a placeholder, a driver still connecting)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: dict[Hashable, Any] = {}
+        self._generation = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any, int]:
+        """(hit, result, generation): pass the generation to put()."""
+        with self._lock:
+            if key in self._results:
+                return True, self._results[key], self._generation
+            return False, None, self._generation
+
+    def put(self, key: Hashable, result: Any, generation: int) -> None:
+        with self._lock:
+            if result is not None and generation == self._generation:
+                self._results[key] = result
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> None:
+        # any signature: also used as an event callback
+        with self._lock:
+            self._results.clear()
+            self._generation += 1
+
+    def __len__(self) -> int:
+        return len(self._results)
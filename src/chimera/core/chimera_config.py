@@ -85,6 +85,13 @@ class ChimeraConfig:
     type: ChimeraObject type
     host: where this object is/or will be located.
     port: port where to find the object on the given host
+    isolated: run the object in a child process of its own (true/false),
+              for CPU-heavy drivers and controllers; see chimera.core.worker
+
+    The chimera section takes the manager host and port, and scheduler:
+    true (or a number of worker threads) runs the control loops of every
+    object on one shared scheduler instead of a thread each; objects whose
+    control() blocks set own_thread: true. See chimera.core.scheduler.
 
     For special shortcuts the type would be guessed, so the folling
     two entries are equivalent:
@@ -124,9 +131,14 @@ class ChimeraConfig:
         self.sites: dict[URL, Any] = {}
         self.instruments: dict[URL, Any] = {}
         self.controllers: dict[URL, Any] = {}
+        # objects to run in a child process of their own
+        self.isolated: set[URL] = set()
 
         self.host = MANAGER_DEFAULT_HOST
         self.port = MANAGER_DEFAULT_PORT
+        # control loops on a shared scheduler (see Manager): a bool, or
+        # its number of workers
+        self.scheduler: bool | int = False
 
         self._parse(text, decoder)
 
@@ -139,6 +151,7 @@ class ChimeraConfig:
 
         self.host = chimera_config.get("host", MANAGER_DEFAULT_HOST)
         self.port = chimera_config.get("port", MANAGER_DEFAULT_PORT)
+        self.scheduler = chimera_config.get("scheduler", False)
 
         site_config = config.pop("site", {})
         # FIXME: raise and let user fix it
@@ -169,6 +182,9 @@ class ChimeraConfig:
         port = config.pop("port", self.port)
         cls = config.pop("type")
         name = config.pop("name")
+        isolated = config.pop("isolated", False)
 
         url = parse_url(f"tcp://{host}:{port}/{cls}/{name}")
+        if isolated:
+            self.isolated.add(url)
         return url, config
@@ -4,17 +4,26 @@
 import logging
 import threading
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
-from chimera.core.bus import Bus
+from chimera.core.bus import Bus, Dispatch
+from chimera.core.cached import ResultCache, forget_memos
 from chimera.core.config import Config
 from chimera.core.constants import (
+    CACHED_METHODS_ATTRIBUTE_NAME,
     CONFIG_PROXY_NAME,
+    DISPATCH_ATTRIBUTE_NAME,
+    EVENT_HISTORY_CONFIG_ATTRIBUTE_NAME,
     EVENTS_ATTRIBUTE_NAME,
     INSTANCE_MONITOR_ATTRIBUTE_NAME,
     METHODS_ATTRIBUTE_NAME,
+    RESULT_CACHE_ATTRIBUTE_NAME,
     RWLOCK_ATTRIBUTE_NAME,
+    STREAM_METHODS_ATTRIBUTE_NAME,
 )
+from chimera.core.event import event
 from chimera.core.exceptions import ObjectNotFoundException
 from chimera.core.metaobject import MetaObject
 from chimera.core.proxy import Proxy
@@ -29,13 +38,33 @@ if TYPE_CHECKING:
 __all__ = ["ChimeraObject"]
 
 
+def _changed(old, new) -> bool:
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except Exception:
+        # no (or no boolean) comparison: assume the worst
+        return True
+
+
 class ChimeraObject(ILifeCycle, metaclass=MetaObject):
+    __config__ = {
+        # events to keep a history of, overriding @event(history=N):
+        # {event name: N}, 0 keeps none
+        "event_history": {},
+        # run control() on a thread of its own even when the Manager runs
+        # loops on its shared scheduler: for loops that block for real
+        "own_thread": False,
+    }
+
     def __init__(self):
         super().__init__()
 
         # per-instance locks: the monitor serializes @lock methods and the
-        # rwlock guards config access. They must not live in the class dict —
-        # two instances of the same driver would block each other
+        # rwlock config changes (reads take no lock, see __getitem__). They
+        # must not live in the class dict — two instances of the same driver
+        # would block each other
         setattr(
             self,
             INSTANCE_MONITOR_ATTRIBUTE_NAME,
@@ -43,8 +72,12 @@ class ChimeraObject(ILifeCycle, metaclass=MetaObject):
         )
         setattr(self, RWLOCK_ATTRIBUTE_NAME, ReadWriteLock())
 
+        # results of @cached methods, until the config changes
+        setattr(self, RESULT_CACHE_ATTRIBUTE_NAME, ResultCache())
+
         # configuration handling
         self.__config_proxy__ = Config(self)
+        self.__event_history_changed__()
 
         self.__state__ = State.STOPPED
 
@@ -70,37 +103,82 @@ class ChimeraObject(ILifeCycle, metaclass=MetaObject):
 
     # config implementation
     def __getitem__(self, item):
-        # any thread can read if none writing at the time
-        lock = getattr(self, RWLOCK_ATTRIBUTE_NAME)
+        # no lock: writers swap in a new snapshot (see Config). Hot paths
+        # (control loops, per-frame metadata) read config constantly
         try:
-            lock.acquire_read()
-            return self.__config_proxy__.__getitem__(item)
-        finally:
-            lock.release()
+            return self.__config_proxy__.snapshot[item]
+        except KeyError:
+            # the error Config raises
+            return self.__config_proxy__[item]
 
     def __setitem__(self, item, value):
         # only one thread can write
         lock = getattr(self, RWLOCK_ATTRIBUTE_NAME)
+        lock.acquire_write()
+        before = self.__config_proxy__.frozen
         try:
-            lock.acquire_write()
             return self.__config_proxy__.__setitem__(item, value)
         finally:
+            after, version = (
+                self.__config_proxy__.frozen,
+                self.__config_proxy__.version,
+            )
             lock.release()
+            self.__config_changed__(before, after, version)
 
     # bulk configuration (pass a dict to config multiple values)
     def __iadd__(self, config_dict):
         # only one thread can write
         lock = getattr(self, RWLOCK_ATTRIBUTE_NAME)
         lock.acquire_write()
+        before = self.__config_proxy__.frozen
         try:
             # no return inside finally: it would swallow any exception
             # raised while applying the config (M2)
             self.__config_proxy__.__iadd__(config_dict)
         finally:
+            after, version = (
+                self.__config_proxy__.frozen,
+                self.__config_proxy__.version,
+            )
             lock.release()
+            self.__config_changed__(before, after, version)
 
         return self.get_proxy()
 
+    def __config_changed__(self, before, after, version):
+        # compared, not taken from the request: a failed bulk update may
+        # have applied in part, and rewriting a value changes nothing
+        keys = [key for key, value in after.items() if _changed(before[key], value)]
+        if not keys:
+            return
+
+        getattr(self, RESULT_CACHE_ATTRIBUTE_NAME).invalidate()
+        forget_memos(self, keys)
+        if "event_history" in keys:
+            self.__event_history_changed__()
+
+        # objects being configured before the Manager connects them have
+        # no listeners yet
+        if getattr(self, "__bus__", None) is not None:
+            self.config_changed(keys, version)
+
+    def __event_history_changed__(self):
+        # every published event looks it up
+        setattr(
+            self,
+            EVENT_HISTORY_CONFIG_ATTRIBUTE_NAME,
+            {name: int(n) for name, n in self["event_history"].items()},
+        )
+
+    @event
+    def config_changed(self, keys: list[str], version: int):
+        """
+        The options named in keys changed, leaving the config at version
+        (see Config.version). Proxies memoizing @cached results listen to
+        it.
+        """
+
     # locking
     def __enter__(self):
         return getattr(self, INSTANCE_MONITOR_ATTRIBUTE_NAME).__enter__()
@@ -130,9 +208,28 @@ class ChimeraObject(ILifeCycle, metaclass=MetaObject):
     def __get_methods__(self):
         return getattr(self, METHODS_ATTRIBUTE_NAME)
 
+    def __get_cached__(self):
+        return getattr(self, CACHED_METHODS_ATTRIBUTE_NAME)
+
+    def __get_streams__(self):
+        return getattr(self, STREAM_METHODS_ATTRIBUTE_NAME)
+
     def __get_config__(self):
         return list(getattr(self, CONFIG_PROXY_NAME).items())
 
+    def __dispatch_table__(self) -> Mapping[str, Dispatch]:
+        """Every method the bus routes to this object, bound once and with
+        its routing flags, by name. Built by the Manager when the object is
+        added; methods attached later are found the slow way."""
+        table = {
+            name: Dispatch(getattr(self, name), *flags)
+            for name, flags in getattr(type(self), DISPATCH_ATTRIBUTE_NAME).items()
+        }
+        # config access through proxies
+        for name in ("__getitem__", "__setitem__", "__iadd__"):
+            table[name] = Dispatch(getattr(self, name))
+        return MappingProxyType(table)
+
     def __start__(self): ...
 
     def __stop__(self): ...
@@ -0,0 +1,167 @@
+import struct
+import sys
+from collections.abc import Iterable
+from typing import Any
+
+import msgspec
+
+from chimera.core.protocol import Messages
+
+__all__ = ["Codec", "JSON", "MSGPACK", "CODECS", "check", "detect", "negotiate"]
+
+# msgpack extension code for NumPy arrays. The extension payload is an
+# out-of-band binary frame: a little-endian u16 header length, a msgpack
+# (descr, shape) header and then the raw C-ordered array bytes
+EXT_NDARRAY = 1
+_NDARRAY_HEADER_LENGTH = struct.Struct("<H")
+
+
+def _numpy():
+    # numpy is only looked up, never imported, on the encode side: if nobody
+    # imported it, no value can be an array (keeps the bus import light)
+    return sys.modules.get("numpy")
+
+
+def _unsupported(obj: Any) -> NotImplementedError:
+    return NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+def _ndarray_to_ext(array: Any) -> msgspec.msgpack.Ext:
+    np = _numpy()
+    if array.dtype.hasobject:
+        raise _unsupported(array)
+
+    header = msgspec.msgpack.encode(
+        (np.lib.format.dtype_to_descr(array.dtype), array.shape)
+    )
+    # the data is copied twice on the send side: here, as an Ext payload
+    # is one buffer and the header travels with the data, then by msgspec
+    # into the encoded message. ascontiguousarray is a no-op for C-ordered
+    # input (one more copy otherwise); it makes 0-d arrays 1-d
+    array = np.ascontiguousarray(array)
+    frame = bytearray(_NDARRAY_HEADER_LENGTH.pack(len(header)))
+    frame += header
+    frame += array.reshape(-1).view(np.uint8).data
+    return msgspec.msgpack.Ext(EXT_NDARRAY, frame)
+
+
+def _ext_to_ndarray(code: int, data: memoryview) -> Any:
+    if code != EXT_NDARRAY:
+        raise NotImplementedError(f"unknown msgpack extension type {code}")
+
+    import numpy as np
+
+    (length,) = _NDARRAY_HEADER_LENGTH.unpack_from(data)
+    offset = _NDARRAY_HEADER_LENGTH.size + length
+    descr, shape = msgspec.msgpack.decode(data[_NDARRAY_HEADER_LENGTH.size : offset])
+    if isinstance(descr, list):
+        # structured dtypes: msgpack has no tuples
+        descr = [tuple(field) for field in descr]
+
+    # a read-only view over the received frame: no copy on the receive side
+    return np.frombuffer(
+        data[offset:], dtype=np.lib.format.descr_to_dtype(descr)
+    ).reshape(shape)
+
+
+def _msgpack_enc_hook(obj: Any) -> Any:
+    np = _numpy()
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            return _ndarray_to_ext(obj)
+        if isinstance(obj, np.generic):
+            return obj.item()
+    raise _unsupported(obj)
+
+
+def _json_enc_hook(obj: Any) -> Any:
+    # JSON has no binary frames: arrays degrade to nested lists, which is
+    # all a JSON-only (older) peer could ever have handled
+    np = _numpy()
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                raise _unsupported(obj)
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+    raise _unsupported(obj)
+
+
+def _check_enc_hook(obj: Any) -> Any:
+    # validation only: stands in for arrays without touching their data
+    np = _numpy()
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                raise _unsupported(obj)
+            return None
+        if isinstance(obj, np.generic):
+            return obj.item()
+    raise _unsupported(obj)
+
+
+class Codec:
+    """A wire format for bus messages: one thread-safe encoder/decoder pair
+    over the same Messages tagged union."""
+
+    def __init__(self, name: str, encoder: Any, decoder: Any):
+        self.name = name
+        self._encoder = encoder
+        self._decoder = decoder
+
+    def encode(self, message: Messages) -> bytes:
+        return self._encoder.encode(message)
+
+    def decode(self, data: bytes) -> Messages:
+        return self._decoder.decode(data)
+
+    def __repr__(self) -> str:
+        return f"<Codec {self.name}>"
+
+
+JSON = Codec(
+    "json",
+    msgspec.json.Encoder(enc_hook=_json_enc_hook),
+    msgspec.json.Decoder(Messages),
+)
+MSGPACK = Codec(
+    "msgpack",
+    msgspec.msgpack.Encoder(enc_hook=_msgpack_enc_hook),
+    msgspec.msgpack.Decoder(Messages, ext_hook=_ext_to_ndarray),
+)
+
+# every codec this build can speak, keyed by its wire name
+CODECS: dict[str, Codec] = {codec.name: codec for codec in (MSGPACK, JSON)}
+
+
+_checker = msgspec.msgpack.Encoder(enc_hook=_check_enc_hook)
+
+
+def check(message: Messages) -> None:
+    """Raise if message could not be encoded for a remote bus. Used on the
+    local path, where messages are handed over as objects: array buffers are
+    validated but never copied."""
+    _checker.encode(message)
+
+
+def detect(data: bytes) -> Codec:
+    """The codec a received frame was encoded with. A message is always a
+    tagged struct: JSON frames start with '{', while msgpack encodes the
+    struct as a map (0x80-0x8f, 0xde, 0xdf) and can never start with 0x7b.
+    Sniffing lets a single inbound socket serve old JSON-only peers and
+    msgpack peers at the same time."""
+    if data[:1] == b"{":
+        return JSON
+    return MSGPACK
+
+
+def negotiate(offered: Iterable[str] | None, supported: Iterable[str]) -> str:
+    """Pick the codec for a peer: the first of our supported codecs (in our
+    preference order) that the peer offered. A peer that offered nothing
+    predates negotiation and only speaks JSON."""
+    offered = set(offered or ())
+    for name in supported:
+        if name in offered and name in CODECS:
+            return name
+    return JSON.name
@@ -2,8 +2,9 @@
 # SPDX-FileCopyrightText: 2006-present Paulo Henrique Silva <ph.silva@gmail.com>
 
 
+import copy
 import logging
-from types import NoneType
+from types import MappingProxyType, NoneType
 
 from chimera.core.exceptions import OptionConversionException
 from chimera.util.coord import Coord
@@ -331,13 +332,47 @@ class PositionChecker(Checker):
         return value
 
 
+def _copy(value):
+    # the other option types are replaced, never changed in place
+    if isinstance(value, dict | list | set):
+        return copy.deepcopy(value)
+    return value
+
+
 class Config:
+    """Options of an object, checked on the way in.
+
+    Readers see snapshot, an immutable copy of every value that each change
+    replaces as a whole: reading never needs a lock, and a reader sees all
+    of a bulk change or none of it. Writers must be serialized by the
+    caller (ChimeraObject holds its write lock). version counts the
+    changes, for caches to key on; it moves after the snapshot it stands
+    for is in place.
+
+    Mutable values (dicts, lists) are copied into each snapshot, so a
+    caller changing the object it passed in changes nothing here. Readers
+    may still change the copies they are given: frozen is one more copy,
+    that nobody outside sees, to tell what a change really changed.
+    """
+
     def __init__(self, obj):
         if isinstance(obj, dict):
             self._options = self._read_options(obj)
         else:
             self._options = self._read_options(obj.__config__)
 
+        self.snapshot, self.frozen = self._snapshot(), self._snapshot()
+        self.version = 0
+
+    def _snapshot(self):
+        return MappingProxyType(
+            {name: _copy(option.get()) for name, option in self._options.items()}
+        )
+
+    def _publish(self):
+        self.snapshot, self.frozen = self._snapshot(), self._snapshot()
+        self.version += 1
+
     def _read_options(self, opt):
         options = {}
 
@@ -409,19 +444,19 @@ class Config:
         return len(self._options)
 
     def __getitem__(self, name):
-        if not isinstance(name, str):
-            raise TypeError
-
-        if name in self:
-            return self._options[name].get()
-
-        else:
-            raise KeyError(f"invalid option: {name}.")
+        try:
+            return self.snapshot[name]
+        except KeyError:
+            if not isinstance(name, str):
+                raise TypeError from None
+            raise KeyError(f"invalid option: {name}.") from None
 
     def __setitem__(self, name, value):
         # if value exists, run template checker and set _config
         if name in self:
-            return self._options[name].set(value)
+            old_value = self._options[name].set(value)
+            self._publish()
+            return old_value
 
         # rant about invalid option
         else:
@@ -434,12 +469,10 @@ class Config:
         return self._options.__iter__()
 
     def iter_values(self):
-        for name in self._options:
-            yield self._options[name].get()
+        yield from self.snapshot.values()
 
     def iter_items(self):
-        for name in self._options:
-            yield (name, self._options[name].get())
+        yield from self.snapshot.items()
 
     def keys(self):
         return [key for key in self._options.keys()]
@@ -457,10 +490,14 @@ class Config:
         if isinstance(other, dict):
             other = Config(other)
 
-        for name, value in list(other._options.items()):
-            if name not in self._options:
-                raise KeyError(f"invalid option: {name}")
-
-            self._options[name] = value
+        try:
+            for name, value in list(other._options.items()):
+                if name not in self._options:
+                    raise KeyError(f"invalid option: {name}")
+
+                self._options[name] = value
+        finally:
+            # what applied before an error stays applied
+            self._publish()
 
         return self
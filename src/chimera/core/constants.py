@@ -12,7 +12,10 @@ MANAGER_LOCATION = "/Manager/manager"
 
 # annotations
 EVENT_ATTRIBUTE_NAME = "__event__"
+EVENT_HISTORY_ATTRIBUTE_NAME = "__event_history__"
 LOCK_ATTRIBUTE_NAME = "__lock__"
+URGENT_ATTRIBUTE_NAME = "__urgent__"
+CACHED_ATTRIBUTE_NAME = "__chimera_cached__"
 
 # special propxies
 EVENTS_PROXY_NAME = "__events_proxy__"
@@ -21,11 +24,32 @@ CONFIG_PROXY_NAME = "__config_proxy__"
 # monitor objects
 INSTANCE_MONITOR_ATTRIBUTE_NAME = "__instance_monitor__"
 RWLOCK_ATTRIBUTE_NAME = "__rwlock__"
+RESULT_CACHE_ATTRIBUTE_NAME = "__result_cache__"
 
 # reflection
 CONFIG_ATTRIBUTE_NAME = "__config__"
 EVENTS_ATTRIBUTE_NAME = "__events__"
 METHODS_ATTRIBUTE_NAME = "__methods__"
+# per class: method name -> (locked, urgent, event), for request routing
+DISPATCH_ATTRIBUTE_NAME = "__dispatch__"
+CACHED_METHODS_ATTRIBUTE_NAME = "__cached_methods__"
+
+# an object's generator methods: proxies iterate their results as they are
+# produced (see Bus.request_stream)
+STREAM_METHODS_ATTRIBUTE_NAME = "__stream_methods__"
+
+# published by every object when its config changes, as (keys, version):
+# clears @cached results memoized by proxies
+CONFIG_CHANGED_EVENT_NAME = "config_changed"
+
+# per instance: the "event_history" config, as {event name: N}, kept out of
+# the publish path (read when it changes)
+EVENT_HISTORY_CONFIG_ATTRIBUTE_NAME = "__event_history_config__"
+
+# per instance: @memoize results, by method name
+MEMOS_ATTRIBUTE_NAME = "__memos__"
+# on a @memoize method: the config keys its result depends on
+MEMOIZE_ATTRIBUTE_NAME = "__memoize__"
 
 TRACEBACK_ATTRIBUTE = "__chimera_traceback__"
 
@@ -5,15 +5,27 @@
 from collections.abc import Callable
 from typing import Any
 
-from chimera.core.constants import EVENT_ATTRIBUTE_NAME
+from chimera.core.constants import EVENT_ATTRIBUTE_NAME, EVENT_HISTORY_ATTRIBUTE_NAME
 
 __all__ = ["event"]
 
 
-def event(method: Callable[..., Any]):
+def event(method: Callable[..., Any] | None = None, *, history: int = 0):
     """
-    Event annotation.
+    Event annotation, as @event or @event(history=N).
+
+    With history, the publisher's bus keeps the latest N events so late
+    subscribers can have them replayed at once (subscribe(replay=...))
+    instead of polling for the current state. The "event_history" config
+    option ({event name: N}) overrides it per object.
     """
 
-    setattr(method, EVENT_ATTRIBUTE_NAME, True)
-    return method
+    def annotate(method: Callable[..., Any]):
+        setattr(method, EVENT_ATTRIBUTE_NAME, True)
+        if history:
+            setattr(method, EVENT_HISTORY_ATTRIBUTE_NAME, history)
+        return method
+
+    if method is None:
+        return annotate
+    return annotate(method)
@@ -5,9 +5,9 @@
 from collections.abc import Callable
 from typing import Any
 
-from chimera.core.constants import LOCK_ATTRIBUTE_NAME
+from chimera.core.constants import LOCK_ATTRIBUTE_NAME, URGENT_ATTRIBUTE_NAME
 
-__all__ = ["lock"]
+__all__ = ["lock", "urgent"]
 
 
 def lock(method: Callable[..., Any]):
@@ -17,3 +17,17 @@ def lock(method: Callable[..., Any]):
 
     setattr(method, LOCK_ATTRIBUTE_NAME, True)
     return method
+
+
+def urgent(method: Callable[..., Any]):
+    """
+    Priority annotation for locked methods (implies @lock).
+
+    Bus requests for an urgent method go ahead of every request already
+    queued for the object and are never rejected for a full queue. They
+    still wait for the locked method running right now.
+    """
+
+    setattr(method, LOCK_ATTRIBUTE_NAME, True)
+    setattr(method, URGENT_ATTRIBUTE_NAME, True)
+    return method
@@ -8,10 +8,10 @@ import os
 import sys
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any
 
-from chimera.core.bus import Bus, pool_stats
+from chimera.core.bus import Bus, Dispatch, pool_stats
 from chimera.core.chimeraobject import ChimeraObject
 from chimera.core.classloader import ClassLoader
 from chimera.core.constants import (
@@ -28,11 +28,13 @@ from chimera.core.exceptions import (
     OptionConversionException,
 )
 from chimera.core.proxy import Proxy
-from chimera.core.resources import ResourcesManager
+from chimera.core.resources import Resource, ResourcesManager
+from chimera.core.scheduler import LoopScheduler
 from chimera.core.site import Site
 from chimera.core.state import State
 from chimera.core.url import URL, parse_url, resolve_url
 from chimera.core.version import chimera_version
+from chimera.core.worker import Worker
 
 __all__ = ["Manager", "get_manager_uri", "ManagerNotFoundException"]
 
@@ -69,7 +71,11 @@ class Manager:
     @group Shutdown: wait, shutdown
     """
 
-    def __init__(self, bus: Bus, site: Site | None = None):
+    def __init__(
+        self, bus: Bus, site: Site | None = None, scheduler: bool | int = False
+    ):
+        """scheduler runs control loops on a shared LoopScheduler (with that
+        many workers if an int) instead of a thread per object."""
         log.info("Starting manager.")
 
         self._bus = bus
@@ -78,11 +84,20 @@ class Manager:
         self.site = site
 
         self.resources = ResourcesManager()
+        # by object path, see ChimeraObject.__dispatch_table__
+        self._dispatch: dict[str, Mapping[str, Dispatch]] = {}
         self.class_loader = ClassLoader()
         self._pool = concurrent.futures.ThreadPoolExecutor(
             thread_name_prefix=f"{self._bus.url.bus}/Manager-"
         )
 
+        self._scheduler: LoopScheduler | None = None
+        if scheduler:
+            workers = 4 if scheduler is True else int(scheduler)
+            self._scheduler = LoopScheduler(
+                workers, name=f"{self._bus.url.bus}/Manager-loops"
+            )
+
         # shutdown event
         self.died = threading.Event()
 
@@ -97,10 +112,25 @@ class Manager:
     def _resolve_request(
         self, object: str, method: str
     ) -> tuple[str | None, Callable[..., Any] | None]:
+        # the common case: a proxy calling by the path it resolved
+        table = self._dispatch.get(object)
+        if table is not None:
+            dispatch = table.get(method)
+            if dispatch is not None:
+                return object, dispatch
+
         resource = self.resources.get(object)
         if not resource:
             return None, None
 
+        table = self._dispatch.get(resource.path)
+        if table is not None and method in table:
+            return resource.path, table[method]
+
+        if resource.worker is not None and not resource.worker.alive():
+            # stopped, or being restarted: nothing would answer
+            return resource.path, None
+
         instance = resource.instance
         method_getter = operator.attrgetter(method)
 
@@ -125,6 +155,16 @@ class Manager:
         except ValueError as e:
             raise InvalidLocationException(f"invalid location '{location}': {e}")
 
+    def _scheduled(self, instance: ChimeraObject) -> bool:
+        """Whether instance's control loop goes to the shared scheduler: not
+        when it asks for a thread of its own, nor when it replaces __main__
+        (the scheduler only knows how to call control())."""
+        return (
+            self._scheduler is not None
+            and type(instance).__main__ is ChimeraObject.__main__
+            and not instance["own_thread"]
+        )
+
     @staticmethod
     def _log_loop_result(location: str) -> Callable[[concurrent.futures.Future], None]:
         def check(future: concurrent.futures.Future) -> None:
@@ -161,6 +201,10 @@ class Manager:
 
         objects = []
         for _, resource in list(self.resources.items()):
+            if resource.worker is not None:
+                objects.append(self._isolated_status(resource, now))
+                continue
+
             instance = resource.instance
 
             state = None
@@ -205,9 +249,43 @@ class Manager:
             "bus": self._bus.stats(),
             # the control-loops pool (one worker per running object loop)
             "pool": pool_stats(self._pool),
+            # loops on the shared scheduler: jitter and overruns per object
+            "scheduler": self._scheduler.stats() if self._scheduler else None,
             "objects": objects,
+            "metrics": self._bus.metrics.snapshot(),
         }
 
+    def _isolated_status(self, resource: Resource, now: float) -> dict[str, Any]:
+        worker = resource.worker
+        assert worker is not None
+
+        state = None
+        if worker.alive():
+            try:
+                state = str(Proxy(worker.url, self._bus, 2.0).get_state())
+            except Exception:
+                pass
+
+        return {
+            "path": resource.path,
+            "class": resource.cls,
+            "bases": resource.bases,
+            "state": state,
+            "loop": "running" if worker.alive() else "none",
+            "loop_id": None,
+            "age": now - resource.created,
+            # lives in the child: ask it with chimera-ctl on worker["url"]
+            "config": {},
+            "worker": worker.stats(),
+        }
+
+    def get_metrics(self, prometheus: bool = False) -> dict[str, Any] | str:
+        """Bus latency histograms and counters per object and method, as
+        in get_status(), or as a Prometheus text exposition dump."""
+        if prometheus:
+            return self._bus.metrics.prometheus()
+        return self._bus.metrics.snapshot()
+
     # reflection (console)
     def get_resources(self) -> list[str]:
         """
@@ -289,6 +367,8 @@ class Manager:
 
         # every control loop stopped above: drain the pool
         self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._scheduler is not None:
+            self._scheduler.shutdown()
 
         # die!
         self.died.set()
@@ -302,6 +382,7 @@ class Manager:
         *,
         config: dict[str, Any] | None = None,
         start: bool = True,
+        isolated: bool = False,
     ):
         """
         Add the class pointed by 'location' to the system configuring it
@@ -313,6 +394,9 @@ class Manager:
         @param start: start the object after initialization.
         @type start: bool
 
+        @param isolated: run the object in a child process (see add_class).
+        @type isolated: bool
+
         @raises ChimeraObjectException: Internal error on managed (user) object.
         @raises ClassLoaderException: Class not found.
         @raises NotValidChimeraObjectException: When an object which doesn't
@@ -326,7 +410,9 @@ class Manager:
         # get the class
         location = self._resolve_location(location)
         cls = self.class_loader.load_class(location.cls, path)
-        return self.add_class(cls, location.name, config or {}, start)
+        return self.add_class(
+            cls, location.name, config or {}, start, isolated=isolated
+        )
 
     def add_class(
         self,
@@ -334,6 +420,8 @@ class Manager:
         name: str,
         config: dict[str, Any] | None = None,
         start: bool = True,
+        *,
+        isolated: bool = False,
     ):
         """
         Add the class 'cls' to the system configuring it using 'config'.
@@ -350,6 +438,10 @@ class Manager:
         @param start: start the object after initialization.
         @type start: bool
 
+        @param isolated: run the object in a child process with a bus of its
+                         own (see chimera.core.worker), restarted if it dies.
+        @type isolated: bool
+
         @raises ChimeraObjectException: Internal error on managed (user) object.
         @raises NotValidChimeraObjectException: When an object which doesn't inherit from ChimeraObject is given in location.
         @raises InvalidLocationException: When the requested location s invalid.
@@ -364,6 +456,9 @@ class Manager:
                 f"Cannot add the class {cls.__name__}. It doesn't descend from ChimeraObject."
             )
 
+        if isolated:
+            return self._add_isolated(cls, name, config, start)
+
         # run object __init__ and configure using location configuration
         # it runs on the same thread, so be a good boy
         # and don't block manager's thread
@@ -411,18 +506,7 @@ class Manager:
                 f"Cannot add {obj!r}. It doesn't descend from ChimeraObject."
             )
 
-        url = self._resolve_location(f"/{type(obj).__name__}/{name}")
-
-        # names must not start with a digit
-        if url.name[0] in "0123456789":
-            raise InvalidLocationException(
-                f"Invalid instance name: {url.name} (must start with a letter)"
-            )
-
-        if url.path in self.resources:
-            raise InvalidLocationException(
-                f"Location {url.path} is already in the system. Only one allowed (Tip: change the name!)."
-            )
+        url = self._new_location(type(obj), name)
 
         try:
             for k, v in list((config or {}).items()):
@@ -436,12 +520,56 @@ class Manager:
         obj.__bus__ = self._bus
         obj.__site__ = self.site
         self.resources.add(url.path, obj)
+        self._dispatch[url.path] = obj.__dispatch_table__()
+        # a cached miss (or another object's location) must not hide it
+        self._bus.forget_resolutions()
 
         if start:
             self.start(url.path)
 
         return Proxy(str(url), self._bus)
 
+    def _new_location(self, cls: type, name: str) -> URL:
+        url = self._resolve_location(f"/{cls.__name__}/{name}")
+
+        # names must not start with a digit
+        if url.name[0] in "0123456789":
+            raise InvalidLocationException(
+                f"Invalid instance name: {url.name} (must start with a letter)"
+            )
+
+        if url.path in self.resources:
+            raise InvalidLocationException(
+                f"Location {url.path} is already in the system. Only one allowed (Tip: change the name!)."
+            )
+
+        return url
+
+    def _add_isolated(
+        self,
+        cls: type,
+        name: str,
+        config: dict[str, Any] | None,
+        start: bool,
+    ):
+        url = self._new_location(cls, name)
+
+        site = f"/Site/{self.site['name']}" if self.site is not None else None
+        worker = Worker(cls, name, config, self._bus, site)
+        self.resources.add(url.path, worker.stand_in(), worker=worker)
+        self._bus.forget_resolutions()
+
+        if start:
+            try:
+                self.start(url.path)
+            except ChimeraObjectException:
+                # configuration and __start__ errors show up in the child:
+                # leave nothing behind, as add_object does on bad config
+                self.resources.remove(url.path)
+                raise
+
+        return Proxy(str(url), self._bus)
+
     def remove(self, location):
         """
         Remove the object pointed by 'location' from the system
@@ -462,7 +590,11 @@ class Manager:
         self.stop(location)
 
         # self.adapter.disconnect(resource.instance)
+        resource = self.resources.get(location)
+        if resource is not None:
+            self._dispatch.pop(resource.path, None)
         self.resources.remove(location)
+        self._bus.forget_resolutions()
 
         return True
 
@@ -487,6 +619,13 @@ class Manager:
 
         resource = self.resources.get(location)
 
+        if resource.worker is not None:
+            resource.worker.start()
+            resource.instance = resource.worker.stand_in()
+            self.resources.started(resource.path, bases=list(resource.worker.bases))
+            self._bus.forget_resolutions()
+            return True
+
         if resource.instance.get_state() == State.RUNNING:
             return True
 
@@ -500,12 +639,15 @@ class Manager:
             # ok, now schedule object main in a new thread
             log.info(f"Running {location}.__main___.")
 
-            loop = self._pool.submit(resource.instance.__main__)
+            if self._scheduled(resource.instance):
+                loop = self._scheduler.add(resource.path, resource.instance)
+            else:
+                loop = self._pool.submit(resource.instance.__main__)
             # a control loop dying with an exception must never be silent (M3)
             loop.add_done_callback(self._log_loop_result(str(location)))
 
             resource.instance.__setstate__(State.RUNNING)
-            resource.created = time.time()
+            self.resources.started(resource.path)
             resource.loop = loop
 
             return True
@@ -536,10 +678,16 @@ class Manager:
 
         resource = self.resources.get(location)
 
+        if resource.worker is not None:
+            resource.worker.stop()
+            return True
+
         try:
             # stop control loop
             if resource.loop:
                 resource.instance.__abort_loop__()
+                if self._scheduler is not None:
+                    self._scheduler.remove(resource.path)
                 try:
                     resource.loop.cancel()
                 except KeyboardInterrupt:
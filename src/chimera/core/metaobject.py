@@ -1,15 +1,26 @@
 # SPDX-License-Identifier: GPL-2.0-or-later
 # SPDX-FileCopyrightText: 2006-present Paulo Henrique Silva <ph.silva@gmail.com>
+import inspect
 import logging
 from collections.abc import Callable
+from types import MappingProxyType
 
+from chimera.core.cached import call_key
 from chimera.core.constants import (
+    CACHED_ATTRIBUTE_NAME,
+    CACHED_METHODS_ATTRIBUTE_NAME,
     CONFIG_ATTRIBUTE_NAME,
+    DISPATCH_ATTRIBUTE_NAME,
     EVENT_ATTRIBUTE_NAME,
+    EVENT_HISTORY_ATTRIBUTE_NAME,
+    EVENT_HISTORY_CONFIG_ATTRIBUTE_NAME,
     EVENTS_ATTRIBUTE_NAME,
     INSTANCE_MONITOR_ATTRIBUTE_NAME,
     LOCK_ATTRIBUTE_NAME,
     METHODS_ATTRIBUTE_NAME,
+    RESULT_CACHE_ATTRIBUTE_NAME,
+    STREAM_METHODS_ATTRIBUTE_NAME,
+    URGENT_ATTRIBUTE_NAME,
 )
 
 # import chimera.core.log
@@ -105,17 +116,30 @@ class EventWrapperDispatcher(MethodWrapperDispatcher):
             event=self.wrapper.func.__name__,
             args=args[1:],
             kwargs=kwargs,
+            history=self._history(),
         )
 
+    def _history(self) -> int:
+        # @event(history=N), unless the object config says otherwise
+        history = getattr(self.func, EVENT_HISTORY_ATTRIBUTE_NAME, 0)
+        overrides = getattr(self.instance, EVENT_HISTORY_CONFIG_ATTRIBUTE_NAME, {})
+        return overrides.get(self.func.__name__, history)
+
     def __iadd__(self, other):
+        self.subscribe(other)
+        return self
+
+    def subscribe(self, callback, conflate=False, filter=None, replay=0):
         # the object subscribing to its own event: it is both ends
         self.instance.__bus__.subscribe(
             sub=self.instance.get_location(),
             pub=self.instance.get_location(),
             event=self.func.__name__,
-            callback=other,
+            callback=callback,
+            conflate=conflate,
+            filter=filter,
+            replay=replay,
         )
-        return self
 
     def __isub__(self, other):
         self.instance.__bus__.unsubscribe(
@@ -154,6 +178,47 @@ class LockWrapperDispatcher(MethodWrapperDispatcher):
         return ret
 
 
+class CachedWrapperDispatcher(MethodWrapperDispatcher):
+    def __init__(self, wrapper, instance, cls):
+        MethodWrapperDispatcher.__init__(self, wrapper, instance, cls)
+
+    def call(self, *args, **kwargs):
+        """
+        @cached methods answer from the instance result cache, cleared when
+        the config changes. A method both @cached and @lock takes the
+        monitor only to compute a missing result.
+        """
+
+        cache = getattr(args[0], RESULT_CACHE_ATTRIBUTE_NAME, None)
+        key = call_key(self.func.__name__, args[1:], kwargs)
+        if cache is None or key is None:
+            return self._compute(*args, **kwargs)
+
+        hit, result, generation = cache.get(key)
+        if hit:
+            return result
+
+        result = self._compute(*args, **kwargs)
+        cache.put(key, result, generation)
+        return result
+
+    def _compute(self, *args, **kwargs):
+        if hasattr(self.func, LOCK_ATTRIBUTE_NAME):
+            with getattr(args[0], INSTANCE_MONITOR_ATTRIBUTE_NAME):
+                return self.func(*args, **kwargs)
+        return self.func(*args, **kwargs)
+
+
+def _routing_flags(func: Callable[..., None]) -> tuple[bool, bool, bool]:
+    """(locked, urgent, event). `is True` defends against mock
+    auto-attributes in tests."""
+    return (
+        getattr(func, LOCK_ATTRIBUTE_NAME, False) is True,
+        getattr(func, URGENT_ATTRIBUTE_NAME, False) is True,
+        getattr(func, EVENT_ATTRIBUTE_NAME, False) is True,
+    )
+
+
 class MetaObject(type):
     def __new__(cls, clsname, bases, _dict):
         # join __config__ dicts, class configuration override base classes
@@ -176,13 +241,42 @@ class MetaObject(type):
         events = []
         methods = []
 
+        # @cached is part of a method's contract: overrides stay cached
+        cached = {
+            name
+            for base in bases
+            for name in getattr(base, CACHED_METHODS_ATTRIBUTE_NAME, ())
+        }
+
+        # generator methods: their items are streamed to remote callers
+        streams = {
+            name
+            for base in bases
+            for name in getattr(base, STREAM_METHODS_ATTRIBUTE_NAME, ())
+        }
+
         for name, obj in _dict.items():
             if hasattr(obj, "__call__") and not name.startswith("_"):
+                if name in cached and not hasattr(obj, EVENT_ATTRIBUTE_NAME):
+                    setattr(obj, CACHED_ATTRIBUTE_NAME, True)
+
+                if inspect.isgeneratorfunction(obj):
+                    streams.add(name)
+                else:
+                    streams.discard(name)
+
                 # events
                 if hasattr(obj, EVENT_ATTRIBUTE_NAME):
                     _dict[name] = MethodWrapper(obj, dispatcher=EventWrapperDispatcher)
                     events.append(name)
 
+                # @cached methods (locked or not): results are reused until
+                # the config changes, see ChimeraObject.__setitem__
+                elif hasattr(obj, CACHED_ATTRIBUTE_NAME):
+                    _dict[name] = MethodWrapper(obj, dispatcher=CachedWrapperDispatcher)
+                    methods.append(name)
+                    cached.add(name)
+
                 # @lock methods: the marker on the raw function (the
                 # wrapper's .func) routes bus requests through a per-object
                 # FIFO lane, and the dispatcher takes the instance monitor so
@@ -202,9 +296,28 @@ class MetaObject(type):
         # to Console)
         _dict[EVENTS_ATTRIBUTE_NAME] = events
         _dict[METHODS_ATTRIBUTE_NAME] = methods
+        _dict[CACHED_METHODS_ATTRIBUTE_NAME] = sorted(cached)
+        _dict[STREAM_METHODS_ATTRIBUTE_NAME] = sorted(streams)
 
         # NOTE: the instance monitor and config rwlock are created per
         # instance in ChimeraObject.__init__ — class-level locks made two
         # instances of the same driver block each other
 
-        return super().__new__(cls, clsname, bases, _dict)
+        new = super().__new__(cls, clsname, bases, _dict)
+
+        # how the bus routes each method, as resolved through the MRO: found
+        # once here instead of on every request (see
+        # ChimeraObject.__dispatch_table__)
+        names = {
+            name
+            for klass in new.__mro__
+            for attribute in (METHODS_ATTRIBUTE_NAME, EVENTS_ATTRIBUTE_NAME)
+            for name in vars(klass).get(attribute, ())
+        }
+        dispatch = {}
+        for name in sorted(names):
+            wrapper = inspect.getattr_static(new, name)
+            dispatch[name] = _routing_flags(getattr(wrapper, "func", wrapper))
+        setattr(new, DISPATCH_ATTRIBUTE_NAME, MappingProxyType(dispatch))
+
+        return new
@@ -0,0 +1,164 @@
+import bisect
+import threading
+from typing import Any
+
+__all__ = ["BUCKETS", "STAGES", "Histogram", "Metrics"]
+
+# histogram bucket upper bounds, in seconds: 50us (a local call) up to a
+# minute (a slew); anything slower lands in the implicit +Inf bucket
+BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# where a request spends its time, in order. Server side: inbox to routing
+# (dispatch), waiting for a handler thread (pool_wait) or for the object's
+# locked-method lane (lane_wait, urgent_wait for @urgent methods), the
+# method itself (execute) and handing the response back to the bus (reply).
+# Client side: the whole round trip.
+STAGES = (
+    "dispatch",
+    "pool_wait",
+    "lane_wait",
+    "urgent_wait",
+    "execute",
+    "reply",
+    "round_trip",
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram: observing is a bisect and three
+    additions, memory does not grow with the number of samples."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (the max for
+        the +Inf bucket): coarse, but never an underestimate."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return BUCKETS[index] if index < len(BUCKETS) else self.max
+        return self.max
+
+
+class Metrics:
+    """Per (stage, path, method) latency histograms and per (name, path,
+    method) counters of one bus. Thread-safe; snapshot() is JSON-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str, str], Histogram] = {}
+        self._counters: dict[tuple[str, str, str], int] = {}
+
+    def observe(self, stage: str, path: str, method: str, seconds: float) -> None:
+        key = (stage, path, method)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name: str, path: str, method: str, n: int = 1) -> None:
+        key = (name, path, method)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + n
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            histograms = [
+                {
+                    "stage": stage,
+                    "path": path,
+                    "method": method,
+                    "count": h.count,
+                    "sum": h.sum,
+                    "max": h.max,
+                    "p50": h.quantile(0.5),
+                    "p90": h.quantile(0.9),
+                    "p99": h.quantile(0.99),
+                    "buckets": list(h.counts),
+                }
+                for (stage, path, method), h in self._histograms.items()
+            ]
+            counters = [
+                {"name": name, "path": path, "method": method, "value": value}
+                for (name, path, method), value in self._counters.items()
+            ]
+        return {
+            "buckets": list(BUCKETS),
+            "histograms": histograms,
+            "counters": counters,
+        }
+
+    def prometheus(self, prefix: str = "chimera_bus") -> str:
+        """The metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time requests spend in each bus stage.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        for h in snapshot["histograms"]:
+            labels = _labels(stage=h["stage"], path=h["path"], method=h["method"])
+            cumulative = 0
+            for bound, count in zip((*BUCKETS, "+Inf"), h["buckets"]):
+                cumulative += count
+                lines.append(
+                    f'{prefix}_stage_seconds_bucket{{{labels},le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(f"{prefix}_stage_seconds_sum{{{labels}}} {h['sum']}")
+            lines.append(f"{prefix}_stage_seconds_count{{{labels}}} {h['count']}")
+
+        names = sorted({c["name"] for c in snapshot["counters"]})
+        for name in names:
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for c in snapshot["counters"]:
+                if c["name"] == name:
+                    labels = _labels(path=c["path"], method=c["method"])
+                    lines.append(f"{prefix}_{name}_total{{{labels}}} {c['value']}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{key}="{escape(value)}"' for key, value in labels.items())
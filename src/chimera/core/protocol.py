@@ -12,13 +12,37 @@ from chimera.core.url import parse_url
 type Timestamp = int
 
 type Messages = (
-    Request | Response | Subscribe | Publish | Unsubscribe | Event | Ping | Pong
+    Request
+    | Response
+    | Batch
+    | BatchResponse
+    | Subscribe
+    | Publish
+    | Unsubscribe
+    | Event
+    | Ping
+    | Pong
+    | Credit
 )
 
 
+class TraceContext(msgspec.Struct, frozen=True, array_like=True):
+    """Where a message belongs in a trace: the trace and the span that sent
+    it (see chimera.core.tracing). Only sampled work carries one."""
+
+    trace_id: int
+    span_id: int
+
+
 class Message(msgspec.Struct, tag=str.lower, frozen=True, dict=True):
     ts: Timestamp
 
+    @cached_property
+    def received(self) -> float:
+        # local time.monotonic() the message entered a bus inbox: stamped
+        # by the first access (made on arrival), never sent on the wire
+        return time.monotonic()
+
     @cached_property
     def src_bus(self) -> str:
         raise NotImplementedError()
@@ -46,7 +70,19 @@ class RpcMessage(Message, frozen=True):
 class Ping(RpcMessage, frozen=True):
     id: int
 
-    def pong(self, *, ok: bool = True, resolved_url: str | None = None) -> "Pong":
+    # wire codecs the sender can decode, in its preference order; None from
+    # peers that predate codec negotiation (JSON only)
+    codecs: list[str] | None = None
+
+    def pong(
+        self,
+        *,
+        ok: bool = True,
+        resolved_url: str | None = None,
+        codec: str | None = None,
+        cached: list[str] | None = None,
+        streams: list[str] | None = None,
+    ) -> "Pong":
         return Pong(
             ts=Protocol.timestamp(),
             src=self.dst,
@@ -54,6 +90,9 @@ class Ping(RpcMessage, frozen=True):
             id=self.id,
             ok=ok,
             resolved_url=resolved_url,
+            codec=codec,
+            cached=cached,
+            streams=streams,
         )
 
 
@@ -63,6 +102,17 @@ class Pong(RpcMessage, frozen=True):
 
     resolved_url: str | None = None
 
+    # the codec the answering bus picked from Ping.codecs for this pair
+    codec: str | None = None
+
+    # methods of the resolved object whose results callers may memoize until
+    # its config changes (see chimera.core.cached)
+    cached: list[str] | None = None
+
+    # its generator methods: call them with Request.window to get the items
+    # as they are produced
+    streams: list[str] | None = None
+
 
 class Request(RpcMessage, frozen=True):
     id: int  # number to identify this request
@@ -72,7 +122,35 @@ class Request(RpcMessage, frozen=True):
     args: list[Any]
     kwargs: dict[str, Any]
 
-    def ok(self, result: Any) -> "Response":
+    # seconds the caller waits for the answer, counted from when it sent the
+    # request; None waits forever. Sent relative, as ts is a monotonic clock
+    # (meaningless on another host): the receiving bus turns it into a local
+    # deadline from the arrival time, which transit only makes later than
+    # the caller's own
+    timeout: float | None = None
+
+    # the caller's span, when the call is part of a sampled trace
+    trace: TraceContext | None = None
+
+    # for generator methods: stream the items, at most this many ahead of
+    # what the caller acknowledged with Credit; None gets them all at once,
+    # as a list, in the final Response
+    window: int | None = None
+
+    def ok(self, result: Any, trace: TraceContext | None = None) -> "Response":
+        return Response(
+            ts=Protocol.timestamp(),
+            src=self.dst,
+            dst=self.src,
+            id=self.id,
+            code=200,
+            result=result,
+            trace=trace,
+        )
+
+    def item(self, result: Any, trace: TraceContext | None = None) -> "Response":
+        """One item of a streamed result: more follow, up to a final ok()
+        (with no result) or error()."""
         return Response(
             ts=Protocol.timestamp(),
             src=self.dst,
@@ -80,6 +158,8 @@ class Request(RpcMessage, frozen=True):
             id=self.id,
             code=200,
             result=result,
+            trace=trace,
+            more=True,
         )
 
     def not_found(self, msg: str) -> "Response":
@@ -102,7 +182,17 @@ class Request(RpcMessage, frozen=True):
             error=msg,
         )
 
-    def error(self, error: Exception) -> "Response":
+    def expired(self, msg: str) -> "Response":
+        return Response(
+            ts=Protocol.timestamp(),
+            src=self.dst,
+            dst=self.src,
+            id=self.id,
+            code=408,
+            error=msg,
+        )
+
+    def error(self, error: Exception, trace: TraceContext | None = None) -> "Response":
         tb = "".join(traceback.format_exception(error))
         return Response(
             ts=Protocol.timestamp(),
@@ -111,6 +201,7 @@ class Request(RpcMessage, frozen=True):
             id=self.id,
             code=500,
             error=f"{error.__class__.__name__}: {str(error)} (traceback={tb})",
+            trace=trace,
         )
 
 
@@ -123,12 +214,79 @@ class Response(RpcMessage, frozen=True):
     # TODO: how to expose exception backtraces?
     error: str | None = None
 
+    # the span that served a traced request, if the server recorded one
+    trace: TraceContext | None = None
+
+    # an item of a streamed result (see Request.window): more follow
+    more: bool = False
+
+
+class Credit(RpcMessage, frozen=True):
+    """Flow control of a streamed result, from the caller to the object: it
+    may send credit more items. With cancel, the caller is gone: the
+    generator is closed and nothing else is sent."""
+
+    id: int  # the streaming request
+
+    credit: int = 0
+    cancel: bool = False
+
+
+class Batch(RpcMessage, frozen=True):
+    """Many requests to objects on one bus, sent as a single message. dst is
+    any object on the destination bus; every request carries its own."""
+
+    id: int
+
+    requests: list[Request]
+
+    def ok(self, responses: list[Response]) -> "BatchResponse":
+        return BatchResponse(
+            ts=Protocol.timestamp(),
+            src=self.dst,
+            dst=self.src,
+            id=self.id,
+            responses=responses,
+        )
+
+
+class BatchResponse(RpcMessage, frozen=True):
+    id: int  # to correlate with the original batch
+
+    # one per request, in the batch order
+    responses: list[Response]
+
 
 class SubMessage(Message, frozen=True):
     pub: str  # an URL [tcp://]host:port/Object/[0|instance]
     sub: str  # an URL [tcp://]host:port/Object/[0|instance]
 
 
+class EventFilter(msgspec.Struct, frozen=True, omit_defaults=True):
+    """A predicate the publisher bus checks before sending an event to one
+    subscription: events it rejects never leave the publisher host. All the
+    conditions given must hold.
+
+    arg selects the value the value conditions look at: a positional index
+    into the event args or a keyword name. equals/above/below test it, and
+    min_delta passes it only if it moved at least that much since the last
+    delivered event. min_interval (seconds) rate-limits delivery."""
+
+    arg: int | str | None = None
+    equals: Any = msgspec.UNSET
+    above: float | None = None
+    below: float | None = None
+    min_delta: float | None = None
+    min_interval: float | None = None
+
+    def value(self, args: list[Any], kwargs: dict[str, Any]) -> Any:
+        """The value selected by arg. Raises LookupError if the event has
+        no such argument."""
+        if isinstance(self.arg, int):
+            return args[self.arg]
+        return kwargs[self.arg]
+
+
 class Subscribe(SubMessage, frozen=True):
     # late-binding: someone can subscribe to events that are not yet bound to any publishers
     event: str  # slew_complete
@@ -136,6 +294,13 @@ class Subscribe(SubMessage, frozen=True):
     # an id representing the callback, as we cannot pass a reference to the callable
     callback: int  #  id(self.on_slew_complete)
 
+    # None: every event (and all that older subscribers ever send)
+    filter: EventFilter | None = None
+
+    # how many of the publisher's latest events (as far as it keeps them)
+    # to send right away, ahead of live ones
+    replay: int = 0
+
     @cached_property
     @override
     def src_bus(self) -> str:
@@ -184,8 +349,20 @@ class Publish(PubMessage, frozen=True):
     args: list[Any]
     kwargs: dict[str, Any]
 
+    # the publisher's span, when fired from traced work
+    trace: TraceContext | None = None
+
+    # how many of the latest events its bus keeps for late subscribers
+    history: int = 0
+
     def callback(
-        self, *, dst: str, event: str, args: list[Any], kwargs: dict[str, Any]
+        self,
+        *,
+        dst: str,
+        event: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+        callbacks: list[int] | None = None,
     ) -> "Event":
         return Event(
             ts=Protocol.timestamp(),
@@ -194,6 +371,8 @@ class Publish(PubMessage, frozen=True):
             event=event,
             args=args,
             kwargs=kwargs,
+            callbacks=callbacks,
+            trace=self.trace,
         )
 
 
@@ -203,6 +382,13 @@ class Event(RpcMessage, frozen=True):
     args: list[Any]
     kwargs: dict[str, Any]
 
+    # callback ids this event passed the publisher-side filters for; None
+    # means every subscription on the destination bus
+    callbacks: list[int] | None = None
+
+    # the publisher's span: callbacks run as its children
+    trace: TraceContext | None = None
+
     @cached_property
     @override
     def dst_bus(self) -> str:
@@ -221,12 +407,13 @@ class Protocol:
         return time.monotonic_ns()
 
     @staticmethod
-    def ping(*, src: str, dst: str) -> Ping:
+    def ping(*, src: str, dst: str, codecs: list[str] | None = None) -> Ping:
         return Ping(
             ts=Protocol.timestamp(),
             src=src,
             dst=dst,
             id=Protocol.id(),
+            codecs=codecs,
         )
 
     @staticmethod
@@ -237,6 +424,9 @@ class Protocol:
         method: str,
         args: list[Any] | None = None,
         kwargs: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        trace: TraceContext | None = None,
+        window: int | None = None,
     ) -> Request:
         return Request(
             id=Protocol.id(),
@@ -246,16 +436,50 @@ class Protocol:
             method=method,
             args=args or [],
             kwargs=kwargs or {},
+            timeout=timeout,
+            trace=trace,
+            window=window,
+        )
+
+    @staticmethod
+    def credit(*, request: Request, credit: int = 0, cancel: bool = False) -> Credit:
+        return Credit(
+            ts=Protocol.timestamp(),
+            src=request.src,
+            dst=request.dst,
+            id=request.id,
+            credit=credit,
+            cancel=cancel,
         )
 
     @staticmethod
-    def subscribe(*, sub: str, pub: str, event: str, callback: int) -> Subscribe:
+    def batch(*, src: str, requests: list[Request]) -> Batch:
+        return Batch(
+            id=Protocol.id(),
+            ts=Protocol.timestamp(),
+            src=src,
+            dst=requests[0].dst,
+            requests=requests,
+        )
+
+    @staticmethod
+    def subscribe(
+        *,
+        sub: str,
+        pub: str,
+        event: str,
+        callback: int,
+        filter: EventFilter | None = None,
+        replay: int = 0,
+    ) -> Subscribe:
         return Subscribe(
             ts=Protocol.timestamp(),
             sub=sub,
             pub=pub,
             event=event,
             callback=callback,
+            filter=filter,
+            replay=replay,
         )
 
     @staticmethod
@@ -275,6 +499,8 @@ class Protocol:
         event: str,
         args: list[Any],
         kwargs: dict[str, Any],
+        trace: TraceContext | None = None,
+        history: int = 0,
     ) -> Publish:
         return Publish(
             ts=Protocol.timestamp(),
@@ -282,6 +508,8 @@ class Protocol:
             event=event,
             args=args,
             kwargs=kwargs,
+            trace=trace,
+            history=history,
         )
 
     @staticmethod
@@ -1,29 +1,56 @@
-from collections.abc import Callable
+import asyncio
+import copy
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
 from typing import Any
 
+from chimera.core import tracing
 from chimera.core.bus import Bus
+from chimera.core.cached import call_key
 from chimera.core.exceptions import (
     BusDeadException,
     ObjectBusyException,
     ObjectNotFoundException,
+    RequestTimeoutException,
 )
+from chimera.core.protocol import EventFilter, Response
 from chimera.core.url import URL, create_url, parse_url, resolve_url
 
-__all__ = ["Proxy", "ProxyMethod"]
+__all__ = ["Proxy", "ProxyMethod", "ProxyBatch"]
+
+
+def _result(response: Response) -> Any:
+    """The value of a call, or the exception the remote side raised."""
+    if response.code == 503:
+        raise ObjectBusyException(response.error)
+
+    if response.code == 408:
+        # expired unexecuted on the server: same outcome as a local timeout
+        raise RequestTimeoutException(response.error)
+
+    if response.error:
+        raise Exception(response.error)
+
+    return response.result
 
 
 class Proxy:
     """A remote-object handle, safe to share between threads.
 
     Every attribute access builds a fresh ProxyMethod, so calls carry no
-    shared state; the only mutable field, __resolved_url__, is set once and
-    never invalidated; and the bus correlates replies by message id, so
-    concurrent calls through one proxy cannot receive each other's answers.
+    shared state; the only mutable fields, __resolved_url__, __memoized__
+    and __streams__, are set once and never invalidated; and the bus
+    correlates replies by message id, so concurrent calls through one
+    proxy cannot receive each other's answers.
     """
 
     def __init__(self, url: str | URL, bus: Bus, timeout: float | None = None):
         self.__url__ = parse_url(url)
         self.__resolved_url__: URL | None = None
+        # the object's @cached methods: their results are memoized on the bus
+        self.__memoized__: frozenset[str] = frozenset()
+        # its generator methods: calls return iterators over their items
+        self.__streams__: frozenset[str] = frozenset()
         self.__proxy_url__ = create_url(bus=bus.url.bus, cls="Proxy")
         self.__bus__ = bus
         # per-proxy request timeout; None uses the bus default
@@ -33,10 +60,23 @@ class Proxy:
         if self.__resolved_url__ is not None:
             return
 
-        self.ping()
-
-        if not self.__resolved_url__:
+        # answered from the bus resolution cache when possible: creating
+        # proxies over and over costs no round trips
+        resolved = self.__bus__.resolve(src=self.__proxy_url__, dst=self.__url__)
+        if not resolved:
             raise ObjectNotFoundException(f"could not resolve proxy for {self.__url__}")
+        self.__memoized__ = resolved.cached
+        self.__streams__ = resolved.streams
+        self.__resolved_url__ = parse_url(resolved.url)
+
+    def exists(self) -> bool:
+        """Whether the object can be resolved. Unlike ping(), which always
+        asks the remote bus, a recent answer (found or not) is reused."""
+        try:
+            self.resolve()
+        except ObjectNotFoundException:
+            return False
+        return True
 
     def ping(self, timeout: float = 5.0) -> bool:
         pong = self.__bus__.ping(
@@ -46,9 +86,23 @@ class Proxy:
             raise BusDeadException("bus is dead")
         resolved = self.__resolved_url__ is not None
         if not resolved and pong.ok and pong.resolved_url:
+            self.__memoized__ = frozenset(pong.cached or ())
+            self.__streams__ = frozenset(pong.streams or ())
             self.__resolved_url__ = parse_url(pong.resolved_url)
         return pong.ok
 
+    def batch(self) -> "ProxyBatch":
+        """Collect calls instead of sending them: every call made on the
+        batch returns a Future, and leaving the `with` block sends them all
+        in one round trip.
+
+            with telescope.batch() as batch:
+                ra, dec = batch.get_ra(), batch.get_dec()
+                az = batch.on(dome).get_az()
+            print(ra.result(), dec.result(), az.result())
+        """
+        return ProxyBatch(self)
+
     def get_proxy(self, url: str) -> "Proxy":
         """Returns a Proxy for a resource relative to this Proxy's URL."""
         resolved_url = resolve_url(url, bus=self.__url__.bus)
@@ -68,12 +122,25 @@ class Proxy:
         return ProxyMethod(self, "__getitem__")(item)
 
     def __setitem__(self, item: str, value: Any):
-        return ProxyMethod(self, "__setitem__")(item, value)
+        try:
+            return ProxyMethod(self, "__setitem__")(item, value)
+        finally:
+            self._forget_results()
 
     def __iadd__(self, config_dict: dict[str, Any]):
-        ProxyMethod(self, "__iadd__")(config_dict)
+        try:
+            ProxyMethod(self, "__iadd__")(config_dict)
+        finally:
+            self._forget_results()
         return self
 
+    def _forget_results(self) -> None:
+        # the config_changed event does it too, but it arrives later: a
+        # write must be seen by the next call through this bus (even a
+        # failed one, it may have applied in part)
+        if self.__memoized__ and self.__resolved_url__ is not None:
+            self.__bus__.result_cache(self.__resolved_url__).invalidate()
+
     def __copy__(self) -> "Proxy":
         new = Proxy.__new__(Proxy)
         new.__dict__.update(self.__dict__)
@@ -150,28 +217,133 @@ class ProxyMethod:
         self.proxy.resolve()
         assert self.proxy.__resolved_url__ is not None
 
-        # raises RequestTimeoutException/BusDeadException on failure; a None
-        # timeout (the default) waits as long as the operation takes
-        response = self.proxy.__bus__.request(
+        if self.method in self.proxy.__streams__:
+            return self._stream(args, kwargs)
+
+        # @cached methods: answered here until the object's config changes.
+        # Every proxy on this bus shares the stored result, so each caller
+        # gets a copy it may change (a list of modes, a dict of binnings)
+        if self.method in self.proxy.__memoized__:
+            key = call_key(self.method, args, kwargs)
+            if key is not None:
+                cache = self.proxy.__bus__.result_cache(self.proxy.__resolved_url__)
+                hit, result, generation = cache.get(key)
+                if not hit:
+                    result = self._call(args, kwargs)
+                    cache.put(key, result, generation)
+                return copy.deepcopy(result)
+
+        return self._call(args, kwargs)
+
+    def _stream(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Iterator[Any]:
+        """The items of a generator method, as the remote object yields
+        them. Like a local generator, nothing runs until the first item is
+        asked for; dropping the iterator early (break, close()) stops the
+        remote generator too."""
+        assert self.proxy.__resolved_url__ is not None
+
+        with self.proxy.__bus__.request_stream(
             src=self.proxy.__proxy_url__.url,
             dst=self.proxy.__resolved_url__,
             method=self.method,
-            # FIXME: requests should use tuple
             args=list(args),
             kwargs=kwargs,
             timeout=self.proxy.__timeout__,
-        )
+            trace=tracing.current(),
+        ) as responses:
+            for response in responses:
+                yield _result(response)
+
+    def _call(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        assert self.proxy.__resolved_url__ is not None
+
+        # a child of whatever span this thread works for (the remote method
+        # we are running in, say); starts a trace if sampled
+        with tracing.span(
+            f"{self.proxy.__resolved_url__.path}.{self.method}", "client"
+        ):
+            # raises RequestTimeoutException/BusDeadException on failure; a
+            # None timeout (the default) waits as long as the operation takes
+            response = self.proxy.__bus__.request(
+                src=self.proxy.__proxy_url__.url,
+                dst=self.proxy.__resolved_url__,
+                method=self.method,
+                # FIXME: requests should use tuple
+                args=list(args),
+                kwargs=kwargs,
+                timeout=self.proxy.__timeout__,
+                trace=tracing.current(),
+            )
 
-        if response.code == 503:
-            raise ObjectBusyException(response.error)
+            return _result(response)
 
-        if response.error:
-            raise Exception(response.error)
+    # asynchronous calls
+    def submit(self, *args: Any, **kwargs: Any) -> Future[Any]:
+        """Start the call and return at once: the result (or the remote
+        exception) arrives in the Future. Only an unresolved proxy blocks,
+        once, to resolve itself."""
+        self.proxy.resolve()
+        assert self.proxy.__resolved_url__ is not None
 
-        return response.result
+        request = self.proxy.__bus__.submit_request(
+            src=self.proxy.__proxy_url__.url,
+            dst=self.proxy.__resolved_url__,
+            method=self.method,
+            args=list(args),
+            kwargs=kwargs,
+            timeout=self.proxy.__timeout__,
+            # no client span (nothing waits here), but the remote method
+            # still joins the trace this thread works for
+            trace=tracing.current(),
+        )
+
+        future: Future[Any] = Future()
+
+        def done(request: Future[Any]) -> None:
+            if request.cancelled():
+                future.cancel()
+                return
+            if not future.set_running_or_notify_cancel():
+                # the caller cancelled: drop the response
+                return
+            try:
+                future.set_result(_result(request.result()))
+            except Exception as e:
+                future.set_exception(e)
+
+        request.add_done_callback(done)
+        # cancelling the call frees its reply mailbox on the bus
+        future.add_done_callback(
+            lambda future: request.cancel() if future.cancelled() else None
+        )
+        return future
+
+    async def aio(self, *args: Any, **kwargs: Any) -> Any:
+        """`await proxy.method.aio(...)`: submit() for asyncio code. The
+        event loop is never blocked, not even to resolve the proxy."""
+        if self.proxy.__resolved_url__ is None:
+            await asyncio.to_thread(self.proxy.resolve)
+        return await asyncio.wrap_future(self.submit(*args, **kwargs))
 
     # event handling
     def __iadd__(self, other: Callable[..., Any]):
+        self.subscribe(other)
+        return self
+
+    def subscribe(
+        self,
+        callback: Callable[..., Any],
+        conflate: bool = False,
+        filter: EventFilter | None = None,
+        replay: int = 0,
+    ):
+        """`proxy.event += callback`, with options. conflate=True keeps only
+        the newest undelivered payload: meant for high-rate telemetry, where
+        a slow callback wants the latest value, not a backlog of stale ones.
+        A filter (see EventFilter) is applied by the publisher's bus, so
+        rejected events do not even cross the network. replay=N first
+        delivers up to the N latest events, for events declared with a
+        history (see @event): the current state without polling for it."""
         self.proxy.resolve()
         assert self.proxy.__resolved_url__ is not None
 
@@ -179,9 +351,11 @@ class ProxyMethod:
             sub=self.proxy.__proxy_url__.url,
             pub=self.proxy.__resolved_url__,
             event=self.method,
-            callback=other,
+            callback=callback,
+            conflate=conflate,
+            filter=filter,
+            replay=replay,
         )
-        return self
 
     def __isub__(self, other: Callable[..., Any]):
         self.proxy.resolve()
@@ -194,3 +368,110 @@ class ProxyMethod:
             callback=other,
         )
         return self
+
+
+class ProxyBatch:
+    """Calls recorded for one Bus.request_many round trip, on the proxy the
+    batch was created from or on others sharing its bus (see on()). Futures
+    are resolved when the batch is sent: on leaving the `with` block, or by
+    an explicit send()."""
+
+    def __init__(self, proxy: Proxy):
+        self._proxy = proxy
+        self._calls: list[tuple[Proxy, str, tuple[Any, ...], dict[str, Any]]] = []
+        self._futures: list[Future[Any]] = []
+
+    def on(self, proxy: Proxy) -> "_BatchTarget":
+        """Record calls to another object in this same batch."""
+        if proxy.__bus__ is not self._proxy.__bus__:
+            raise ValueError(f"{proxy} does not share this batch's bus")
+        return _BatchTarget(self, proxy)
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(_BatchTarget(self, self._proxy), attr)
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __enter__(self) -> "ProxyBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.send()
+        else:
+            # the block failed: nothing was sent and nothing will be
+            for future in self._futures:
+                future.cancel()
+            self._calls.clear()
+            self._futures.clear()
+
+    def _add(
+        self, proxy: Proxy, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        self._calls.append((proxy, method, args, kwargs))
+        self._futures.append(future)
+        return future
+
+    def send(self) -> None:
+        calls, self._calls = self._calls, []
+        futures, self._futures = self._futures, []
+
+        # resolve every distinct object once (a no-op for resolved proxies);
+        # calls to objects that cannot be resolved fail on their own
+        ready: list[tuple[tuple[str, str, list[Any], dict[str, Any]], Future]] = []
+        for (proxy, method, args, kwargs), future in zip(calls, futures):
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                proxy.resolve()
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            assert proxy.__resolved_url__ is not None
+            ready.append(
+                ((proxy.__resolved_url__.url, method, list(args), kwargs), future)
+            )
+
+        if not ready:
+            return
+
+        try:
+            with tracing.span("batch", "client", calls=len(ready)):
+                responses = self._proxy.__bus__.request_many(
+                    src=self._proxy.__proxy_url__.url,
+                    calls=[call for call, _ in ready],
+                    timeout=self._proxy.__timeout__,
+                    trace=tracing.current(),
+                )
+        except Exception as e:
+            for _, future in ready:
+                future.set_exception(e)
+            return
+
+        for (_, future), response in zip(ready, responses):
+            try:
+                future.set_result(_result(response))
+            except Exception as e:
+                future.set_exception(e)
+
+
+class _BatchTarget:
+    """Batch calls on one object: every method call records a request."""
+
+    def __init__(self, batch: ProxyBatch, proxy: Proxy):
+        self._batch = batch
+        self._proxy = proxy
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+
+        def call(*args: Any, **kwargs: Any) -> Future[Any]:
+            return self._batch._add(self._proxy, attr, args, kwargs)
+
+        call.__name__ = attr
+        return call
@@ -1,14 +1,18 @@
 # SPDX-License-Identifier: GPL-2.0-or-later
 # SPDX-FileCopyrightText: 2006-present Paulo Henrique Silva <ph.silva@gmail.com>
 
+import bisect
 import threading
 import time
 from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from chimera.core.url import parse_path
 
+if TYPE_CHECKING:
+    from chimera.core.worker import Worker
+
 
 @dataclass
 class Resource:
@@ -20,30 +24,45 @@ class Resource:
     # wall-clock, same basis as Manager.start() which resets it
     created: float = field(default_factory=time.time)
     loop: Future[bool] | None = None
+    # set for isolated objects: instance is then a proxy to the child
+    worker: "Worker | None" = None
 
 
 class ResourcesManager:
     def __init__(self):
-        self._res = {}
+        self._res: dict[str, Resource] = {}
+        # class and base names -> their resources, oldest first: what index
+        # lookups ('/Camera/0') and get_by_class read. Kept up to date by
+        # add/remove/started, never rebuilt on lookup
+        self._by_class: dict[str, list[Resource]] = {}
         # add/remove are check-then-act sequences called from concurrent RPC
         # handlers: they must be atomic (M5)
         self._lock = threading.Lock()
 
     def add(
-        self, path: str, instance: Any | None = None, loop: Future[bool] | None = None
+        self,
+        path: str,
+        instance: Any | None = None,
+        loop: Future[bool] | None = None,
+        worker: "Worker | None" = None,
     ) -> None:
         cls, name = parse_path(path)
 
         resource = Resource(path=path, cls=cls, name=name)
         resource.instance = instance
-        if resource.instance is not None:
+        if worker is not None:
+            # the class lives in the child: as it reported itself
+            resource.bases = list(worker.bases)
+        elif resource.instance is not None:
             resource.bases = [b.__name__ for b in type(resource.instance).mro()]
         resource.loop = loop
+        resource.worker = worker
 
         with self._lock:
             if path in self:
                 raise ValueError(f"'{path}' already exists.")
             self._res[path] = resource
+            self._index(resource)
 
     def remove(self, path: str) -> None:
         with self._lock:
@@ -54,37 +73,68 @@ class ResourcesManager:
                 raise KeyError(f"{path} not found")
 
             del self._res[resource.path]
+            self._unindex(resource)
+
+    def started(self, path: str, bases: list[str] | None = None) -> None:
+        """Mark the resource at path as (re)started now, with new bases if
+        given: index order follows start time."""
+        with self._lock:
+            resource = self.get(path)
+            if resource is None:
+                raise KeyError(f"{path} not found")
+
+            self._unindex(resource)
+            if bases is not None:
+                resource.bases = bases
+            resource.created = time.time()
+            self._index(resource)
 
     def get(self, path: str) -> Resource | None:
+        # registered paths were parsed by add
+        resource = self._res.get(path)
+        if resource is not None:
+            return resource
+
         cls, name = parse_path(path)
         if isinstance(name, int):
             return self._get_by_index(cls, name)
         return self._get(cls, name)
 
     def get_by_class(self, cls: str) -> list[Resource]:
-        resources = []
-
-        for k, v in list(self._res.items()):
-            if cls == v.cls or cls in v.bases:
-                resources.append(self._res[k])
-
-        resources.sort(key=lambda entry: entry.created)
-        return resources
+        return list(self._by_class.get(cls, ()))
 
     def _get_by_index(self, cls: str, index: int) -> Resource | None:
-        resources = self.get_by_class(cls)
-        if not resources or index >= len(resources):
+        # read without the lock: the list changes in place under it, at
+        # worst shrinking between the lookup and the indexing
+        try:
+            return self._by_class.get(cls, ())[index]
+        except IndexError:
             return None
-        return self._res[resources[index].path]
 
     def _get(self, cls: str, name: str) -> Resource | None:
-        path = f"/{cls}/{name}"
-
-        resources = self.get_by_class(cls)
-        for resource in resources:
-            if resource.path == path:
-                return resource
-        return None
+        return self._res.get(f"/{cls}/{name}")
+
+    @staticmethod
+    def _index_names(resource: Resource) -> set[str]:
+        return {resource.cls, *resource.bases}
+
+    def _index(self, resource: Resource) -> None:
+        # call with the lock held
+        for name in self._index_names(resource):
+            bisect.insort_right(
+                self._by_class.setdefault(name, []),
+                resource,
+                key=lambda entry: entry.created,
+            )
+
+    def _unindex(self, resource: Resource) -> None:
+        # call with the lock held
+        for name in self._index_names(resource):
+            resources = self._by_class[name]
+            # by identity: Resource compares by value
+            del resources[next(i for i, r in enumerate(resources) if r is resource)]
+            if not resources:
+                del self._by_class[name]
 
     def __contains__(self, path: str):
         return self.get(path) is not None
@@ -0,0 +1,278 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: 2026-present Paulo Henrique Silva <ph.silva@gmail.com>
+
+"""Shared scheduler for ChimeraObject control loops.
+
+By default every running object spends a thread of its own on __main__,
+which mostly sleeps between control() calls. With the scheduler, one
+timer-wheel thread keeps the next run of every loop and hands due ones to
+a small worker pool. control() keeps its contract: called at get_hz(),
+never twice at the same time, the loop ends when it returns False or the
+object is stopped, an exception is logged and retried on the next cycle.
+
+Loops are kept in a hashed timer wheel: a ring of slots, one per tick,
+each holding the loops due on any tick that maps to it. Adding,
+rescheduling and finding due loops cost the same however many objects
+run. A control() that blocks holds a pool worker for as long: objects
+that block for real ask for a thread of their own (the "own_thread"
+config option) and are never given to the scheduler.
+"""
+
+import logging
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from chimera.core.bus import pool_stats
+
+__all__ = ["LoopScheduler"]
+
+log = logging.getLogger(__name__)
+
+
+class _Loop:
+    """One object's control loop, with its scheduling statistics."""
+
+    def __init__(self, path: str, instance: Any):
+        self.path = path
+        self.instance = instance
+        self.future: Future[bool] = Future()
+        # the loop runs from now on: Manager.stop() cannot cancel it, only
+        # wait for it (see LoopScheduler.remove)
+        self.future.set_running_or_notify_cancel()
+
+        # when the next run should start (monotonic) and its wheel tick
+        self.deadline = 0.0
+        self.tick = 0
+        self.running = False
+        self.removed = False
+        # the pool task of the current run
+        self.step: Future[None] | None = None
+
+        self.runs = 0
+        self.overruns = 0
+        # run start - deadline: how late the wheel and the pool were
+        self.jitter_last = 0.0
+        self.jitter_max = 0.0
+        self.jitter_total = 0.0
+        # time spent in control()
+        self.busy = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hz": self.instance.get_hz(),
+            "runs": self.runs,
+            "overruns": self.overruns,
+            "jitter_last": self.jitter_last,
+            "jitter_max": self.jitter_max,
+            "jitter_mean": self.jitter_total / self.runs if self.runs else 0.0,
+            "busy": self.busy,
+        }
+
+
+class LoopScheduler:
+    """Runs the control() of many objects on one timer wheel and a pool of
+    worker threads.
+
+    tick is the wheel resolution (how late a run may start with idle
+    workers), slots the wheel size: loops further away than slots * tick
+    stay in their slot for more than one turn.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        tick: float = 0.01,
+        slots: int = 256,
+        name: str = "chimera-loops",
+    ):
+        self._tick = tick
+        self._wheel: list[list[_Loop]] = [[] for _ in range(slots)]
+        self._origin = time.monotonic()
+        # the next tick the wheel thread looks at
+        self._current = 0
+
+        self._loops: dict[str, _Loop] = {}
+        self._lock = threading.Lock()
+        # the wheel thread sleeps until the next tick with a loop due (or
+        # for a loop, when there is none): loops added or rescheduled
+        # before it wake it up
+        self._changed = threading.Condition(self._lock)
+        self._wake_tick = 0
+        self._wakeups = 0
+        self._stopping = False
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"{name}-worker"
+        )
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._loops
+
+    def add(self, path: str, instance: Any) -> Future[bool]:
+        """Start running instance.control() now and then at its get_hz().
+        The future completes (with True, as __main__ does) when the loop
+        ends."""
+        loop = _Loop(path, instance)
+        instance._loop_abort.clear()
+        with self._lock:
+            if self._stopping:
+                raise RuntimeError("scheduler is shut down")
+            if path in self._loops:
+                raise ValueError(f"{path} already scheduled")
+            self._loops[path] = loop
+            self._schedule(loop, time.monotonic())
+            self._changed.notify()
+        return loop.future
+
+    def remove(self, path: str) -> None:
+        """End the loop of path: right away if it waits for its next run,
+        once control() returns if it runs. A no-op for unknown paths."""
+        with self._lock:
+            loop = self._loops.get(path)
+            if loop is None:
+                return
+            loop.removed = True
+            if not loop.running:
+                self._wheel[loop.tick % len(self._wheel)].remove(loop)
+                self._finish(loop)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            loops = list(self._loops.values())
+        return {
+            "tick": self._tick,
+            "slots": len(self._wheel),
+            "wakeups": self._wakeups,
+            "pool": pool_stats(self._pool),
+            "loops": {loop.path: loop.stats() for loop in loops},
+        }
+
+    def shutdown(self) -> None:
+        """Stop the wheel and end every loop; control() calls running now
+        are not waited for."""
+        with self._lock:
+            self._stopping = True
+            for loop in list(self._loops.values()):
+                loop.removed = True
+                if not loop.running:
+                    self._finish(loop)
+            self._changed.notify()
+
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+        # runs still queued never happen: nothing else would end them
+        with self._lock:
+            for loop in list(self._loops.values()):
+                if loop.step is not None and loop.step.cancelled():
+                    self._finish(loop)
+
+    def _schedule(self, loop: _Loop, deadline: float) -> None:
+        # call with the lock held. Never behind the wheel: a past deadline
+        # runs on the next tick looked at
+        tick = max(math.ceil((deadline - self._origin) / self._tick), self._current)
+        loop.deadline = deadline
+        loop.tick = tick
+        self._wheel[tick % len(self._wheel)].append(loop)
+        if tick < self._wake_tick:
+            self._changed.notify()
+
+    def _next_due(self) -> int:
+        # call with the lock held: the first tick from the current one with
+        # a loop due, looking one turn of the wheel ahead at most
+        slots = len(self._wheel)
+        for tick in range(self._current, self._current + slots):
+            if any(loop.tick <= tick for loop in self._wheel[tick % slots]):
+                return tick
+        return self._current + slots
+
+    def _finish(self, loop: _Loop) -> None:
+        # call with the lock held
+        del self._loops[loop.path]
+        loop.future.set_result(True)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._loops and not self._stopping:
+                    self._changed.wait()
+                    # catch up without replaying the idle ticks
+                    self._current = max(
+                        self._current,
+                        int((time.monotonic() - self._origin) / self._tick),
+                    )
+                if self._stopping:
+                    return
+
+                self._wake_tick = self._next_due()
+                delay = self._origin + self._wake_tick * self._tick - time.monotonic()
+                if delay > 0:
+                    self._changed.wait(delay)
+                    continue
+                self._wakeups += 1
+
+                # every tick up to now: a late wheel thread catches up
+                now = int((time.monotonic() - self._origin) / self._tick)
+                due: list[_Loop] = []
+                while self._current <= now:
+                    slot = self._wheel[self._current % len(self._wheel)]
+                    if slot:
+                        waiting = [loop for loop in slot if loop.tick > self._current]
+                        due.extend(loop for loop in slot if loop.tick <= self._current)
+                        slot[:] = waiting
+                    self._current += 1
+
+                for loop in due:
+                    loop.running = True
+
+            for loop in due:
+                loop.step = self._pool.submit(self._step, loop)
+
+    def _step(self, loop: _Loop) -> None:
+        instance = loop.instance
+
+        run = not (loop.removed or instance._loop_abort.is_set())
+        started = time.monotonic()
+        if run:
+            jitter = started - loop.deadline
+            loop.runs += 1
+            loop.jitter_last = jitter
+            loop.jitter_max = max(loop.jitter_max, jitter)
+            loop.jitter_total += jitter
+
+            # observability: which OS thread runs this object's control loop
+            instance.__loop_native_id__ = threading.get_native_id()
+            try:
+                run = instance.control()
+            except Exception:
+                # as in ChimeraObject.__main__: one bad cycle must not stop
+                # the loop for good
+                instance.log.exception("control() raised; retrying next cycle")
+                run = True
+
+        finished = time.monotonic()
+        loop.busy += finished - started
+
+        # start to start, as ChimeraObject.__main__
+        period = 1.0 / instance.get_hz()
+        deadline = started + period
+        if run and finished > deadline:
+            loop.overruns += 1
+            instance.log.warning(
+                f"{loop.path}: control loop took more than {period} seconds to run: "
+                f"{finished - started:.3f} s"
+            )
+            deadline = finished
+
+        with self._lock:
+            loop.running = False
+            if not run or loop.removed or instance._loop_abort.is_set():
+                self._finish(loop)
+            else:
+                self._schedule(loop, deadline)
@@ -0,0 +1,335 @@
+"""Sampled request tracing across buses.
+
+A trace is a tree of spans: a proxy call (client), the method it runs on
+the remote object (server), the calls that method makes in turn, the event
+callbacks it triggers. The current span travels in a thread-local, so
+nested proxy calls pick it up without any plumbing, and over the wire in
+the trace field of Request/Response/Publish/Event.
+
+Nothing is recorded unless the process has a tracer (see configure()).
+The decision to sample is taken once, where a trace starts; work done
+for a sampled trace is recorded on every bus with a tracer and only
+passed along by the others.
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, TextIO
+
+from chimera.core.protocol import TraceContext
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "configure",
+    "shutdown",
+    "tracer",
+    "current",
+    "activate",
+    "span",
+    "run",
+    "load",
+    "critical_path",
+]
+
+log = logging.getLogger(__name__)
+
+_local = threading.local()
+_tracer: "Tracer | None" = None
+
+
+def _new_id() -> int:
+    # 63 bits: fits msgpack/JSON integers everywhere
+    return random.getrandbits(63)
+
+
+class Span:
+    __slots__ = ("name", "kind", "context", "parent", "start", "_started", "attrs")
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        context: TraceContext,
+        parent: int | None,
+        attrs: dict[str, Any],
+    ):
+        self.name = name
+        self.kind = kind
+        self.context = context
+        self.parent = parent
+        # wall clock, so files written on different hosts line up
+        self.start = time.time()
+        self._started = time.perf_counter()
+        self.attrs = attrs
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+
+class Tracer:
+    """Writes finished spans to a file: Chrome trace events (chrome://tracing,
+    Perfetto) for a .json path, one JSON object per line otherwise. Spans are
+    written as they finish, so a crashed process still leaves its trace."""
+
+    def __init__(self, path: str, sample: float = 1.0):
+        if not 0.0 <= sample <= 1.0:
+            raise ValueError(f"sample rate must be between 0 and 1, not {sample}")
+
+        self.path = path
+        self.sample = sample
+        self.chrome = path.endswith(".json")
+        self._lock = threading.Lock()
+        self._file: TextIO | None = open(path, "a", encoding="utf-8")
+        if self.chrome and self._file.tell() == 0:
+            # the array is never closed: trace viewers accept that, and it
+            # keeps every write an append
+            self._file.write("[\n")
+        self._pid = os.getpid()
+
+    def sampled(self) -> bool:
+        return self.sample >= 1.0 or random.random() < self.sample
+
+    def record(self, span: Span, duration: float) -> None:
+        if self.chrome:
+            entry: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.kind,
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": duration * 1e6,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": {
+                    "trace": f"{span.context.trace_id:016x}",
+                    "span": f"{span.context.span_id:016x}",
+                    "parent": None if span.parent is None else f"{span.parent:016x}",
+                    **span.attrs,
+                },
+            }
+            line = json.dumps(entry, default=str) + ",\n"
+        else:
+            entry = {
+                "trace": f"{span.context.trace_id:016x}",
+                "span": f"{span.context.span_id:016x}",
+                "parent": None if span.parent is None else f"{span.parent:016x}",
+                "name": span.name,
+                "kind": span.kind,
+                "start": span.start,
+                "duration": duration,
+                "pid": self._pid,
+                "thread": threading.current_thread().name,
+                "attrs": span.attrs,
+            }
+            line = json.dumps(entry, default=str) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def configure(path: str, sample: float = 1.0) -> Tracer:
+    """Start recording spans of this process to path, sampling the given
+    fraction of the traces that start here."""
+    global _tracer
+    new = Tracer(path, sample)
+    old, _tracer = _tracer, new
+    if old is not None:
+        old.close()
+    return new
+
+
+def shutdown() -> None:
+    global _tracer
+    old, _tracer = _tracer, None
+    if old is not None:
+        old.close()
+
+
+def tracer() -> Tracer | None:
+    return _tracer
+
+
+def current() -> TraceContext | None:
+    """The span this thread is working for, if any."""
+    return getattr(_local, "context", None)
+
+
+@contextmanager
+def activate(context: TraceContext | None) -> Iterator[None]:
+    """Make context the current span of this thread for the block."""
+    previous = getattr(_local, "context", None)
+    _local.context = context
+    try:
+        yield
+    finally:
+        _local.context = previous
+
+
+@contextmanager
+def span(
+    name: str,
+    kind: str = "internal",
+    parent: TraceContext | None = None,
+    **attrs: Any,
+) -> Iterator[Span | None]:
+    """Record the block as a span, child of parent (default: the current
+    span). Without a parent it starts a new trace, if sampled. Yields None
+    when nothing is recorded: no tracer here (the parent context is passed
+    along unchanged) or an unsampled trace (no context at all)."""
+    parent = parent or current()
+    tracer = _tracer
+
+    if tracer is None or (parent is None and not tracer.sampled()):
+        with activate(parent):
+            yield None
+        return
+
+    if parent is None:
+        context = TraceContext(_new_id(), _new_id())
+        parent_id = None
+    else:
+        context = TraceContext(parent.trace_id, _new_id())
+        parent_id = parent.span_id
+
+    s = Span(name, kind, context, parent_id, attrs)
+    with activate(context):
+        try:
+            yield s
+        except BaseException as e:
+            s.attrs["error"] = type(e).__name__
+            raise
+        finally:
+            tracer.record(s, s.elapsed())
+
+
+def run(
+    parent: TraceContext | None,
+    name: str,
+    kind: str,
+    fn: Callable[..., Any],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """fn(*args, **kwargs) as a span under a remote parent; a plain call for
+    untraced work (parent None)."""
+    if parent is None:
+        return fn(*args, **kwargs)
+    with span(name, kind, parent):
+        return fn(*args, **kwargs)
+
+
+#
+# reading traces back
+#
+
+
+def load(paths: Iterable[str]) -> list[dict[str, Any]]:
+    """Spans from trace files of either format, normalized to the JSON-lines
+    layout. Files from several processes and hosts can be mixed: spans are
+    joined by their trace and span ids."""
+    spans: list[dict[str, Any]] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                line = line.strip().rstrip(",")
+                if line in ("", "[", "]"):
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # a line cut short by a crash
+                    log.warning(f"{path}: skipping malformed trace line")
+                    continue
+                if entry.get("ph") == "X":
+                    args = dict(entry.get("args", {}))
+                    entry = {
+                        "trace": args.pop("trace"),
+                        "span": args.pop("span"),
+                        "parent": args.pop("parent"),
+                        "name": entry["name"],
+                        "kind": entry["cat"],
+                        "start": entry["ts"] / 1e6,
+                        "duration": entry["dur"] / 1e6,
+                        "pid": entry["pid"],
+                        "thread": entry["tid"],
+                        "attrs": args,
+                    }
+                spans.append(entry)
+    return spans
+
+
+def critical_path(
+    spans: list[dict[str, Any]],
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Where the wall-clock time of the traced work goes, per span name.
+
+    In every trace, the critical path starts at the root span and descends
+    into the child that finished last: the one the parent was waiting on.
+    Each span on the path is charged its own time, the part covered by none
+    of its children; earlier children (one after another, or alongside the
+    last) are off the path and charged to nobody. Summed over traces, keyed
+    by (kind, name): {"count", "time", "share"}, with share the fraction of
+    the total traced time. Spans whose parent was not recorded count as
+    roots."""
+    by_id = {span["span"]: span for span in spans}
+    children: dict[str, list[dict[str, Any]]] = {}
+    roots = []
+    for s in spans:
+        if s["parent"] is not None and s["parent"] in by_id:
+            children.setdefault(s["parent"], []).append(s)
+        else:
+            roots.append(s)
+
+    breakdown: dict[tuple[str, str], dict[str, Any]] = {}
+    total = 0.0
+    for root in roots:
+        total += root["duration"]
+        node: dict[str, Any] | None = root
+        while node is not None:
+            kids = children.get(node["span"])
+            last = (
+                max(kids, key=lambda kid: kid["start"] + kid["duration"])
+                if kids
+                else None
+            )
+            own = node["duration"] - _covered(node, kids or [])
+            entry = breakdown.setdefault(
+                (node["kind"], node["name"]), {"count": 0, "time": 0.0}
+            )
+            entry["count"] += 1
+            entry["time"] += max(0.0, own)
+            node = last
+
+    for entry in breakdown.values():
+        entry["share"] = entry["time"] / total if total else 0.0
+    return breakdown
+
+
+def _covered(node: dict[str, Any], kids: list[dict[str, Any]]) -> float:
+    """How much of node's time the union of kids covers."""
+    start, end = node["start"], node["start"] + node["duration"]
+    covered = 0.0
+    reached = start
+    for kid in sorted(kids, key=lambda kid: kid["start"]):
+        kid_start = max(kid["start"], reached)
+        kid_end = min(kid["start"] + kid["duration"], end)
+        if kid_end > kid_start:
+            covered += kid_end - kid_start
+            reached = kid_end
+    return covered
@@ -19,6 +19,7 @@ class Transport:
         # never perform socket operations in the callback
         self.on_disconnect: Callable[[], None] | None = None
 
+    # listen at url; a tcp port 0 is replaced by the one the system picked
     def bind(self) -> None: ...
 
     def connect(self) -> None: ...
@@ -3,4 +3,12 @@ from .transport_nng import TransportNNG
 
 
 def create_transport(url: str) -> Transport:
-    return TransportNNG(url)
+    # NNG speaks every bus scheme natively: tcp:// between hosts, ipc://
+    # (Unix domain sockets) and inproc:// (in-memory, no kernel round trip)
+    # for co-located buses
+    scheme, _, _ = url.partition("://")
+    match scheme:
+        case "tcp" | "ipc" | "inproc":
+            return TransportNNG(url)
+        case _:
+            raise ValueError(f"no transport for '{url}'")
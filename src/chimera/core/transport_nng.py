@@ -18,13 +18,19 @@ class TransportNNG(Transport):
     def bind(self):
         self._sk = pynng.Pull0()
         try:
-            self._sk.listen(f"{self.url}")
+            listener = self._sk.listen(f"{self.url}")
         except Exception as e:
             log.debug(f"bind failed: {e}")
             self._sk.close()
             self._sk = None
             raise
 
+        scheme, _, address = self.url.partition("://")
+        host, _, port = address.rpartition(":")
+        if scheme == "tcp" and port == "0":
+            bound = str(listener.local_address).rpartition(":")[2]
+            self.url = f"tcp://{host}:{bound}"
+
     @override
     def connect(self):
         self._sk = pynng.Push0()
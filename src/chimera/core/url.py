@@ -12,13 +12,19 @@ class InvalidPathError(ValueError):
     pass
 
 
+# bus address schemes, all spoken by the NNG transport: tcp://host:port,
+# inproc://name (buses in the same process, no kernel involved) and
+# ipc://path (Unix domain socket, same host)
+SCHEMES = ("tcp", "inproc", "ipc")
+
+
 @dataclass(frozen=True)
 class URL:
     raw: str
 
-    bus: str  # tcp://host:port
-    host: str
-    port: int
+    bus: str  # tcp://host:port, inproc://name or ipc://path
+    host: str  # inproc/ipc: the name/path
+    port: int  # inproc/ipc: 0
 
     path: str  # /<cls>/<name>
     cls: str
@@ -41,19 +47,32 @@ def parse_url(url: str | URL) -> URL:
     if isinstance(url, URL):
         return url
 
-    # urlsplit needs the URL to have a scheme, otherwise if will join netloc and path as path
-    if not url.startswith("tcp://"):
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        # urlsplit needs the URL to have a scheme, otherwise if will join netloc and path as path
+        scheme = "tcp"
         url = f"tcp://{url}"
+    elif scheme not in SCHEMES:
+        raise InvalidHostError(
+            f"Invalid scheme '{scheme}': must be one of {', '.join(SCHEMES)}"
+        )
 
-    parts = urlsplit(url)
-
-    host, port = parse_host(parts.netloc)
-    cls, name = parse_path(parts.path)
+    if scheme == "tcp":
+        parts = urlsplit(url)
+        host, port = parse_host(parts.netloc)
+        path = parts.path
+        bus = f"tcp://{host}:{port}"
+    else:
+        host, path = parse_local_address(scheme, rest)
+        port = 0
+        bus = f"{scheme}://{host}"
+
+    cls, name = parse_path(path)
     indexed = isinstance(name, int)
 
     return URL(
         raw=url,
-        bus=f"tcp://{host}:{port}",
+        bus=bus,
         host=host,
         port=port,
         path=f"/{cls}/{name}",
@@ -85,6 +104,29 @@ def parse_host(host: str) -> tuple[str, int]:
     return host, port
 
 
+def parse_local_address(scheme: str, address: str) -> tuple[str, str]:
+    """Split an inproc/ipc address from its object path. ipc addresses are
+    filesystem paths and contain slashes themselves, so there the object
+    path is always the last two segments."""
+    if scheme == "ipc":
+        parts = address.rsplit("/", 2)
+        if len(parts) == 3:
+            address, path = parts[0], f"/{parts[1]}/{parts[2]}"
+        else:
+            # no object path at all: parse_path complains about it
+            path = ""
+    else:
+        address, slash, path = address.partition("/")
+        path = f"{slash}{path}"
+
+    if address in ("", "/") or " " in address:
+        raise InvalidHostError(
+            f"Invalid address '{address}': address is empty or contains spaces"
+        )
+
+    return address, path
+
+
 def parse_path(path: str) -> tuple[str, int | str]:
     if not path.startswith("/"):
         raise InvalidPathError(f"Invalid path '{path}': path does not start with '/'")
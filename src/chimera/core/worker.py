@@ -0,0 +1,423 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# SPDX-FileCopyrightText: 2026-present Paulo Henrique Silva <ph.silva@gmail.com>
+
+"""Out-of-process object hosting.
+
+An object added with isolated=True (`isolated: true` in chimera.config)
+runs in a child process of its own, with a Bus and a Manager of its own,
+so CPU-heavy work there never competes for the GIL with the main bus and
+the other control loops.
+
+The parent Manager still lists it: its ResourcesManager holds a stand-in
+that relays any request reaching the parent to the child. Proxies resolve
+'/Class/name' (or '/Class/0') at the parent as usual, are told the child's
+URL and from then on talk to the child directly, @lock and events
+included. Objects in the child find everything else at the parent: the
+child Manager relays what it does not host.
+
+The parent supervises the child: if it dies unexpectedly it is started
+again, on the same port so resolved proxies keep working, backing off
+between attempts and giving up after too many deaths in a short time.
+Subscriptions made to the dead process die with it.
+"""
+
+import functools
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from collections.abc import Callable
+from importlib import import_module
+from multiprocessing.connection import Connection, wait
+from typing import Any
+
+from chimera.core.bus import Bus
+from chimera.core.constants import (
+    CACHED_METHODS_ATTRIBUTE_NAME,
+    MANAGER_LOCATION,
+    STREAM_METHODS_ATTRIBUTE_NAME,
+)
+from chimera.core.exceptions import ChimeraException, ChimeraObjectException
+from chimera.core.proxy import Proxy
+from chimera.core.url import URL, parse_url
+
+__all__ = ["Worker"]
+
+log = logging.getLogger(__name__)
+
+
+def _child_bus(parent: URL, cls: type, name: str) -> str:
+    """Where the child of the object cls/name listens, on the parent's
+    scheme. A tcp port is picked by the child when it first binds."""
+    scheme = parent.bus.partition("://")[0]
+    match scheme:
+        case "tcp":
+            return f"tcp://{parent.host}:0"
+        case "ipc":
+            return f"ipc://{parent.host}-{cls.__name__}-{name}"
+        case _:
+            raise ChimeraObjectException(
+                f"/{cls.__name__}/{name}: isolated objects need a tcp or ipc bus, "
+                f"{scheme}:// does not reach other processes"
+            )
+
+
+def _import_root(cls: type) -> str:
+    """The sys.path entry cls's module was imported from, so the child can
+    import it too (classes found by the ClassLoader live outside sys.path)."""
+    module = sys.modules[cls.__module__]
+    path = os.path.abspath(module.__file__ or "")
+    depth = cls.__module__.count(".") + 1
+    if os.path.basename(path) == "__init__.py":
+        depth += 1
+    for _ in range(depth):
+        path = os.path.dirname(path)
+    return path
+
+
+class _Hosted(Proxy):
+    """What the parent ResourcesManager holds for an isolated object: a proxy
+    to it in the child, advertising the same @cached and generator methods
+    (see Bus._handle_ping)."""
+
+    def __init__(self, url: URL, bus: Bus, cached: list[str], streams: list[str]):
+        super().__init__(url, bus)
+        setattr(self, CACHED_METHODS_ATTRIBUTE_NAME, cached)
+        setattr(self, STREAM_METHODS_ATTRIBUTE_NAME, streams)
+
+
+class Worker:
+    """Runs one ChimeraObject in a child process and keeps it running.
+
+    bases, cached and streams are what the child reported about the object
+    the last time it started; url is where it answers.
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        name: str,
+        config: dict[str, Any] | None,
+        bus: Bus,
+        site: str | None = None,
+        *,
+        start_timeout: float = 60.0,
+        stop_timeout: float = 10.0,
+        max_restarts: int = 5,
+        restart_window: float = 60.0,
+        backoff: float = 1.0,
+    ):
+        self._cls = cls
+        self._name = name
+        self._config = dict(config or {})
+        self._bus = bus
+        self._site = site
+
+        self._start_timeout = start_timeout
+        self._stop_timeout = stop_timeout
+        self._max_restarts = max_restarts
+        self._restart_window = restart_window
+        self._backoff = backoff
+
+        # fixed once the child first binds it (see _spawn): a restarted
+        # child listens where proxies already point
+        self.url = parse_url(f"{_child_bus(bus.url, cls, name)}/{cls.__name__}/{name}")
+
+        self.bases: list[str] = []
+        self.cached: list[str] = []
+        self.streams: list[str] = []
+        self.restarts = 0
+        self.started: float | None = None
+
+        self._lock = threading.Lock()
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._conn: Connection | None = None
+        self._deaths: list[float] = []
+        self._stopping = threading.Event()
+        self._supervisor: threading.Thread | None = None
+
+    def __repr__(self):
+        return f"<Worker for {self.url} pid={self.pid}>"
+
+    @property
+    def pid(self) -> int | None:
+        process = self._process
+        return process.pid if process is not None else None
+
+    def alive(self) -> bool:
+        process = self._process
+        return process is not None and process.is_alive()
+
+    def stand_in(self) -> _Hosted:
+        return _Hosted(self.url, self._bus, self.cached, self.streams)
+
+    def start(self) -> None:
+        """Start the child (a no-op if it runs) and supervise it. Raises
+        ChimeraObjectException if the object fails to configure or start
+        there."""
+        with self._lock:
+            if self.alive():
+                return
+            self._stopping.clear()
+            self._spawn()
+
+            if self._supervisor is None or not self._supervisor.is_alive():
+                self._supervisor = threading.Thread(
+                    target=self._supervise,
+                    name=f"{self.url.path}-supervisor",
+                    daemon=True,
+                )
+                self._supervisor.start()
+
+    def stop(self) -> None:
+        """Stop the object and its child, waiting stop_timeout for an
+        orderly exit before killing it."""
+        with self._lock:
+            self._stopping.set()
+            process, conn = self._process, self._conn
+            if process is not None and process.is_alive():
+                assert conn is not None
+                try:
+                    conn.send("stop")
+                except OSError:
+                    pass
+                self._reap(process)
+            if conn is not None:
+                conn.close()
+                self._conn = None
+
+        supervisor = self._supervisor
+        if supervisor is not None and supervisor is not threading.current_thread():
+            supervisor.join()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "url": self.url.url,
+            "pid": self.pid,
+            "alive": self.alive(),
+            "restarts": self.restarts,
+            "started": self.started,
+        }
+
+    def _reap(self, process: multiprocessing.process.BaseProcess) -> None:
+        process.join(self._stop_timeout)
+        if process.is_alive():
+            log.warning(
+                f"{self.url.path}: worker {process.pid} did not stop "
+                f"within {self._stop_timeout}s, killing it"
+            )
+            process.kill()
+            process.join()
+
+    def _spawn(self) -> None:
+        """Start a child and wait for its object to run. Call with the lock
+        held."""
+        context = multiprocessing.get_context("spawn")
+        conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_serve,
+            args=(
+                self._cls.__module__,
+                self._cls.__qualname__,
+                _import_root(self._cls),
+                self._name,
+                self._config,
+                self.url.bus,
+                self._bus.url.bus,
+                self._site,
+                child_conn,
+            ),
+            name=f"chimera-worker{self.url.path.replace('/', '-')}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            if not conn.poll(self._start_timeout):
+                raise ChimeraObjectException(
+                    f"{self.url.path}: worker did not start within {self._start_timeout}s"
+                )
+            status, payload = conn.recv()
+            if status != "ready":
+                raise ChimeraObjectException(f"{self.url.path}: {payload}")
+        except EOFError:
+            conn.close()
+            process.join()
+            raise ChimeraObjectException(
+                f"{self.url.path}: worker died while starting (exit code {process.exitcode})"
+            )
+        except ChimeraObjectException:
+            conn.close()
+            self._reap(process)
+            raise
+
+        bound, self.bases, self.cached, self.streams = payload
+        self.url = parse_url(f"{bound}{self.url.path}")
+        self._process, self._conn = process, conn
+        self.started = time.time()
+        log.info(f"{self.url.path}: running in worker {process.pid}")
+
+    def _supervise(self) -> None:
+        while True:
+            process = self._process
+            assert process is not None
+            wait([process.sentinel])
+            process.join()
+
+            if self._stopping.is_set():
+                return
+
+            now = time.monotonic()
+            self._deaths = [
+                death for death in self._deaths if now - death < self._restart_window
+            ] + [now]
+            if len(self._deaths) > self._max_restarts:
+                log.error(
+                    f"{self.url.path}: worker died {len(self._deaths)} times in "
+                    f"{self._restart_window}s, giving up"
+                )
+                return
+
+            delay = self._backoff * 2 ** (len(self._deaths) - 1)
+            log.error(
+                f"{self.url.path}: worker {process.pid} died (exit code "
+                f"{process.exitcode}), restarting in {delay:.1f}s"
+            )
+            if self._stopping.wait(delay):
+                return
+
+            with self._lock:
+                if self._stopping.is_set():
+                    return
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+                try:
+                    self._spawn()
+                except ChimeraObjectException:
+                    # the dead process is still the current one: counted
+                    # as another death right away
+                    log.exception(f"{self.url.path}: worker restart failed")
+                    continue
+                self.restarts += 1
+
+            # results memoized from the old process may not hold any more
+            self._bus.forget_resolutions(self.url.bus)
+
+
+#
+# child side
+#
+
+
+def _relay(manager_resolve: Callable[..., Any], parent: str, bus: Bus):
+    """A resolve_request for the worker's Manager: what it does not host is
+    looked for at the parent. Runs on the bus dispatch thread, so it never
+    blocks: the callables it returns talk to the parent when called, on the
+    handler pool for requests and on the control pool for pings (whose
+    get_location waits for the parent's answer)."""
+
+    @functools.wraps(manager_resolve)
+    def resolve_request(object: str, method: str):
+        path, callable = manager_resolve(object, method)
+        if path is not None:
+            return path, callable
+
+        proxy = Proxy(f"{parent}{object}", bus)
+        if method == "get_location":
+            # a ping: None answers "not here" without raising
+            return (
+                object,
+                lambda: proxy.__resolved_url__.url if proxy.exists() else None,
+            )
+        try:
+            return object, getattr(proxy, method)
+        except AttributeError:
+            return object, None
+
+    return resolve_request
+
+
+def _serve(
+    module: str,
+    qualname: str,
+    root: str,
+    name: str,
+    config: dict[str, Any],
+    url: str,
+    parent: str,
+    site: str | None,
+    conn: Connection,
+) -> None:
+    """The child process: host the object until the parent says stop (or
+    goes away)."""
+    from chimera.core.manager import Manager
+
+    # ctrl-c reaches the whole process group: the parent decides when we go
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    bus: Bus | None = None
+    manager: Manager | None = None
+    try:
+        cls: Any = import_module(module)
+        for attr in qualname.split("."):
+            cls = getattr(cls, attr)
+
+        try:
+            bus = Bus(url)
+        except Exception as e:
+            # a restarted child must listen where proxies already point
+            raise ChimeraException(f"worker bus could not bind {url}: {e}") from e
+        threading.Thread(target=bus.run_forever, name="worker-bus", daemon=True).start()
+        if not bus._bus_started.wait(10):
+            raise ChimeraException(f"worker bus did not start on {url}")
+
+        manager = Manager(bus)
+        # the parent's Manager is the one objects here talk to
+        manager.resources.remove(MANAGER_LOCATION)
+        bus.resolve_request = _relay(manager._resolve_request, parent, bus)
+
+        manager.add_class(cls, name, config, start=False)
+        resource = manager.resources.get(f"/{cls.__name__}/{name}")
+        assert resource is not None
+        if site is not None:
+            resource.instance.__site__ = Proxy(f"{parent}{site}", bus)
+        manager.start(resource.path)
+
+        instance = resource.instance
+        conn.send(
+            (
+                "ready",
+                (
+                    # with the port picked, if it was left to the child
+                    bus.url.bus,
+                    resource.bases,
+                    sorted(getattr(instance, CACHED_METHODS_ATTRIBUTE_NAME)),
+                    sorted(getattr(instance, STREAM_METHODS_ATTRIBUTE_NAME)),
+                ),
+            )
+        )
+    except Exception as e:
+        # raised by the parent's add_class/start
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        if manager is not None:
+            manager.shutdown()
+        if bus is not None:
+            bus.shutdown()
+        return
+
+    try:
+        conn.recv()
+    except EOFError:
+        # the parent died: nobody supervises us any more
+        pass
+    finally:
+        manager.shutdown()
+        bus.shutdown()
@@ -5,8 +5,12 @@ import threading
 import time
 from math import cos, pi, sin
 
+import numpy as np
+
+from chimera.controllers.imageserver import framering
 from chimera.controllers.imageserver.imagerequest import ImageRequest
 from chimera.controllers.imageserver.util import get_image_server
+from chimera.core.cached import memoize
 from chimera.core.chimeraobject import ChimeraObject
 from chimera.core.lock import lock
 from chimera.interfaces.camera import (
@@ -18,6 +22,9 @@ from chimera.interfaces.camera import (
 )
 from chimera.util.image import Image, ImageUtil
 
+# seconds before asking again an image server that does not share frames
+FRAME_RING_RETRY = 30.0
+
 
 class CameraBase(ChimeraObject, CameraExpose, CameraTemperature, CameraInformation):
     def __init__(self):
@@ -30,6 +37,12 @@ class CameraBase(ChimeraObject, CameraExpose, CameraTemperature, CameraInformati
 
         self.extra_header_info = dict()
 
+        # by image server URL: the ring slot reserved for our next frame,
+        # and when to ask again servers that do not share frames (no ring,
+        # or one on another host): they may turn it on or restart
+        self._frame_slots = {}
+        self._frame_retry = {}
+
     def __stop__(self):
         self.abort_exposure(readout=False)
 
@@ -130,17 +143,79 @@ class CameraBase(ChimeraObject, CameraExpose, CameraTemperature, CameraInformati
         image_request.headers += self.get_metadata(image_request)
         image = Image.create(image_data, image_request)
 
+        # consumers on this host get the frame before compression
+        server = get_image_server(self)
+        if server:
+            self._publish_frame(server, image, image_data)
+
         # compress the image if asked
         if image_request["compress_format"].lower() != "no":
             image.compress(format=image_request["compress_format"])
 
         # register image on ImageServer
-        server = get_image_server(self)
         if server:
             image.http(server.register(image.filename))
 
         return image
 
+    def _publish_frame(self, server, image, image_data):
+        """Hand the frame to consumers on this host through the image
+        server's shared-memory ring (see framering.py). Best effort: the
+        FITS file is always there."""
+        key = server.__resolved_url__.url
+        try:
+            # later slots come with each publish
+            handle = self._frame_slots.get(key)
+            if handle is None:
+                if time.monotonic() < self._frame_retry.get(key, 0):
+                    return None
+                handle = self._first_frame_slot(server)
+                if handle is None:
+                    self._frame_retry[key] = time.monotonic() + FRAME_RING_RETRY
+                    return None
+                self._frame_slots[key] = handle
+
+            try:
+                ring = framering.attach(handle["name"])
+            except FileNotFoundError:
+                # the server restarted with a new ring
+                del self._frame_slots[key]
+                return None
+
+            data = np.asarray(image_data)
+            if data.nbytes > ring.slot_size:
+                return None
+
+            handle = ring.write(handle, data)
+            handle["header"] = {
+                card: value
+                for card, value in image.items()
+                if card and isinstance(value, (str, int, float, bool))
+            }
+            handle["filename"] = image.filename
+            self._frame_slots.pop(key)
+            if (reserved := server.publish_frame(handle)) is not None:
+                self._frame_slots[key] = reserved
+            return handle
+        except Exception:
+            self.log.exception("Error publishing frame to shared memory")
+            # reserved anew next time
+            self._frame_slots.pop(key, None)
+            return None
+
+    def _first_frame_slot(self, server):
+        # looked up before reserving: a slot taken on a ring we cannot map
+        # would cost its frame to the consumers that can
+        name = server.get_frame_ring()
+        if name is None:
+            return None
+        try:
+            framering.attach(name)
+        except FileNotFoundError:
+            self.log.debug("image server on another host: frames not shared")
+            return None
+        return server.reserve_frame()
+
     def _get_readout_mode_info(self, binning, window):
         """
         Check if the given binning and window could be used.
@@ -335,6 +410,8 @@ class CameraBase(ChimeraObject, CameraExpose, CameraTemperature, CameraInformati
             scale_x = bin_factor * (((180 / pi) / focal_length) * (pix_w * 0.001))
             scale_y = bin_factor * (((180 / pi) / focal_length) * (pix_h * 0.001))
 
+            cos_rotation, sin_rotation = self._rotation_terms()
+
             full_width, full_height = self.get_physical_size()
             crpix1 = ((int(full_width / 2.0)) - left) - 1
             crpix2 = ((int(full_height / 2.0)) - top) - 1
@@ -348,24 +425,30 @@ class CameraBase(ChimeraObject, CameraExpose, CameraTemperature, CameraInformati
                 ("CRPIX2", crpix2, "coordinate system reference pixel"),
                 (
                     "CD1_1",
-                    scale_x * cos(self["rotation"] * pi / 180.0),
+                    scale_x * cos_rotation,
                     "transformation matrix element (1,1)",
                 ),
                 (
                     "CD1_2",
-                    -scale_y * sin(self["rotation"] * pi / 180.0),
+                    -scale_y * sin_rotation,
                     "transformation matrix element (1,2)",
                 ),
                 (
                     "CD2_1",
-                    scale_x * sin(self["rotation"] * pi / 180.0),
+                    scale_x * sin_rotation,
                     "transformation matrix element (2,1)",
                 ),
                 (
                     "CD2_2",
-                    scale_y * cos(self["rotation"] * pi / 180.0),
+                    scale_y * cos_rotation,
                     "transformation matrix element (2,2)",
                 ),
             ]
 
         return md
+
+    @memoize("rotation")
+    def _rotation_terms(self) -> tuple[float, float]:
+        # the WCS matrix of every frame needs them
+        rotation = self["rotation"] * pi / 180.0
+        return cos(rotation), sin(rotation)
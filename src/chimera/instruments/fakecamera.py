@@ -164,16 +164,16 @@ class FakeCamera(CameraBase):
         self.readout_begin(image_request)
 
         telescope = self.get_proxy("/Telescope/0")
-        if not telescope.ping():
+        if not telescope.exists():
             telescope = None
 
         dome = self.get_proxy("/Dome/0")
-        if not dome.ping():
+        if not dome.exists():
             dome = None
 
         if self["rotator"]:
             rotator: Rotator = self.get_proxy(self["rotator"])
-            if not rotator.ping():
+            if not rotator.exists():
                 rotator = None
         else:
             rotator = None
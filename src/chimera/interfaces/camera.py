@@ -2,6 +2,7 @@
 # SPDX-FileCopyrightText: 2006-present Paulo Henrique Silva <ph.silva@gmail.com>
 
 
+from chimera.core.cached import cached
 from chimera.core.event import event
 from chimera.core.exceptions import ChimeraException
 from chimera.core.interface import Interface
@@ -301,22 +302,30 @@ class CameraInformation(Camera):
     # example:
     # ADCs = {'12 bits': SomeInternalValueWhichMapsTo12BitsADC,
     #         '16 bits': SomeInternalValueWhichMapsTo16BitsADC}
+    #
+    # the answers are @cached: they may only depend on the configuration
 
+    @cached
     def get_binnings(self):
         pass
 
+    @cached
     def get_adcs(self):
         pass
 
+    @cached
     def get_physical_size(self):
         pass
 
+    @cached
     def get_pixel_size(self):
         pass
 
+    @cached
     def get_overscan_size(self):
         pass
 
+    @cached
     def get_readout_modes(self):
         """Get readout modes supported by this camera.
         The return value would have the following format:
@@ -2,6 +2,7 @@
 # SPDX-FileCopyrightText: 2006-present Paulo Henrique Silva <ph.silva@gmail.com>
 
 
+from chimera.core.cached import cached
 from chimera.core.event import event
 from chimera.core.exceptions import ChimeraException
 from chimera.core.interface import Interface
@@ -62,6 +63,7 @@ class FilterWheel(Interface):
         @rtype: str
         """
 
+    @cached
     def get_filters(self):
         """
         Return a tuple with the available filter on this wheel.
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# one per [project.scripts] entry point; scripts run these in tight loops
+TOOLS = [
+    "chimera",
+    "cam",
+    "ctl",
+    "dome",
+    "filter",
+    "focus",
+    "guider",
+    "rotator",
+    "sched",
+    "tel",
+    "weather",
+]
+
+# about 0.2-0.3 s with warm bytecode: a ceiling well above that, so a loaded
+# machine passes and astropy or the scheduler database at start-up does not
+BUDGET = 1.5
+
+# only the actions that need them import these: each one costs more to
+# import than the rest of a tool (about 0.2 s, chimera.core and rich)
+HEAVY = [
+    "astropy.io.fits",
+    "astropy.time",
+    "astropy.wcs",
+    "chimera.controllers.scheduler.model",
+    "chimera.util.ds9",
+    "chimera.util.image",
+    "sqlalchemy",
+    "yaml",
+]
+
+
+@pytest.fixture(scope="module")
+def pycache(tmp_path_factory):
+    return tmp_path_factory.mktemp("pycache")
+
+
+def import_time(module: str, pycache) -> tuple[float, set[str]]:
+    """Seconds to import module in a fresh interpreter, and what it imported."""
+    env = dict(os.environ)
+    # compiling is paid once after install, not on every start
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-X",
+        f"pycache_prefix={pycache}",
+        "-c",
+        f"import {module}",
+    ]
+    subprocess.run(command, env=env, check=True, capture_output=True)
+    stderr = subprocess.run(
+        command, env=env, check=True, capture_output=True, text=True
+    ).stderr
+
+    imported = set()
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        imported.add(name.strip())
+        if name.strip() == module:
+            total = int(cumulative)
+    return total / 1e6, imported
+
+
+@pytest.mark.parametrize("tool", TOOLS)
+def test_startup(tool, pycache):
+    module = f"chimera.cli.{tool}"
+    seconds, imported = import_time(module, pycache)
+    print(f"{module}: {seconds * 1000:.0f} ms")
+
+    assert not imported & set(HEAVY)
+    assert seconds < BUDGET
@@ -0,0 +1,134 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from chimera.controllers.imageserver import framering
+from chimera.controllers.imageserver.framering import FrameRing
+from chimera.controllers.imageserver.imageserver import ImageServer
+from chimera.instruments import camera as camera_module
+from chimera.instruments.fakecamera import FakeCamera
+from chimera.util.image import Image
+
+
+@pytest.fixture
+def ring():
+    ring = FrameRing.create(slots=3, slot_size=4096)
+    yield ring
+    ring.close()
+
+
+def put(ring: FrameRing, data: np.ndarray) -> dict:
+    handle = ring.reserve(data.nbytes)
+    assert handle is not None
+    handle = ring.write(handle, data)
+    assert ring.publish(handle)
+    return handle
+
+
+def test_write_and_view(ring):
+    data = np.arange(32 * 32, dtype=np.uint16).reshape(32, 32)
+    handle = put(ring, data)
+
+    # mapped once per process
+    assert framering.attach(ring.name) is ring
+
+    # what another process sees
+    other = FrameRing(SharedMemory(ring.name, track=False), owner=False)
+    frame = other.view(handle)
+    assert np.array_equal(frame, data)
+    assert not frame.flags.writeable
+    assert other.valid(handle)
+    assert ring.latest() == handle
+    del frame
+    other.close()
+    assert not other.valid(handle)
+
+    # too big for a slot
+    assert ring.reserve(ring.slot_size + 1) is None
+
+
+def test_overwrite(ring):
+    data = np.zeros(16, dtype=np.int32)
+    first = put(ring, data)
+
+    # held frames are kept while any other slot is free
+    assert ring.acquire(first["seq"]) == first
+    others = [put(ring, data + i) for i in range(1, 5)]
+    assert first["slot"] not in {handle["slot"] for handle in others}
+    assert ring.valid(first)
+    assert not ring.valid(others[0])
+    assert ring.stats()["overwritten"] == 0
+
+    # every slot held: the oldest goes anyway, and its reader can tell
+    for handle in others[-2:]:
+        ring.acquire(handle["seq"])
+    last = put(ring, data + 9)
+    assert last["slot"] == first["slot"]
+    assert not ring.valid(first)
+    assert ring.acquire(first["seq"]) is None
+    assert ring.stats()["overwritten"] == 1
+
+    # a slot taken over before its writer published
+    stale = ring.reserve(data.nbytes)
+    for handle in others[-2:] + [last]:
+        ring.release(handle["seq"])
+    ring.reserve(data.nbytes)
+    ring.reserve(data.nbytes)
+    ring.reserve(data.nbytes)
+    assert not ring.publish(ring.write(stale, data))
+
+
+def test_camera_publishes_frames(manager, tmp_path, wait_for):
+    manager.add_class(
+        ImageServer,
+        "server",
+        config={"images_dir": str(tmp_path), "httpd": False, "frame_ring": True},
+    )
+    manager.add_class(FakeCamera, "fake")
+
+    server = manager.get_proxy("/ImageServer/0")
+    camera = manager.get_proxy("/FakeCamera/fake")
+
+    ready = []
+    server.frame_ready += lambda handle: ready.append(handle)
+
+    (url,) = camera.expose(exptime=0, filename=str(tmp_path / "frame.fits"))
+
+    assert wait_for(lambda: ready)
+    handle = ready[0]
+    assert handle == server.get_latest_frame()
+    image = Image.from_url(url)
+    assert handle["filename"] == image.filename
+
+    with framering.mapped_frame(server, handle) as frame:
+        assert frame is not None
+        assert server.get_frame_stats()["references"] == 1
+        assert np.array_equal(frame, image._fd[0].data)
+    assert server.get_frame_stats()["references"] == 0
+
+    # the next frame goes to the slot reserved when this one was published
+    camera.expose(exptime=0, filename=str(tmp_path / "frame.fits"))
+    assert wait_for(lambda: len(ready) == 2)
+    assert ready[1]["seq"] == handle["seq"] + 1
+    assert server.get_frame_stats()["published"] == 2
+
+
+def test_camera_picks_up_ring_turned_on(manager, tmp_path, wait_for, monkeypatch):
+    monkeypatch.setattr(camera_module, "FRAME_RING_RETRY", 0.0)
+    manager.add_class(
+        ImageServer, "server", config={"images_dir": str(tmp_path), "httpd": False}
+    )
+    manager.add_class(FakeCamera, "fake")
+
+    server = manager.get_proxy("/ImageServer/0")
+    camera = manager.get_proxy("/FakeCamera/fake")
+
+    # off by default: nothing shared
+    camera.expose(exptime=0, filename=str(tmp_path / "frame.fits"))
+    assert server.get_frame_stats() is None
+
+    server["frame_ring"] = True
+    camera.expose(exptime=0, filename=str(tmp_path / "frame.fits"))
+    assert wait_for(lambda: server.get_latest_frame() is not None)
+    assert server.get_frame_stats()["published"] == 1
@@ -1,25 +1,44 @@
+import asyncio
 import logging
 import os
 import threading
 import time
 from collections.abc import Callable, Generator
+from concurrent.futures import Future
 from concurrent.futures.thread import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
 import msgspec
 import pytest
 
-from chimera.core.bus import Bus, EventId, _Peer
+from chimera.core.bus import (
+    Bus,
+    EventId,
+    _EventGate,
+    _FutureMailbox,
+    _Peer,
+    _Writer,
+)
+from chimera.core.cached import cached
 from chimera.core.chimeraobject import ChimeraObject
 from chimera.core.exceptions import (
     BusDeadException,
     ObjectBusyException,
+    ObjectNotFoundException,
     RequestTimeoutException,
 )
-from chimera.core.lock import lock
+from chimera.core.lock import lock, urgent
 from chimera.core.manager import Manager
-from chimera.core.protocol import Protocol, Subscribe
+from chimera.core.protocol import (
+    BatchResponse,
+    Event,
+    EventFilter,
+    Protocol,
+    Publish,
+    Subscribe,
+)
 from chimera.core.proxy import Proxy
 from chimera.core.transport import SendResult, Transport
 from chimera.core.transport_factory import create_transport
@@ -313,6 +332,41 @@ def test_rpc_remote(create_bus: Callable[[str], Bus]):
     rpc_test(n=2_000, src_bus=my_bus, dst_bus=other_bus)
 
 
+def test_rpc_inproc(create_bus: Callable[[str], Bus]):
+    my_bus = create_bus("inproc://rpc-client")
+    other_bus = create_bus("inproc://rpc-server")
+    rpc_test(n=2_000, src_bus=my_bus, dst_bus=other_bus)
+
+
+def test_rpc_ipc(create_bus: Callable[[str], Bus], tmp_path: Path):
+    my_bus = create_bus(f"ipc://{tmp_path}/client.sock")
+    other_bus = create_bus(f"ipc://{tmp_path}/server.sock")
+    rpc_test(n=2_000, src_bus=my_bus, dst_bus=other_bus)
+
+
+def test_local_bus_thread_names(create_bus: Callable[[str], Bus], tmp_path: Path):
+    buses = [
+        create_bus("inproc://names-a"),
+        create_bus("inproc://names-b"),
+        create_bus(f"ipc://{tmp_path}/names.sock"),
+    ]
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(bus.run_forever) for bus in buses]
+    for bus in buses:
+        assert bus._bus_started.wait(5)
+
+    # port 0 for all of them: named by address instead
+    names = {thread.name for thread in threading.enumerate()}
+    for address in ("names-a", "names-b", f"{tmp_path}/names.sock"):
+        assert f"chimera-bus-dispatch-{address}" in names
+
+    for bus in buses:
+        bus.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+
 def test_pubsub_local(create_bus: Callable[[str], Bus]):
     bus = create_bus("tcp://127.0.0.1:4000")
     pubsub_test(n_subscribers=2, n_events=2, src_bus=bus, dst_bus=bus)
@@ -324,6 +378,12 @@ def test_pubsub_remote(create_bus: Callable[[str], Bus]):
     pubsub_test(n_subscribers=2, n_events=1_000, src_bus=my_bus, dst_bus=other_bus)
 
 
+def test_pubsub_inproc(create_bus: Callable[[str], Bus]):
+    my_bus = create_bus("inproc://pubsub-subscriber")
+    other_bus = create_bus("inproc://pubsub-publisher")
+    pubsub_test(n_subscribers=2, n_events=1_000, src_bus=my_bus, dst_bus=other_bus)
+
+
 #
 # transport hardening: recv drain + backpressure classification
 #
@@ -581,6 +641,35 @@ class BlockingTransport(AlwaysAgainTransport):
         return SendResult.OK
 
 
+def test_writer_close_waits_for_a_stuck_send():
+    """A writer thread still stuck in a send when close() gives up waiting
+    keeps its waker pipe: the fds are closed on its way out, never reused
+    under it."""
+    release = threading.Event()
+    transport = BlockingTransport("tcp://127.0.0.1:1", release)
+    peer = _Peer(transport)
+    peer.enqueue(b"frame", False)
+
+    writer = _Writer("test-writer")
+    writer.wake(peer)
+    deadline = time.monotonic() + 5
+    while not transport.send_count:
+        assert time.monotonic() < deadline, "writer never sent"
+        time.sleep(0.01)
+    thread = writer._thread
+
+    writer.close()
+    assert thread.is_alive()
+    os.fstat(writer._waker_r)
+    os.fstat(writer._waker_w)
+
+    release.set()
+    thread.join(5)
+    for fd in (writer._waker_r, writer._waker_w):
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+
 class BlackholeTransport(AlwaysAgainTransport):
     """send accepts everything; nothing ever arrives anywhere — a silent
     partition, invisible to pipe-removal callbacks."""
@@ -1796,10 +1885,13 @@ def test_bus_stats_snapshot(create_bus: Callable[[str], Bus]):
     box = stats["mailboxes"][0]
     assert box["dst_bus"] == bus.url.bus
     assert box["age"] >= 0
-    assert peer_url in stats["peers"]
-    assert {"publisher": pub, "event": "slew_begin", "subscribers": 1} in stats[
-        "subscribers"
-    ]
+    assert peer_url in [peer["bus"] for peer in stats["peers"]]
+    assert {
+        "publisher": pub,
+        "event": "slew_begin",
+        "subscribers": 1,
+        "filtered": 0,
+    } in stats["subscribers"]
 
     # pool snapshot: limits, backlog and per-thread state (the pool spawns
     # lazily, so wait until the pending request's handler occupies a thread)
@@ -2009,3 +2101,1317 @@ def test_remote_unserializable_result_returns_error(create_bus: Callable[..., Bu
     dst_bus_future.result()
     src_bus_future.result()
     pool.shutdown()
+
+
+#
+# batched requests: many calls, one round trip
+#
+
+
+class BatchInstrument(ChimeraObject):
+    def get_ra(self) -> float:
+        return 10.5
+
+    def get_dec(self) -> float:
+        return -20.25
+
+    @lock
+    def is_slewing(self) -> bool:
+        return False
+
+    def fail(self) -> None:
+        raise ValueError("boom")
+
+
+def test_request_many_one_message_per_bus(create_bus: Callable[..., Bus]):
+    """Calls to one bus travel as a single Batch and come back as a single
+    BatchResponse, in call order, each call failing or succeeding alone."""
+    src_bus = create_bus("tcp://127.0.0.1:15073")
+    dst_bus = create_bus("tcp://127.0.0.1:15074")
+
+    calls: list[str] = []
+
+    def echo(x: int) -> int:
+        return x
+
+    @lock
+    def locked_echo(x: int) -> int:
+        return x
+
+    def resolve(object: str, method: str):
+        calls.append(method)
+        match method:
+            case "get_location":
+                return "/Echo/0", lambda: f"{dst_bus.url.bus}/Echo/0"
+            case "echo":
+                return "/Echo/0", echo
+            case "locked_echo":
+                return "/Echo/0", locked_echo
+        return "/Echo/0", None
+
+    dst_bus.resolve_request = resolve
+
+    pool = ThreadPoolExecutor()
+    src_future = pool.submit(src_bus.run_forever)
+    dst_future = pool.submit(dst_bus.run_forever)
+    assert src_bus._bus_started.wait(5)
+    assert dst_bus._bus_started.wait(5)
+
+    src = f"{src_bus.url.bus}/Proxy/0"
+    dst = f"{dst_bus.url.bus}/Echo/0"
+    assert src_bus.ping(src=src, dst=dst).ok
+
+    sent: list[str] = []
+    push = src_bus._push
+
+    def spy(message):
+        if message.dst_bus != src_bus.url.bus:
+            sent.append(type(message).__name__)
+        return push(message)
+
+    src_bus._push = spy
+
+    responses = src_bus.request_many(
+        src=src,
+        calls=[
+            (dst, "echo", [1], {}),
+            (dst, "locked_echo", [2], {}),
+            (dst, "missing", [], {}),
+            (dst, "echo", [], {"x": 4}),
+        ],
+        timeout=5.0,
+    )
+
+    assert sent == ["Batch"]
+    assert [r.code for r in responses] == [200, 200, 404, 200]
+    assert [r.result for r in responses] == [1, 2, None, 4]
+    assert len(src_bus._mailboxes._boxes) == 0
+
+    src_bus.shutdown()
+    dst_bus.shutdown()
+    src_future.result()
+    dst_future.result()
+    pool.shutdown()
+
+
+def test_request_many_json_peer_pipelined(create_bus: Callable[..., Bus]):
+    """A peer that never negotiated a codec may predate batches: its calls
+    are pipelined as plain requests instead."""
+    src_bus = create_bus("tcp://127.0.0.1:15075")
+    dst_bus = create_bus("tcp://127.0.0.1:15076")
+
+    def echo(x: int) -> int:
+        return x
+
+    dst_bus.resolve_request = lambda object, method: ("/Echo/0", echo)
+
+    pool = ThreadPoolExecutor()
+    src_future = pool.submit(src_bus.run_forever)
+    dst_future = pool.submit(dst_bus.run_forever)
+    assert src_bus._bus_started.wait(5)
+    assert dst_bus._bus_started.wait(5)
+
+    sent: list[str] = []
+    push = src_bus._push
+
+    def spy(message):
+        if message.dst_bus != src_bus.url.bus:
+            sent.append(type(message).__name__)
+        return push(message)
+
+    src_bus._push = spy
+
+    dst = f"{dst_bus.url.bus}/Echo/0"
+    responses = src_bus.request_many(
+        src=f"{src_bus.url.bus}/Proxy/0",
+        calls=[(dst, "echo", [i], {}) for i in range(5)],
+        timeout=5.0,
+    )
+    assert sent == ["Request"] * 5
+    assert [r.result for r in responses] == list(range(5))
+
+    src_bus.shutdown()
+    dst_bus.shutdown()
+    src_future.result()
+    dst_future.result()
+    pool.shutdown()
+
+
+def test_request_many_timeout(create_bus: Callable[..., Bus]):
+    bus = create_bus("tcp://127.0.0.1:15077")
+
+    release = threading.Event()
+
+    def hang() -> bool:
+        release.wait(10)
+        return True
+
+    bus.resolve_request = lambda object, method: ("/Slow/0", hang)
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    dst = f"{bus.url.bus}/Slow/0"
+    with pytest.raises(RequestTimeoutException):
+        bus.request_many(
+            src=f"{bus.url.bus}/Proxy/0",
+            calls=[(dst, "hang", [], {}), (dst, "hang", [], {})],
+            timeout=0.2,
+        )
+    assert len(bus._mailboxes._boxes) == 0
+
+    release.set()
+    bus.shutdown()
+    bus_future.result()
+    pool.shutdown()
+
+
+def test_proxy_batch_futures(create_bus: Callable[..., Bus]):
+    bus = create_bus("tcp://127.0.0.1:15078")
+    manager = Manager(bus)
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    telescope = manager.add_class(BatchInstrument, "tel", start=False)
+    dome = manager.add_class(BatchInstrument, "dome", start=False)
+
+    with telescope.batch() as batch:
+        ra = batch.get_ra()
+        dec = batch.get_dec()
+        slewing = batch.is_slewing()
+        failed = batch.fail()
+        dome_ra = batch.on(dome).get_ra()
+        assert len(batch) == 5
+        assert not ra.done()
+
+    assert ra.result() == 10.5
+    assert dec.result() == -20.25
+    assert slewing.result() is False
+    assert dome_ra.result() == 10.5
+    with pytest.raises(Exception, match="boom"):
+        failed.result()
+
+    # nothing is sent when the block raises
+    with pytest.raises(RuntimeError):
+        with telescope.batch() as batch:
+            pending = batch.get_ra()
+            raise RuntimeError()
+    assert pending.cancelled()
+
+    # benchmark: six getters one by one vs. one batch
+    print()
+    n = 200
+    getters = ["get_ra", "get_dec", "is_slewing"] * 2
+    t0 = time.monotonic()
+    for _ in range(n):
+        for getter in getters:
+            getattr(telescope, getter)()
+    print_results("6 getters", n, time.monotonic() - t0)
+
+    t0 = time.monotonic()
+    for _ in range(n):
+        with telescope.batch() as batch:
+            futures = [getattr(batch, getter)() for getter in getters]
+        assert all(future.done() for future in futures)
+    print_results("6 getters batched", n, time.monotonic() - t0)
+
+    manager.shutdown()
+    bus.shutdown()
+    bus_future.result()
+    pool.shutdown()
+
+
+#
+# future-based requests: no thread parked per call
+#
+
+
+def test_submit_request_many_in_flight(create_bus: Callable[..., Bus]):
+    src_bus = create_bus("tcp://127.0.0.1:15079")
+    dst_bus = create_bus("tcp://127.0.0.1:15080")
+
+    def echo(x: int) -> int:
+        return x
+
+    dst_bus.resolve_request = lambda object, method: ("/Echo/0", echo)
+
+    pool = ThreadPoolExecutor()
+    src_future = pool.submit(src_bus.run_forever)
+    dst_future = pool.submit(dst_bus.run_forever)
+    assert src_bus._bus_started.wait(5)
+    assert dst_bus._bus_started.wait(5)
+
+    threads_before = threading.active_count()
+
+    n = 300
+    futures = []
+    for i in range(n):
+        futures.append(
+            src_bus.submit_request(
+                src=f"{src_bus.url.bus}/Proxy/0",
+                dst=f"{dst_bus.url.bus}/Echo/0",
+                method="echo",
+                args=[i],
+                timeout=10.0,
+            )
+        )
+        # the caller never blocks on a reply
+        assert threading.active_count() - threads_before < 150
+
+    assert [future.result(timeout=10).result for future in futures] == list(range(n))
+    assert len(src_bus._mailboxes._boxes) == 0
+
+    src_bus.shutdown()
+    dst_bus.shutdown()
+    src_future.result()
+    dst_future.result()
+    pool.shutdown()
+
+
+def test_future_mailbox_first_resolution_wins():
+    # a response, expiry and a dead peer race on different pool threads
+    for _ in range(200):
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        mailbox = _FutureMailbox("tcp://127.0.0.1:1", future, "slew", lambda f: f())
+        start = threading.Barrier(3)
+
+        def resolve(**kwargs):
+            start.wait()
+            mailbox._resolve(**kwargs)
+
+        threads = [
+            threading.Thread(target=resolve, kwargs={"result": "done"}),
+            threading.Thread(
+                target=resolve, kwargs={"error": BusDeadException("dead")}
+            ),
+            threading.Thread(
+                target=resolve, kwargs={"error": RequestTimeoutException("late")}
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert future.done()
+
+    cancelled: Future = Future()
+    cancelled.cancel()
+    _FutureMailbox("tcp://127.0.0.1:1", cancelled, "slew", lambda f: f())._resolve(
+        result="done"
+    )
+    assert cancelled.cancelled()
+
+
+def test_submit_request_timeout_and_cancel(create_bus: Callable[..., Bus]):
+    bus = create_bus("tcp://127.0.0.1:15081")
+
+    release = threading.Event()
+
+    def hang() -> bool:
+        release.wait(10)
+        return True
+
+    bus.resolve_request = lambda object, method: ("/Slow/0", hang)
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    src = f"{bus.url.bus}/Proxy/0"
+    dst = f"{bus.url.bus}/Slow/0"
+
+    timed_out = bus.submit_request(src=src, dst=dst, method="hang", timeout=0.2)
+    with pytest.raises(RequestTimeoutException):
+        timed_out.result(timeout=5)
+
+    cancelled = bus.submit_request(src=src, dst=dst, method="hang")
+    assert cancelled.cancel()
+    assert len(bus._mailboxes._boxes) == 0
+
+    # a dying bus fails whatever is still pending
+    pending = bus.submit_request(src=src, dst=dst, method="hang")
+    shutdown = pool.submit(bus.shutdown)
+    with pytest.raises(BusDeadException):
+        pending.result(timeout=5)
+
+    release.set()
+    shutdown.result()
+    bus_future.result()
+    pool.shutdown()
+
+
+class AsyncInstrument(ChimeraObject):
+    def echo(self, x: int) -> int:
+        return x
+
+    def fail(self) -> None:
+        raise ValueError("boom")
+
+
+def test_proxy_submit_and_aio(create_bus: Callable[..., Bus]):
+    bus = create_bus("tcp://127.0.0.1:15082")
+    manager = Manager(bus)
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    manager.add_class(AsyncInstrument, "a", start=False)
+    proxy = Proxy(f"{bus.url.bus}/AsyncInstrument/0", bus)
+
+    futures = [proxy.echo.submit(i) for i in range(50)]
+    assert [future.result(timeout=5) for future in futures] == list(range(50))
+
+    with pytest.raises(Exception, match="boom"):
+        proxy.fail.submit().result(timeout=5)
+
+    async def gather() -> list[int]:
+        fresh = Proxy(f"{bus.url.bus}/AsyncInstrument/a", bus)
+        return await asyncio.gather(*(fresh.echo.aio(i) for i in range(50)))
+
+    assert asyncio.run(gather()) == list(range(50))
+
+    manager.shutdown()
+    bus.shutdown()
+    bus_future.result()
+    pool.shutdown()
+
+
+def test_conflated_subscription_delivers_latest(create_bus: Callable[..., Bus]):
+    """A conflated subscriber stuck in its callback sees only the newest
+    payload afterwards, never runs concurrently with itself, and does not
+    pile stale values into the handler pool."""
+    bus = create_bus("tcp://127.0.0.1:15083")
+
+    pub = f"{bus.url.bus}/Telescope/0"
+    event_id = EventId(pub, "position")
+
+    release = threading.Event()
+    latest = threading.Event()
+    received: list[int] = []
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def callback(value: int):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        release.wait(5)
+        received.append(value)
+        with lock:
+            running -= 1
+        if value == 100:
+            latest.set()
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    bus.subscribe(
+        sub=f"{bus.url.bus}/Proxy/0",
+        pub=pub,
+        event="position",
+        callback=callback,
+        conflate=True,
+    )
+    for value in range(100):
+        bus.publish(pub=pub, event="position", args=[value], kwargs={})
+
+    deadline = time.monotonic() + 5
+    (callback_entry,) = bus.callbacks(event_id).values()
+    # one payload is in the stuck callback, one pending, the rest replaced
+    while callback_entry.conflator.coalesced < 98:
+        assert time.monotonic() < deadline, "events never coalesced"
+        time.sleep(0.01)
+
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while len(received) < 2:
+        assert time.monotonic() < deadline, "pending payload never delivered"
+        time.sleep(0.01)
+
+    # a burst of 100 collapsed into the one in flight plus the newest pending
+    assert len(received) == 2
+    assert max_running == 1
+
+    bus.publish(pub=pub, event="position", args=[100], kwargs={})
+    assert latest.wait(5), "conflated subscriber stopped after the burst"
+    assert received[-1] == 100
+
+    stats = bus.stats()
+    assert stats["callbacks"][0]["coalesced"] == 101 - len(received)
+
+    bus.shutdown()
+    bus_future.result()
+    pool.shutdown()
+
+
+def test_event_gate_conditions():
+    """EventFilter conditions: all must hold, and min_delta/min_interval
+    compare against the last event let through, not the last one seen."""
+    gate = _EventGate(EventFilter(arg="status", equals="OK"))
+    assert gate.accepts([], {"status": "OK"}, now=0)
+    assert not gate.accepts([], {"status": "ERROR"}, now=0)
+    assert not gate.accepts([], {}, now=0)  # no such argument
+
+    gate = _EventGate(EventFilter(arg=0, above=10.0))
+    assert gate.accepts([11.0], {}, now=0)
+    assert not gate.accepts([10.0], {}, now=0)
+    assert not gate.accepts(["not a number"], {}, now=0)
+
+    gate = _EventGate(EventFilter(arg=0, min_delta=1.0))
+    assert gate.accepts([0.0], {}, now=0)
+    assert not gate.accepts([0.6], {}, now=0)
+    assert gate.accepts([1.2], {}, now=0)  # moved 1.2 since the last delivered
+    assert not gate.accepts([0.5], {}, now=0)
+
+    gate = _EventGate(EventFilter(min_interval=1.0))
+    assert gate.accepts([], {}, now=10.0)
+    assert not gate.accepts([], {}, now=10.5)
+    assert gate.accepts([], {}, now=11.0)
+
+    assert gate.filtered == 1
+
+
+def test_event_filter_applied_on_publisher(create_bus: Callable[..., Bus]):
+    """Filtered-out events never leave the publisher bus, and a bus holding
+    both a filtered and an unfiltered subscription runs only the callbacks
+    the event passed the filters for."""
+    bus_a = create_bus("tcp://127.0.0.1:15084")
+    bus_b = create_bus("tcp://127.0.0.1:15085")
+
+    pub = f"{bus_a.url.bus}/Camera/0"
+    event_id = EventId(pub, "readout_complete")
+
+    sent: list[Event] = []
+    original_push = bus_a._push
+
+    def spying_push(message):
+        if isinstance(message, Event) and message.dst_bus == bus_b.url.bus:
+            sent.append(message)
+        return original_push(message)
+
+    bus_a._push = spying_push
+
+    pool = ThreadPoolExecutor()
+    a_future = pool.submit(bus_a.run_forever)
+    b_future = pool.submit(bus_b.run_forever)
+    assert bus_a._bus_started.wait(5)
+    assert bus_b._bus_started.wait(5)
+
+    ok: list[str] = []
+    everything: list[str] = []
+    got_ok = threading.Event()
+    got_all = threading.Event()
+
+    def on_ok(status: str):
+        ok.append(status)
+        got_ok.set()
+
+    def on_everything(status: str):
+        everything.append(status)
+        got_all.set()
+
+    bus_b.subscribe(
+        sub=f"{bus_b.url.bus}/Proxy/0",
+        pub=pub,
+        event="readout_complete",
+        callback=on_ok,
+        filter=EventFilter(arg="status", equals="OK"),
+    )
+
+    deadline = time.monotonic() + 5
+    while len(bus_a.subscribers(event_id)) < 1:
+        assert time.monotonic() < deadline, "publisher never saw the subscription"
+        time.sleep(0.01)
+
+    bus_a.publish(pub=pub, event="readout_complete", kwargs={"status": "ERROR"})
+    bus_a.publish(pub=pub, event="readout_complete", kwargs={"status": "OK"})
+    assert got_ok.wait(5)
+    assert ok == ["OK"]
+    assert len(sent) == 1 and sent[0].callbacks is None
+
+    bus_b.subscribe(
+        sub=f"{bus_b.url.bus}/Proxy/1",
+        pub=pub,
+        event="readout_complete",
+        callback=on_everything,
+    )
+
+    deadline = time.monotonic() + 5
+    while len(bus_a.subscribers(event_id)) < 2:
+        assert time.monotonic() < deadline, "publisher never saw the subscription"
+        time.sleep(0.01)
+
+    bus_a.publish(pub=pub, event="readout_complete", kwargs={"status": "ERROR"})
+    assert got_all.wait(5)
+    time.sleep(0.1)  # settle before asserting an absence
+    assert everything == ["ERROR"]
+    assert ok == ["OK"]
+    assert len(sent) == 2 and sent[1].callbacks is not None
+
+    (entry,) = bus_a.stats()["subscribers"]
+    assert entry["filtered"] == 2
+
+    bus_a._push = original_push
+    bus_a.shutdown()
+    bus_b.shutdown()
+    a_future.result()
+    b_future.result()
+    pool.shutdown()
+
+
+def test_idle_peers_reaped(create_bus: Callable[..., Bus]):
+    """Outbound links unused for peer_idle_timeout are closed, except links
+    to subscribers; a reaped peer is dialed again on the next send."""
+    bus = create_bus("tcp://127.0.0.1:15086", peer_idle_timeout=0.2)
+    server = create_bus("tcp://127.0.0.1:15087")
+    subscriber = create_bus("tcp://127.0.0.1:15088")
+    server.resolve_request = resolve_request
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(b.run_forever) for b in (bus, server, subscriber)]
+    assert all(b._bus_started.wait(5) for b in (bus, server, subscriber))
+
+    pub = f"{bus.url.bus}/Telescope/0"
+    subscriber.subscribe(
+        sub=f"{subscriber.url.bus}/Proxy/0",
+        pub=pub,
+        event="tick",
+        callback=lambda: None,
+    )
+    deadline = time.monotonic() + 5
+    while not bus.subscribers(EventId(pub, "tick")):
+        assert time.monotonic() < deadline, "subscription never arrived"
+        time.sleep(0.01)
+    bus.publish(pub=pub, event="tick", args=[], kwargs={})
+
+    def get_az() -> Any:
+        return bus.request(
+            src=f"{bus.url.bus}/Proxy/0",
+            dst=f"{server.url.bus}/Telescope/0",
+            method="get_az",
+        ).result
+
+    assert get_az() == 42.0
+    deadline = time.monotonic() + 5
+    while subscriber.url.bus not in bus._peers:
+        assert time.monotonic() < deadline, "publisher never dialed the subscriber"
+        time.sleep(0.01)
+
+    (entry,) = [p for p in bus.stats()["peers"] if p["bus"] == server.url.bus]
+    assert entry["idle"] < 0.2
+
+    # health pings do not keep an idle link alive
+    time.sleep(0.3)
+    bus._health_check_once()
+    bus._reap_peers()
+    assert server.url.bus not in bus._peers
+    assert subscriber.url.bus in bus._peers
+
+    assert get_az() == 42.0
+    assert server.url.bus in bus._peers
+
+    for b in (bus, server, subscriber):
+        b.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+
+def test_max_peers_closes_least_recently_used(create_bus: Callable[..., Bus]):
+    """Dialing beyond max_peers closes the least recently used link."""
+    bus = create_bus("tcp://127.0.0.1:15089", max_peers=2, peer_idle_timeout=None)
+    server = create_bus("tcp://127.0.0.1:15090")
+    server.resolve_request = resolve_request
+
+    old_url = "tcp://127.0.0.1:15091"
+    recent_url = "tcp://127.0.0.1:15092"
+    old = _Peer(BlackholeTransport(old_url))
+    old.last_used -= 10
+    bus._peers[old_url] = old
+    bus._peers[recent_url] = _Peer(BlackholeTransport(recent_url))
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(b.run_forever) for b in (bus, server)]
+    assert bus._bus_started.wait(5)
+    assert server._bus_started.wait(5)
+
+    response = bus.request(
+        src=f"{bus.url.bus}/Proxy/0",
+        dst=f"{server.url.bus}/Telescope/0",
+        method="get_az",
+    )
+    assert response.result == 42.0
+
+    assert set(bus._peers) == {recent_url, server.url.bus}
+    assert old.reaped
+
+    bus.shutdown()
+    server.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+
+class GateTransport(AlwaysAgainTransport):
+    """Backpressure until opened, then accepts (and records) every frame."""
+
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.open = threading.Event()
+        self.sent: list[bytes] = []
+
+    def send(self, data: bytes) -> SendResult:
+        self.send_count += 1
+        if not self.open.is_set():
+            return SendResult.AGAIN
+        self.sent.append(data)
+        return SendResult.OK
+
+
+def test_backpressure_queues_without_stalling_sender(create_bus: Callable[..., Bus]):
+    """A full nng buffer no longer makes the sender sleep and drop: frames
+    wait in the peer queue, in order, and the writer sends them once the
+    peer has room."""
+    bus = create_bus("tcp://127.0.0.1:15093")
+    remote_url = "tcp://127.0.0.1:15094"
+    gate = GateTransport(remote_url)
+    bus._peers[remote_url] = _Peer(gate)
+
+    requests = [
+        Protocol.request(
+            src=f"{bus.url.bus}/Proxy/0", dst=f"{remote_url}/X/0", method=f"m{i}"
+        )
+        for i in range(10)
+    ]
+
+    t0 = time.monotonic()
+    assert [bus._push(request) for request in requests] == ["ok"] * 10
+    assert time.monotonic() - t0 < 0.1, "sender stalled on backpressure"
+
+    (peer,) = bus.stats()["peers"]
+    assert peer["queued"] == 10 and peer["high_water"] == 10
+
+    gate.open.set()
+    deadline = time.monotonic() + 5
+    while len(gate.sent) < 10:
+        assert time.monotonic() < deadline, "writer never drained the queue"
+        time.sleep(0.01)
+
+    codec = bus._peer_codec(remote_url)
+    assert [codec.decode(frame).method for frame in gate.sent] == [
+        f"m{i}" for i in range(10)
+    ]
+    assert bus.stats()["peers"][0]["queued"] == 0
+
+
+def test_full_peer_queue_drops_oldest_event_rejects_request(
+    create_bus: Callable[..., Bus],
+):
+    """Overflow policy: an event makes room by dropping the oldest queued
+    event; a request is refused right away instead of timing out later."""
+    bus = create_bus("tcp://127.0.0.1:15095")
+    remote_url = "tcp://127.0.0.1:15096"
+    gate = GateTransport(remote_url)
+    bus._peers[remote_url] = _Peer(gate, queue_size=2)
+
+    pub = f"{bus.url.bus}/Telescope/0"
+
+    def event(value: int) -> Event:
+        return Publish(ts=0, pub=pub, event="tick", args=[value], kwargs={}).callback(
+            dst=remote_url, event="tick", args=[value], kwargs={}
+        )
+
+    assert bus._push(event(1)) == "ok"
+    assert bus._push(event(2)) == "ok"
+    assert bus._push(event(3)) == "ok"  # replaces 1
+
+    with pytest.raises(BusDeadException, match="rejected"):
+        bus.request(src=f"{bus.url.bus}/Proxy/0", dst=f"{remote_url}/X/0", method="x")
+
+    (peer,) = bus.stats()["peers"]
+    assert peer["queued"] == 2
+    assert peer["dropped"] == 1
+    assert peer["rejected"] == 1
+
+    gate.open.set()
+    deadline = time.monotonic() + 5
+    while len(gate.sent) < 2:
+        assert time.monotonic() < deadline, "writer never drained the queue"
+        time.sleep(0.01)
+
+    codec = bus._peer_codec(remote_url)
+    assert [codec.decode(frame).args for frame in gate.sent] == [[2], [3]]
+
+
+class MetricsInstrument(ChimeraObject):
+    @lock
+    def move(self, seconds: float) -> bool:
+        time.sleep(seconds)
+        return True
+
+    def fail(self) -> None:
+        raise ValueError("nope")
+
+
+def test_request_stage_metrics(create_bus: Callable[..., Bus]):
+    """Every stage a request goes through is timed per object and method,
+    and the histograms reach chimera-ctl through the Manager."""
+    server = create_bus("tcp://127.0.0.1:15097")
+    client = create_bus("tcp://127.0.0.1:15098")
+    manager = Manager(server)
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(bus.run_forever) for bus in (server, client)]
+    assert server._bus_started.wait(5)
+    assert client._bus_started.wait(5)
+
+    manager.add_class(MetricsInstrument, "m", start=False)
+    proxy = Proxy(f"{server.url.bus}/MetricsInstrument/m", client)
+
+    assert proxy.move(0.03)
+    with pytest.raises(Exception, match="nope"):
+        proxy.fail()
+
+    def stages(metrics: dict[str, Any], method: str) -> dict[str, Any]:
+        return {
+            h["stage"]: h
+            for h in metrics["histograms"]
+            if h["path"] == "/MetricsInstrument/m" and h["method"] == method
+        }
+
+    # the reply stage is recorded right after the response went out
+    deadline = time.monotonic() + 5
+    while "reply" not in stages(manager.get_metrics(), "fail"):
+        assert time.monotonic() < deadline, "reply stage never recorded"
+        time.sleep(0.01)
+
+    server_side = stages(manager.get_metrics(), "move")
+    assert set(server_side) == {"dispatch", "lane_wait", "execute", "reply"}
+    assert server_side["execute"]["sum"] >= 0.03
+    assert set(stages(manager.get_metrics(), "fail")) == {
+        "dispatch",
+        "pool_wait",
+        "execute",
+        "reply",
+    }
+
+    client_side = stages(client.metrics.snapshot(), "move")
+    assert client_side["round_trip"]["count"] == 1
+    assert client_side["round_trip"]["sum"] >= server_side["execute"]["sum"]
+
+    counters = manager.get_status()["metrics"]["counters"]
+    assert {
+        "name": "errors",
+        "path": "/MetricsInstrument/m",
+        "method": "fail",
+        "value": 1,
+    } in counters
+
+    text = Proxy(f"{server.url.bus}/Manager/0", client).get_metrics(prometheus=True)
+    assert 'stage="lane_wait",path="/MetricsInstrument/m",method="move"' in text
+
+    manager.shutdown()
+    for bus in (server, client):
+        bus.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+
+def test_expired_requests_dropped_unexecuted(create_bus: Callable[..., Bus]):
+    """A request whose caller timed out while it sat in a lane is answered
+    408 and never runs: it cannot delay the commands queued behind it."""
+    bus = create_bus("tcp://127.0.0.1:15099")
+
+    release = threading.Event()
+    entered = threading.Event()
+    ran: list[str] = []
+
+    @lock
+    def slew() -> bool:
+        entered.set()
+        release.wait(10)
+        ran.append("slew")
+        return True
+
+    @lock
+    def get_position() -> int:
+        ran.append("get_position")
+        return 42
+
+    methods = {"slew": slew, "get_position": get_position}
+    bus.resolve_request = lambda object, method: ("/T/0", methods.get(method))
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    src, dst = f"{bus.url.bus}/Proxy/0", f"{bus.url.bus}/T/0"
+    first = bus.submit_request(src=src, dst=dst, method="slew")
+    assert entered.wait(5), "locked method never started"
+
+    # gives up while queued behind the slew
+    with pytest.raises(RequestTimeoutException):
+        bus.request(src=src, dst=dst, method="get_position", timeout=0.1)
+
+    release.set()
+    assert first.result(5).result is True
+    # the next command runs right after the slew, the stale getter never
+    assert bus.request(src=src, dst=dst, method="get_position", timeout=5).result == 42
+    assert ran == ["slew", "get_position"]
+    assert bus.stats()["expired"] == 1
+    assert {
+        "name": "expired",
+        "path": "/T/0",
+        "method": "get_position",
+        "value": 1,
+    } in bus.metrics.snapshot()["counters"]
+
+    bus.shutdown()
+    bus_future.result()
+    pool.shutdown()
+
+
+def test_expired_batch_request_answered_408(create_bus: Callable[..., Bus]):
+    """Inside a batch an expired request still gets its (408) slot, so the
+    batch completes."""
+    bus = create_bus("tcp://127.0.0.1:15100")
+
+    @lock
+    def get_position() -> int:
+        return 42
+
+    bus.resolve_request = lambda object, method: ("/T/0", get_position)
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    src, dst = f"{bus.url.bus}/Proxy/0", f"{bus.url.bus}/T/0"
+    requests = [
+        Protocol.request(src=src, dst=dst, method="get_position", timeout=timeout)
+        for timeout in (None, 0.0)
+    ]
+    batch = Protocol.batch(src=src, requests=requests)
+    mailbox = bus._mailboxes.register(batch.id, bus.url.bus)
+    assert bus._push(batch)
+
+    reply = mailbox.get(timeout=5)
+    assert isinstance(reply, BatchResponse)
+    assert [response.code for response in reply.responses] == [200, 408]
+
+    bus.shutdown()
+    bus_future.result()
+    pool.shutdown()
+
+
+def test_urgent_methods_jump_the_lane(create_bus: Callable[..., Bus]):
+    """@urgent requests run right after the current locked method, ahead
+    of everything queued (even a full lane), and their queueing latency
+    is reported as its own stage."""
+    bus = create_bus("tcp://127.0.0.1:15101", lane_queue_size=2)
+
+    release = threading.Event()
+    entered = threading.Event()
+    ran: list[str] = []
+
+    @lock
+    def slew() -> None:
+        entered.set()
+        release.wait(10)
+        ran.append("slew")
+
+    @urgent
+    def stop() -> None:
+        ran.append("stop")
+
+    methods = {"slew": slew, "stop": stop}
+    bus.resolve_request = lambda object, method: ("/T/0", methods.get(method))
+
+    pool = ThreadPoolExecutor()
+    bus_future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    src, dst = f"{bus.url.bus}/Proxy/0", f"{bus.url.bus}/T/0"
+    first = bus.submit_request(src=src, dst=dst, method="slew")
+    assert entered.wait(5), "locked method never started"
+    queued = [bus.submit_request(src=src, dst=dst, method="slew") for _ in range(2)]
+
+    deadline = time.monotonic() + 5
+    while not any(lane["queued"] == 2 for lane in bus.stats()["lanes"]):
+        assert time.monotonic() < deadline, "lane never filled"
+        time.sleep(0.01)
+
+    stopped = bus.submit_request(src=src, dst=dst, method="stop")
+    deadline = time.monotonic() + 5
+    while not any(lane["urgent"] == 1 for lane in bus.stats()["lanes"]):
+        assert time.monotonic() < deadline, "urgent request never queued"
+        time.sleep(0.01)
+
+    release.set()
+    for future in (first, stopped, *queued):
+        assert future.result(5).code == 200
+    assert ran == ["slew", "stop", "slew", "slew"]
+
+    stages = {
+        (h["stage"], h["method"]): h["count"]
+        for h in bus.metrics.snapshot()["histograms"]
+    }
+    assert stages[("urgent_wait", "stop")] == 1
+    assert ("lane_wait", "stop") not in stages
+    assert stages[("lane_wait", "slew")] == 3
+
+    bus.shutdown()
+    bus_future.result()
+    pool.shutdown()
+
+
+def test_resolutions_cached(create_bus: Callable[..., Bus]):
+    """Proxies share their bus's resolution answers: found objects and
+    misses alike are answered without pinging again, until the peer's
+    link goes away."""
+    client = create_bus("tcp://127.0.0.1:15104", negative_resolve_ttl=60.0)
+    server = create_bus("tcp://127.0.0.1:15105")
+
+    def get_location() -> str:
+        return f"{server.url.bus}/FakeDome/dome"
+
+    objects = {"/Dome/0": get_location}
+    pings = []
+
+    def resolve(object: str, method: str):
+        if method == "get_location":
+            pings.append(object)
+        if object in objects:
+            return object, objects[object]
+        return None, None
+
+    server.resolve_request = resolve
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(bus.run_forever) for bus in (client, server)]
+    assert client._bus_started.wait(5)
+    assert server._bus_started.wait(5)
+
+    for _ in range(3):
+        dome = Proxy(f"{server.url.bus}/Dome/0", client)
+        assert dome.exists()
+        assert dome.__resolved_url__.path == "/FakeDome/dome"
+        assert not Proxy(f"{server.url.bus}/Rotator/0", client).exists()
+    assert pings == ["/Dome/0", "/Rotator/0"]
+    assert client.stats()["resolutions"] == {"found": 1, "missing": 1}
+
+    with pytest.raises(ObjectNotFoundException):
+        Proxy(f"{server.url.bus}/Rotator/0", client).resolve()
+    assert len(pings) == 2
+
+    # a late disconnect from a link already replaced changes nothing
+    client._evict_peer(server.url.bus, MagicMock())
+    assert server.url.bus in client._peers
+    assert client.stats()["resolutions"] == {"found": 1, "missing": 1}
+
+    # the link is lost: whatever is there now must be asked again
+    client._evict_peer(server.url.bus)
+    assert client.stats()["resolutions"] == {"found": 0, "missing": 0}
+    assert Proxy(f"{server.url.bus}/Dome/0", client).exists()
+    assert pings == ["/Dome/0", "/Rotator/0", "/Dome/0"]
+
+    for bus in (client, server):
+        bus.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+
+def test_manager_changes_forget_local_resolutions(create_bus: Callable[..., Bus]):
+    bus = create_bus("tcp://127.0.0.1:15106")
+    manager = Manager(bus)
+
+    pool = ThreadPoolExecutor()
+    future = pool.submit(bus.run_forever)
+    assert bus._bus_started.wait(5)
+
+    assert not Proxy(f"{bus.url.bus}/MetricsInstrument/0", bus).exists()
+    manager.add_class(MetricsInstrument, "m", start=False)
+    assert Proxy(f"{bus.url.bus}/MetricsInstrument/0", bus).exists()
+    manager.remove("/MetricsInstrument/m")
+    assert not Proxy(f"{bus.url.bus}/MetricsInstrument/0", bus).exists()
+
+    manager.shutdown()
+    bus.shutdown()
+    future.result()
+    pool.shutdown()
+
+
+class CachedInstrument(ChimeraObject):
+    __config__ = {"width": 10}
+
+    def __init__(self):
+        ChimeraObject.__init__(self)
+        self.calls = 0
+
+    @cached
+    def get_width(self, binning: int = 1) -> int:
+        self.calls += 1
+        return self["width"] // binning
+
+    @cached
+    def get_modes(self) -> list[int]:
+        return [self["width"]]
+
+    def get_calls(self) -> int:
+        return self.calls
+
+
+def test_proxy_memoizes_cached_methods(create_bus: Callable[..., Bus]):
+    """Results of @cached methods are reused by every proxy on the calling
+    bus, until the object publishes a config change or its bus goes away."""
+    client = create_bus("tcp://127.0.0.1:15107")
+    server = create_bus("tcp://127.0.0.1:15108")
+    manager = Manager(server)
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(bus.run_forever) for bus in (client, server)]
+    assert client._bus_started.wait(5)
+    assert server._bus_started.wait(5)
+
+    manager.add_class(CachedInstrument, "cam", start=False)
+    url = f"{server.url.bus}/CachedInstrument/cam"
+
+    first = Proxy(url, client)
+    first.resolve()
+    assert first.__memoized__ == {"get_modes", "get_width"}
+    for _ in range(3):
+        assert Proxy(url, client).get_width() == 10
+        assert Proxy(url, client).get_width(binning=2) == 5
+    assert first.get_calls() == 2
+    resolved = first.__resolved_url__.url
+    assert client.stats()["result_caches"] == {resolved: 2}
+
+    # every caller gets its own copy of a memoized result
+    first.get_modes().append(0)
+    assert Proxy(url, client).get_modes() == [10]
+    assert client.stats()["result_caches"] == {resolved: 3}
+
+    # config changes clear the memoized results, right away for writes
+    # made through this bus
+    first["width"] = 20
+    assert Proxy(url, client).get_width() == 20
+
+    # others' writes arrive with the config_changed event
+    manager.resources.get("/CachedInstrument/cam").instance["width"] = 40
+    deadline = time.monotonic() + 5
+    while Proxy(url, client).get_width() != 40:
+        assert time.monotonic() < deadline, "result cache never invalidated"
+        time.sleep(0.01)
+
+    # a lost peer takes its memoized results along
+    client._evict_peer(server.url.bus)
+    assert client.stats()["result_caches"] == {}
+    assert Proxy(url, client).get_width() == 40
+
+    manager.shutdown()
+    for bus in (client, server):
+        bus.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+
+class SweepInstrument(ChimeraObject):
+    def __init__(self):
+        ChimeraObject.__init__(self)
+        self.produced = 0
+        self.closed = threading.Event()
+
+    def sweep(self, n: int):
+        try:
+            for i in range(n):
+                self.produced += 1
+                yield i
+                if i == 99:
+                    raise ValueError("focuser lost")
+        finally:
+            self.closed.set()
+
+    @lock
+    def expose(self, frames: int):
+        for i in range(frames):
+            yield f"frame-{i}.fits"
+
+    def get_produced(self) -> int:
+        return self.produced
+
+    def is_closed(self) -> bool:
+        return self.closed.is_set()
+
+
+def test_generator_methods_stream(create_bus: Callable[..., Bus]):
+    """Generator methods stream their items as they are produced, paced by
+    the caller: the remote generator only runs ahead by the window, stops
+    when the caller drops the iterator and reports errors in place."""
+    client = create_bus("tcp://127.0.0.1:15109")
+    server = create_bus("tcp://127.0.0.1:15110")
+    manager = Manager(server)
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(bus.run_forever) for bus in (client, server)]
+    assert client._bus_started.wait(5)
+    assert server._bus_started.wait(5)
+
+    manager.add_class(SweepInstrument, "sweep", start=False)
+    url = f"{server.url.bus}/SweepInstrument/sweep"
+    proxy = Proxy(url, client)
+
+    assert list(proxy.expose(3)) == [f"frame-{i}.fits" for i in range(3)]
+    assert proxy.__streams__ == {"sweep", "expose"}
+
+    # flow control: with a window of 4 the producer waits for the consumer
+    proxy.resolve()
+    with client.request_stream(
+        src=proxy.__proxy_url__,
+        dst=proxy.__resolved_url__,
+        method="sweep",
+        args=[50],
+        window=4,
+    ) as responses:
+        assert next(responses).result == 0
+        time.sleep(0.2)
+        assert proxy.get_produced() == 4
+        assert [response.result for response in responses] == list(range(1, 50))
+    assert proxy.get_produced() == 50
+
+    # dropping the iterator stops the remote generator, running its cleanup
+    items = proxy.sweep(1000)
+    assert [next(items) for _ in range(5)] == list(range(5))
+    items.close()
+    deadline = time.monotonic() + 5
+    while not proxy.is_closed():
+        assert time.monotonic() < deadline, "remote generator never closed"
+        time.sleep(0.01)
+    # never more than a window ahead of what was consumed
+    assert proxy.get_produced() <= 50 + 5 + 16 + 1
+
+    # errors arrive after the items produced before them
+    received = []
+    with pytest.raises(Exception, match="focuser lost"):
+        for item in proxy.sweep(200):
+            received.append(item)
+    assert received == list(range(100))
+
+    # asked for everything at once (futures, batches): a list
+    assert proxy.sweep.submit(3).result(5) == [0, 1, 2]
+
+    deadline = time.monotonic() + 5
+    while server.stats()["streams"]:
+        assert time.monotonic() < deadline, "stream never closed"
+        time.sleep(0.01)
+
+    manager.shutdown()
+    for bus in (client, server):
+        bus.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
+
+
+def test_large_replies_do_not_hold_up_control_traffic(
+    create_bus: Callable[..., Bus],
+):
+    """Replies over bulk_threshold take the peer's bulk link: while one is
+    stuck there, requests to the same peer still go straight out."""
+    bus = create_bus("tcp://127.0.0.1:15111", bulk_threshold=1024)
+    remote_url = "tcp://127.0.0.1:15112"
+    control = GateTransport(remote_url)
+    control.open.set()
+    bulk = GateTransport(remote_url)
+    peer = _Peer(control)
+    peer.bulk = bulk
+    bus._peers[remote_url] = peer
+
+    request = Protocol.request(
+        src=f"{remote_url}/Proxy/0", dst=f"{bus.url.bus}/Catalog/0", method="query"
+    )
+    assert bus._push(request.ok("x" * 4096)) == "ok"
+    assert bus._push(request.ok("small")) == "ok"
+    for i in range(3):
+        assert (
+            bus._push(
+                Protocol.request(
+                    src=f"{bus.url.bus}/Proxy/0",
+                    dst=f"{remote_url}/X/0",
+                    method=f"m{i}",
+                )
+            )
+            == "ok"
+        )
+
+    codec = bus._peer_codec(remote_url)
+    assert [getattr(codec.decode(frame), "method", None) for frame in control.sent] == [
+        None,
+        "m0",
+        "m1",
+        "m2",
+    ]
+    assert codec.decode(control.sent[0]).result == "small"
+    (stats,) = bus.stats()["peers"]
+    assert stats["bulk_queued"] == 1 and stats["bulk_sent"] == 0
+
+    bulk.open.set()
+    deadline = time.monotonic() + 5
+    while not bulk.sent:
+        assert time.monotonic() < deadline, "writer never drained the bulk queue"
+        time.sleep(0.01)
+    assert codec.decode(bulk.sent[0]).result == "x" * 4096
+    assert bus.stats()["peers"][0]["bulk_sent"] == 1
+
+
+class CatalogInstrument(ChimeraObject):
+    def query(self, n: int) -> list[str]:
+        return [f"star-{i:06d}" for i in range(n)]
+
+    def frames(self, n: int) -> Generator[str]:
+        for i in range(n):
+            yield str(i) * 300_000
+
+
+def test_bulk_link_end_to_end(create_bus: Callable[..., Bus]):
+    client = create_bus("tcp://127.0.0.1:15113")
+    server = create_bus("tcp://127.0.0.1:15114", bulk_threshold=64 * 1024)
+    manager = Manager(server)
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(bus.run_forever) for bus in (client, server)]
+    assert client._bus_started.wait(5)
+    assert server._bus_started.wait(5)
+
+    manager.add_class(CatalogInstrument, "catalog", start=False)
+    catalog = Proxy(f"{server.url.bus}/CatalogInstrument/catalog", client)
+
+    assert catalog.query(10) == [f"star-{i:06d}" for i in range(10)]
+    stars = catalog.query(100_000)
+    assert len(stars) == 100_000 and stars[-1] == "star-099999"
+
+    (peer,) = server.stats()["peers"]
+    assert peer["bulk_sent"] == 1
+
+    # a stream keeps to one link: its small final Response must not end the
+    # iteration ahead of large items still in flight
+    for _ in range(30):
+        assert list(catalog.frames(3)) == [str(i) * 300_000 for i in range(3)]
+
+    manager.shutdown()
+    for bus in (client, server):
+        bus.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
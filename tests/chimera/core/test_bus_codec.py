@@ -0,0 +1,335 @@
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pytest
+
+from chimera.core.bus import Bus, EventId
+from chimera.core.codec import JSON, MSGPACK, check, detect, negotiate
+from chimera.core.protocol import Protocol
+
+
+def print_results(op: str, n: int, dt: float):
+    ops = f"{op}/s"
+    print(
+        f"{op:20}[{n}] {dt:.6f}s {n / dt:.0f} {ops:<20} {(dt * 1_000_000 / n):.3f} μs/{op}"
+    )
+
+
+@pytest.fixture
+def create_bus() -> Generator[Callable[..., Bus]]:
+    buses: list[Bus] = []
+
+    def _wrapper(url: str, **kwargs: Any) -> Bus:
+        bus = Bus(url, **kwargs)
+        buses.append(bus)
+        return bus
+
+    yield _wrapper
+
+    for bus in buses:
+        bus.shutdown()
+
+
+def start(pool: ThreadPoolExecutor, *buses: Bus) -> None:
+    for bus in buses:
+        pool.submit(bus.run_forever)
+    for bus in buses:
+        assert bus._bus_started.wait(5)
+
+
+def echo_resolver(bus: Bus) -> None:
+    def get_location() -> str:
+        return f"{bus.url.bus}/Echo/0"
+
+    def echo(x: Any) -> Any:
+        return x
+
+    def resolve(object: str, method: str):
+        if method == "get_location":
+            return "/Echo/0", get_location
+        return "/Echo/0", echo
+
+    bus.resolve_request = resolve
+
+
+def test_detect_and_negotiate():
+    request = Protocol.request(
+        src="tcp://127.0.0.1:1/Proxy/0", dst="tcp://127.0.0.1:2/Echo/0", method="x"
+    )
+    assert detect(JSON.encode(request)) is JSON
+    assert detect(MSGPACK.encode(request)) is MSGPACK
+    assert MSGPACK.decode(MSGPACK.encode(request)) == request
+
+    assert negotiate(["msgpack", "json"], ["msgpack", "json"]) == "msgpack"
+    # our preference order wins
+    assert negotiate(["json", "msgpack"], ["msgpack", "json"]) == "msgpack"
+    assert negotiate(["msgpack", "json"], ["json"]) == "json"
+    # old peers offer nothing: JSON
+    assert negotiate(None, ["msgpack", "json"]) == "json"
+    assert negotiate(["cbor"], ["msgpack", "json"]) == "json"
+
+
+def test_codec_negotiated_on_first_ping(create_bus: Callable[..., Bus]):
+    bus_a = create_bus("tcp://127.0.0.1:15060")
+    bus_b = create_bus("tcp://127.0.0.1:15061")
+    echo_resolver(bus_b)
+
+    pool = ThreadPoolExecutor()
+    start(pool, bus_a, bus_b)
+
+    # nothing agreed yet: JSON towards everybody
+    assert bus_a._peer_codec(bus_b.url.bus) is JSON
+
+    pong = bus_a.ping(src=f"{bus_a.url.bus}/Proxy/0", dst=f"{bus_b.url.bus}/Echo/0")
+    assert pong is not None and pong.ok and pong.codec == "msgpack"
+
+    # both directions switched
+    assert bus_a._peer_codec(bus_b.url.bus) is MSGPACK
+    assert bus_b._peer_codec(bus_a.url.bus) is MSGPACK
+    assert bus_a.stats()["codecs"] == {bus_b.url.bus: "msgpack"}
+
+    response = bus_a.request(
+        src=f"{bus_a.url.bus}/Proxy/0",
+        dst=f"{bus_b.url.bus}/Echo/0",
+        method="echo",
+        args=[{"ra": 1.5, "names": ["a", "b"]}],
+        timeout=5.0,
+    )
+    assert response.code == 200
+    assert response.result == {"ra": 1.5, "names": ["a", "b"]}
+
+    bus_a.shutdown()
+    bus_b.shutdown()
+    pool.shutdown()
+
+
+def test_json_only_peer_falls_back(create_bus: Callable[..., Bus]):
+    """A peer that does not offer msgpack (or predates negotiation and sends
+    no codecs at all) keeps talking JSON in both directions."""
+    bus_new = create_bus("tcp://127.0.0.1:15062")
+    bus_old = create_bus("tcp://127.0.0.1:15063", codecs=("json",))
+    echo_resolver(bus_new)
+    echo_resolver(bus_old)
+
+    pool = ThreadPoolExecutor()
+    start(pool, bus_new, bus_old)
+
+    pong = bus_new.ping(
+        src=f"{bus_new.url.bus}/Proxy/0", dst=f"{bus_old.url.bus}/Echo/0"
+    )
+    assert pong is not None and pong.ok and pong.codec == "json"
+    assert bus_new._peer_codec(bus_old.url.bus) is JSON
+
+    pong = bus_old.ping(
+        src=f"{bus_old.url.bus}/Proxy/0", dst=f"{bus_new.url.bus}/Echo/0"
+    )
+    assert pong is not None and pong.ok and pong.codec == "json"
+    assert bus_new._peer_codec(bus_old.url.bus) is JSON
+
+    # a ping without codecs, as sent by an old build
+    bus_new._handle_ping(
+        Protocol.ping(src=f"{bus_old.url.bus}/Proxy/1", dst=f"{bus_new.url.bus}/Echo/0")
+    )
+    assert bus_new._peer_codec(bus_old.url.bus) is JSON
+
+    response = bus_old.request(
+        src=f"{bus_old.url.bus}/Proxy/0",
+        dst=f"{bus_new.url.bus}/Echo/0",
+        method="echo",
+        args=[42],
+        timeout=5.0,
+    )
+    assert response.result == 42
+
+    bus_new.shutdown()
+    bus_old.shutdown()
+    pool.shutdown()
+
+
+def test_eviction_forgets_codec(create_bus: Callable[..., Bus]):
+    bus = create_bus("tcp://127.0.0.1:15064")
+    peer = "tcp://127.0.0.1:15065"
+    bus._set_peer_codec(peer, "msgpack")
+    assert bus._peer_codec(peer) is MSGPACK
+
+    bus._evict_peer(peer)
+    assert bus._peer_codec(peer) is JSON
+
+
+@pytest.mark.parametrize("codec", ["json", "msgpack"])
+def test_codec_bench(create_bus: Callable[..., Bus], codec: str):
+    """Request round trip and publish throughput over the wire per codec."""
+    base = 15066 if codec == "json" else 15068
+    src_bus = create_bus(f"tcp://127.0.0.1:{base}", codecs=(codec,))
+    dst_bus = create_bus(f"tcp://127.0.0.1:{base + 1}", codecs=(codec,))
+    echo_resolver(dst_bus)
+
+    pool = ThreadPoolExecutor()
+    start(pool, src_bus, dst_bus)
+
+    src = f"{src_bus.url.bus}/Proxy/0"
+    dst = f"{dst_bus.url.bus}/Echo/0"
+    assert src_bus.ping(src=src, dst=dst).codec == codec
+
+    payload = {"ra": 123.456, "dec": -45.678, "status": "OK", "filters": list("UBVRI")}
+
+    print()
+    n = 2_000
+    t0 = time.monotonic()
+    for _ in range(n):
+        assert src_bus.request(src=src, dst=dst, method="echo", args=[payload]).code
+    print_results(f"rpc-{codec}", n, time.monotonic() - t0)
+
+    n_events = 2_000
+    received = 0
+    done = threading.Event()
+
+    def on_event(**kwargs: Any):
+        nonlocal received
+        received += 1
+        if received == n_events:
+            done.set()
+
+    src_bus.subscribe(sub=src, pub=dst, event="tick", callback=on_event)
+    deadline = time.monotonic() + 5
+    while not dst_bus.subscribers(EventId(dst, "tick")):
+        assert time.monotonic() < deadline, "subscription never arrived"
+        time.sleep(0.01)
+
+    t0 = time.monotonic()
+    for _ in range(n_events):
+        dst_bus.publish(pub=dst, event="tick", kwargs=payload)
+    assert done.wait(20), f"only {received}/{n_events} events delivered"
+    print_results(f"pub-{codec}", n_events, time.monotonic() - t0)
+
+    src_bus.shutdown()
+    dst_bus.shutdown()
+    pool.shutdown()
+
+
+#
+# NumPy arrays: out-of-band binary frames
+#
+
+
+def test_ndarray_msgpack_roundtrip():
+    arrays = [
+        np.arange(12, dtype="<f4").reshape(3, 4),
+        np.arange(6, dtype=">i8").reshape(2, 3),
+        np.zeros((0, 5), dtype=np.uint16),
+        np.array(7, dtype=np.int32),
+        np.zeros(3, dtype=[("x", "<f8"), ("y", "<i4")]),
+        # non-contiguous input is sent as a contiguous copy
+        np.arange(20, dtype=np.float64).reshape(4, 5)[:, ::2],
+    ]
+    request = Protocol.request(
+        src="tcp://127.0.0.1:1/Proxy/0",
+        dst="tcp://127.0.0.1:2/Echo/0",
+        method="x",
+        args=arrays,
+        kwargs={"scale": np.float32(2.5)},
+    )
+
+    data = MSGPACK.encode(request)
+    decoded = MSGPACK.decode(data)
+
+    for sent, received in zip(arrays, decoded.args):
+        assert isinstance(received, np.ndarray)
+        assert received.dtype == sent.dtype
+        assert received.shape == sent.shape
+        np.testing.assert_array_equal(received, sent)
+        # a view over the received frame, not a copy of it
+        assert received.flags.writeable is False
+
+    assert decoded.kwargs == {"scale": 2.5}
+
+
+def test_ndarray_json_degrades_to_lists():
+    request = Protocol.request(
+        src="tcp://127.0.0.1:1/Proxy/0",
+        dst="tcp://127.0.0.1:2/Echo/0",
+        method="x",
+        args=[np.arange(4).reshape(2, 2)],
+    )
+    assert JSON.decode(JSON.encode(request)).args == [[[0, 1], [2, 3]]]
+
+
+def test_ndarray_object_dtype_rejected():
+    request = Protocol.request(
+        src="tcp://127.0.0.1:1/Proxy/0",
+        dst="tcp://127.0.0.1:2/Echo/0",
+        method="x",
+        args=[np.array([object()], dtype=object)],
+    )
+    for encode in (MSGPACK.encode, JSON.encode, check):
+        with pytest.raises(NotImplementedError):
+            encode(request)
+
+
+def test_ndarray_local_result_not_copied(create_bus: Callable[..., Bus]):
+    bus = create_bus("tcp://127.0.0.1:15070")
+    frame = np.arange(1024 * 1024, dtype=np.uint16).reshape(1024, 1024)
+
+    bus.resolve_request = lambda object, method: ("/Camera/0", lambda: frame)
+
+    pool = ThreadPoolExecutor()
+    start(pool, bus)
+
+    response = bus.request(
+        src=f"{bus.url.bus}/Proxy/0",
+        dst=f"{bus.url.bus}/Camera/0",
+        method="get_frame",
+        timeout=5.0,
+    )
+    assert response.code == 200
+    assert response.result is frame
+
+    bus.shutdown()
+    pool.shutdown()
+
+
+def test_ndarray_remote_result_and_event(create_bus: Callable[..., Bus]):
+    src_bus = create_bus("tcp://127.0.0.1:15071")
+    dst_bus = create_bus("tcp://127.0.0.1:15072")
+    echo_resolver(dst_bus)
+
+    pool = ThreadPoolExecutor()
+    start(pool, src_bus, dst_bus)
+
+    src = f"{src_bus.url.bus}/Proxy/0"
+    dst = f"{dst_bus.url.bus}/Echo/0"
+    assert src_bus.ping(src=src, dst=dst).codec == "msgpack"
+
+    frame = np.random.default_rng(42).normal(size=(256, 256)).astype(np.float32)
+    response = src_bus.request(
+        src=src, dst=dst, method="echo", args=[frame], timeout=5.0
+    )
+    assert response.code == 200
+    result = response.result
+    assert isinstance(result, np.ndarray) and result.dtype == np.float32
+    np.testing.assert_array_equal(result, frame)
+
+    received: list[np.ndarray] = []
+    done = threading.Event()
+
+    def on_preview(preview: np.ndarray):
+        received.append(preview)
+        done.set()
+
+    src_bus.subscribe(sub=src, pub=dst, event="preview", callback=on_preview)
+    deadline = time.monotonic() + 5
+    while not dst_bus.subscribers(EventId(dst, "preview")):
+        assert time.monotonic() < deadline, "subscription never arrived"
+        time.sleep(0.01)
+
+    dst_bus.publish(pub=dst, event="preview", args=[frame[:16, :16]])
+    assert done.wait(5)
+    np.testing.assert_array_equal(received[0], frame[:16, :16])
+
+    src_bus.shutdown()
+    dst_bus.shutdown()
+    pool.shutdown()
@@ -194,6 +194,28 @@ class TestChimeraConfig:
         system = parse(s)
         assert len(system.instruments) == 2
 
+    def test_isolated(self):
+        s = """
+        camera:
+         - name: heavy
+           type: CameraType
+           isolated: true
+           device: /dev/null
+
+         - name: light
+           type: CameraType
+        """
+
+        system = parse(s)
+        (heavy,) = system.isolated
+        assert heavy.name == "heavy"
+        # not passed on as an option of the object
+        assert system.instruments[heavy] == {"device": "/dev/null"}
+
+    def test_scheduler(self):
+        assert parse("camera:\n name: cam\n type: CameraType\n").scheduler is False
+        assert parse("chimera:\n scheduler: 8\n").scheduler == 8
+
     def test_instrument_error(self):
         s = """
         instrument:
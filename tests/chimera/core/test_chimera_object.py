@@ -1,9 +1,11 @@
 import pytest
 
+from chimera.core.cached import cached, memoize
 from chimera.core.chimeraobject import ChimeraObject
 from chimera.core.config import OptionConversionException
 from chimera.core.constants import CONFIG_ATTRIBUTE_NAME
 from chimera.core.event import event
+from chimera.core.lock import lock
 from chimera.core.metaobject import MethodWrapper
 from chimera.core.state import State
 from chimera.core.url import parse_url
@@ -161,6 +163,155 @@ class TestChimeraObject:
         with pytest.raises(OptionConversionException):
             c.__iadd__({"a": 2})
 
+    def test_cached(self):
+        class Sizes(ChimeraObject):
+            __config__ = {"width": 10}
+
+            def __init__(self):
+                ChimeraObject.__init__(self)
+                self.calls = 0
+
+            @cached
+            def get_width(self, binning=1):
+                self.calls += 1
+                return self["width"] // binning
+
+            @cached
+            @lock
+            def get_modes(self):
+                self.calls += 1
+                return [self["width"]]
+
+            @cached
+            def get_window(self, region=()):
+                self.calls += 1
+                return list(region)
+
+            @cached
+            def get_serial(self):
+                # a placeholder until the driver connects
+                self.calls += 1
+                return None
+
+        # overrides stay cached, without repeating the decorator
+        class Binned(Sizes):
+            def get_width(self, binning=2):
+                self.calls += 1
+                return self["width"] // binning
+
+        assert Sizes.__cached_methods__ == [
+            "get_modes",
+            "get_serial",
+            "get_width",
+            "get_window",
+        ]
+        assert Binned.__cached_methods__ == Sizes.__cached_methods__
+
+        s = Sizes()
+        assert [s.get_width(), s.get_width(), s.get_width(2)] == [10, 10, 5]
+        assert s.get_modes() is s.get_modes()
+        assert s.calls == 3
+        # unhashable arguments: computed every time
+        s.get_window([0, 1])
+        s.get_window(region=[0, 1])
+        assert s.calls == 5
+        # None is not an answer worth keeping
+        s.get_serial()
+        s.get_serial()
+        assert s.calls == 7
+
+        s["width"] = 20
+        assert s.get_width() == 20
+        assert s.calls == 8
+
+        b = Binned()
+        assert [b.get_width(), b.get_width()] == [5, 5]
+        assert b.calls == 1
+
+    def test_memoize(self):
+        class Optics(ChimeraObject):
+            __config__ = {"rotation": 0.0, "focal_length": 1000.0, "filter": "R"}
+
+            def __init__(self):
+                ChimeraObject.__init__(self)
+                self.calls = 0
+
+            @memoize("rotation", "focal_length")
+            def get_scale(self, binning=1):
+                self.calls += 1
+                return (self["rotation"], self["focal_length"] * binning)
+
+            @memoize("nope")
+            def get_misspelled(self):
+                pass
+
+        o = Optics()
+        assert [o.get_scale(), o.get_scale(), o.get_scale(2)] == [
+            (0.0, 1000.0),
+            (0.0, 1000.0),
+            (0.0, 2000.0),
+        ]
+        assert o.calls == 2
+
+        # other keys, or the same value again, keep it
+        o["filter"] = "V"
+        o["rotation"] = 0.0
+        o.get_scale()
+        assert o.calls == 2
+
+        o["focal_length"] = 500.0
+        assert o.get_scale() == (0.0, 500.0)
+        assert o.calls == 3
+
+        with pytest.raises(KeyError):
+            o.get_misspelled()
+
+    def test_config_changed(self, manager, wait_for):
+        class Optics(ChimeraObject):
+            __config__ = {"rotation": 0.0, "filter": "R"}
+
+        manager.add_object(Optics(), "optics", config={"rotation": 1.0})
+        optics = manager.get_proxy("/Optics/optics")
+
+        changes = []
+        optics.config_changed += lambda keys, version: changes.append((keys, version))
+
+        optics["rotation"] = 1.0
+        optics["filter"] = "V"
+        optics += {"filter": "B", "rotation": 2.0}
+        assert wait_for(lambda: len(changes) == 2)
+        (keys, version), (bulk, last) = sorted(changes, key=lambda c: c[1])
+        assert keys == ["filter"]
+        assert sorted(bulk) == ["filter", "rotation"]
+        assert last > version
+
+    def test_config_changed_in_place(self):
+        class Wheel(ChimeraObject):
+            __config__ = {"offsets": {"R": 0}}
+
+            def __init__(self):
+                ChimeraObject.__init__(self)
+                self.calls = 0
+
+            @cached
+            def get_offsets(self):
+                self.calls += 1
+                return dict(self["offsets"])
+
+        w = Wheel()
+        assert w.get_offsets() == {"R": 0}
+
+        # changed where it was read, then written back: still a change
+        offsets = w["offsets"]
+        offsets["V"] = 10
+        w["offsets"] = offsets
+        assert w.get_offsets() == {"R": 0, "V": 10}
+        assert w.calls == 2
+
+        # changing what was written does not change the config
+        offsets["B"] = 20
+        assert w["offsets"] == {"R": 0, "V": 10}
+
     def test_main(self):
         class MainTest(ChimeraObject):
             def __init__(self):
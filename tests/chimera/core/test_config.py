@@ -202,6 +202,28 @@ class TestConfig:
             c, Config
         )  # __iadd__ protocol, return self to allow daisy chaining
 
+    def test_snapshot(self):
+        c = Config({"az_resolution": 2.0, "rotation": 0})
+        snapshot = c.snapshot
+        assert c.version == 0
+
+        c["rotation"] = 90
+        assert c.version == 1
+        assert c["rotation"] == 90
+        # readers holding the old snapshot keep a consistent view
+        assert snapshot["rotation"] == 0
+        with pytest.raises(TypeError):
+            snapshot["rotation"] = 180
+
+        # rejected values change nothing
+        with pytest.raises(OptionConversionException):
+            c["rotation"] = "sideways"
+        assert c.version == 1
+
+        c += {"az_resolution": 1.0, "rotation": 45}
+        assert c.version == 2
+        assert dict(c.iter_items()) == {"az_resolution": 1.0, "rotation": 45}
+
     def test_enum(self):
         class Values(Enum):
             A_VALUE = "A_VALUE"
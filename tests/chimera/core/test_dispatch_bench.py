@@ -0,0 +1,46 @@
+import operator
+import time
+
+from rich import print
+
+from chimera.core.bus import Dispatch, _is_locked_method, _is_urgent_method
+from chimera.core.chimeraobject import ChimeraObject
+from chimera.core.lock import lock
+
+
+class Target(ChimeraObject):
+    def is_parked(self):
+        return True
+
+    @lock
+    def park(self):
+        pass
+
+
+def test_dispatch_bench(manager):
+    manager.add_class(Target, "target")
+
+    def resolve_by_lookup(object, method):
+        # what every request did before dispatch tables
+        resource = manager.resources.get(object)
+        callable = operator.attrgetter(method)(resource.instance)
+        locked = _is_locked_method(callable)
+        return resource.path, callable, locked, locked and _is_urgent_method(callable)
+
+    def resolve_by_table(object, method):
+        path, dispatch = manager._resolve_request(object, method)
+        assert isinstance(dispatch, Dispatch)
+        return path, dispatch.callable, dispatch.locked, dispatch.urgent
+
+    for method in ("is_parked", "park"):
+        assert resolve_by_lookup("/Target/target", method) == resolve_by_table(
+            "/Target/target", method
+        )
+
+    n = 10_000
+    for resolve in (resolve_by_lookup, resolve_by_table):
+        t0 = time.monotonic()
+        for _ in range(n):
+            resolve("/Target/target", "park")
+        total = time.monotonic() - t0
+        print(f"{resolve.__name__}: {total * 1e6 / n:.3f} us per request")
@@ -3,6 +3,7 @@ import time
 
 from chimera.core.chimeraobject import ChimeraObject
 from chimera.core.event import event
+from chimera.core.protocol import EventFilter
 from chimera.core.proxy import Proxy
 
 
@@ -125,3 +126,71 @@ class TestEvents:
             print(f"# mean  : {mean:<6.3f} ms")
             print(f"# sigma : {sigma:<6.3f} ms")
             print("#" * 25)
+
+    def test_replay(self, manager, wait_for):
+        manager.add_class(Recorder, "early")
+        manager.add_class(Recorder, "late")
+        manager.add_class(Recorder, "live")
+        manager.add_class(Recorder, "quiet", config={"event_history": {"moved": 0}})
+
+        early = manager.get_proxy("/Recorder/early")
+        live = manager.get_proxy("/Recorder/live")
+        early.moved += live.record
+        for position in range(5):
+            early.move(position)
+        # published: kept in the history too
+        assert wait_for(lambda: len(live.get_seen()) == 5)
+
+        # the last 3 kept, at most 2 asked for, then live traffic (handlers
+        # run on a pool: no order among them)
+        late = manager.get_proxy("/Recorder/late")
+        early.moved.subscribe(late.record, replay=2)
+        early.move(5)
+        assert wait_for(lambda: sorted(late.get_seen()) == [3, 4, 5])
+
+        # the config overrides @event(history=N)
+        quiet = manager.get_proxy("/Recorder/quiet")
+        quiet.moved += live.record
+        quiet.move(10)
+        assert wait_for(lambda: 10 in live.get_seen())
+        quiet.moved.subscribe(late.record, replay=3)
+        quiet.move(11)
+        assert wait_for(lambda: 11 in late.get_seen())
+        assert 10 not in late.get_seen()
+
+    def test_replay_filtered(self, manager, wait_for):
+        manager.add_class(Recorder, "spaced")
+        manager.add_class(Recorder, "filtered")
+
+        spaced = manager.get_proxy("/Recorder/spaced")
+        for position in range(3):
+            spaced.move(position)
+            time.sleep(0.1)
+
+        # the history is filtered as it was published, and the live events
+        # that follow are not held back by it
+        filtered = manager.get_proxy("/Recorder/filtered")
+        spaced.moved.subscribe(
+            filtered.record, filter=EventFilter(min_interval=0.05), replay=3
+        )
+        spaced.move(3)
+        assert wait_for(lambda: sorted(filtered.get_seen()) == [0, 1, 2, 3])
+
+
+class Recorder(ChimeraObject):
+    def __init__(self):
+        ChimeraObject.__init__(self)
+        self.seen = []
+
+    def move(self, position):
+        self.moved(position)
+
+    @event(history=3)
+    def moved(self, position):
+        pass
+
+    def record(self, position):
+        self.seen.append(position)
+
+    def get_seen(self):
+        return self.seen
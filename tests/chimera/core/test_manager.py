@@ -1,10 +1,14 @@
 import logging
+import os
 import os.path
+import threading
 import time
 
 import pytest
 
+from chimera.core.bus import Bus
 from chimera.core.chimeraobject import ChimeraObject
+from chimera.core.event import event
 from chimera.core.exceptions import (
     ChimeraObjectException,
     ClassLoaderException,
@@ -12,6 +16,8 @@ from chimera.core.exceptions import (
     NotValidChimeraObjectException,
     ObjectNotFoundException,
 )
+from chimera.core.lock import lock
+from chimera.core.manager import Manager
 from chimera.core.proxy import Proxy
 
 
@@ -27,7 +33,63 @@ class NotValid:
     pass
 
 
+class Isolated(ChimeraObject):
+    __config__ = {"answer": 0}
+
+    def get_pid(self) -> int:
+        return os.getpid()
+
+    def get_answer(self) -> int:
+        return self["answer"]
+
+    def get_site_name(self) -> str:
+        return self.get_site()["name"]
+
+    def call_parent(self) -> int:
+        # relative locations resolve at the parent Manager
+        return self.get_proxy("/Simple/0").answer()
+
+    @lock
+    def fire(self, value: int) -> None:
+        self.fired(value)
+
+    @event
+    def fired(self, value: int):
+        pass
+
+    def crash(self) -> None:
+        os._exit(1)
+
+
 class TestManager:
+    def test_isolated_local_buses(self, tmp_path):
+        # ipc: the child listens next to the parent's socket
+        bus = Bus(f"ipc://{tmp_path}/chimera.sock")
+        thread = threading.Thread(target=bus.run_forever, daemon=True)
+        thread.start()
+        assert bus._bus_started.wait(5)
+        manager = Manager(bus)
+        try:
+            manager.add_class(Isolated, "isolated", isolated=True)
+            worker = manager.resources.get("/Isolated/isolated").worker
+            assert worker.url.bus == f"ipc://{tmp_path}/chimera.sock-Isolated-isolated"
+            assert manager.get_proxy("/Isolated/0").get_pid() == worker.pid
+        finally:
+            manager.shutdown()
+            bus.shutdown()
+            thread.join(10)
+
+        # inproc buses are not reachable from another process
+        bus = Bus("inproc://isolated-test")
+        manager = Manager(bus)
+        try:
+            with pytest.raises(ChimeraObjectException, match="tcp or ipc"):
+                manager.add_class(Isolated, "isolated", isolated=True)
+            assert "/Isolated/isolated" not in manager.resources
+        finally:
+            manager.shutdown()
+            bus.shutdown()
+
     def test_add_start(self, manager):
         # add by class
         assert manager.add_class(Simple, "simple", start=True)
@@ -186,3 +248,53 @@ class TestManager:
 
         # m = p.get_manager()
         # assert m.GUID() == manager.GUID()
+
+    def test_isolated(self, manager, wait_for):
+        manager.add_class(Simple, "simple")
+        assert manager.add_class(
+            Isolated, "isolated", config={"answer": 42}, isolated=True
+        )
+        resource = manager.resources.get("/Isolated/isolated")
+        worker = resource.worker
+        # the port the child picked, kept for restarts
+        url = worker.url
+        assert url.port != 0
+
+        # in a child process, transparently
+        p = manager.get_proxy("/Isolated/0")
+        assert p.get_pid() == worker.pid != os.getpid()
+        assert p.get_answer() == 42
+        assert p.get_site_name() == manager.site["name"]
+        assert p.call_parent() == 42
+        assert manager.get_resources_by_class("ChimeraObject").count(
+            "/Isolated/isolated"
+        )
+
+        fired = []
+        p.fired += lambda value: fired.append(value)
+        p.fire(7)
+        assert wait_for(lambda: fired == [7])
+
+        (status,) = [
+            o for o in manager.get_status()["objects"] if o["path"] == resource.path
+        ]
+        assert status["class"] == "Isolated"
+        assert status["state"] == "RUNNING"
+        assert status["worker"]["pid"] == worker.pid
+
+        # bad configuration shows up at add time, as for local objects
+        with pytest.raises(ChimeraObjectException):
+            manager.add_class(Isolated, "bad", config={"what": 1}, isolated=True)
+        assert "/Isolated/bad" not in manager.resources
+
+        # restarted when it dies, where proxies already point
+        pid = worker.pid
+        p.crash.submit()
+        assert wait_for(lambda: worker.restarts == 1 and worker.alive(), timeout=30)
+        assert p.get_pid() == worker.pid != pid
+        assert worker.url == url
+
+        process = worker._process
+        assert manager.remove("/Isolated/isolated") is True
+        assert not process.is_alive()
+        assert worker.restarts == 1
@@ -0,0 +1,47 @@
+from chimera.core.metrics import BUCKETS, Histogram, Metrics
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.observe(0.0007)  # the 1ms bucket
+    for _ in range(10):
+        histogram.observe(0.2)  # the 250ms bucket
+    histogram.observe(120.0)  # beyond the last bound: +Inf
+
+    assert histogram.count == 101
+    assert histogram.counts[BUCKETS.index(0.001)] == 90
+    assert histogram.counts[BUCKETS.index(0.25)] == 10
+    assert histogram.counts[-1] == 1
+    assert histogram.max == 120.0
+
+    assert histogram.quantile(0.5) == 0.001
+    assert histogram.quantile(0.95) == 0.25
+    assert histogram.quantile(1.0) == 120.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_snapshot_and_prometheus():
+    metrics = Metrics()
+    metrics.observe("execute", "/Camera/cam", "expose", 1.5)
+    metrics.observe("execute", "/Camera/cam", "expose", 3.0)
+    metrics.count("errors", "/Camera/cam", "expose")
+
+    snapshot = metrics.snapshot()
+    (histogram,) = snapshot["histograms"]
+    assert histogram["stage"] == "execute"
+    assert histogram["count"] == 2
+    assert histogram["sum"] == 4.5
+    assert sum(histogram["buckets"]) == 2
+    assert snapshot["counters"] == [
+        {"name": "errors", "path": "/Camera/cam", "method": "expose", "value": 1}
+    ]
+
+    text = metrics.prometheus()
+    labels = 'stage="execute",path="/Camera/cam",method="expose"'
+    assert "# TYPE chimera_bus_stage_seconds histogram" in text
+    assert f'chimera_bus_stage_seconds_bucket{{{labels},le="1.0"}} 0' in text
+    assert f'chimera_bus_stage_seconds_bucket{{{labels},le="2.5"}} 1' in text
+    assert f'chimera_bus_stage_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"chimera_bus_stage_seconds_count{{{labels}}} 2" in text
+    assert 'chimera_bus_errors_total{path="/Camera/cam",method="expose"} 1' in text
@@ -22,6 +22,8 @@ def proxy():
         {
             "__url__": parse_url("tcp://localhost:7777/Telescope/tel"),
             "__resolved_url__": parse_url("tcp://localhost:7778/Telescope/tel"),
+            "__memoized__": frozenset(),
+            "__streams__": frozenset(),
             "__proxy_url__": parse_url("tcp://localhost:7777/Proxy/p"),
             "__bus__": ExplodingBus(),
             "__timeout__": None,
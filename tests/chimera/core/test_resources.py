@@ -158,3 +158,30 @@ class TestResources:
         for k, v in resources.items():
             assert k == expected_paths.pop(0)
             assert v == expected_resources.pop(0)
+
+    def test_started_reorders_index(self, resources: ResourcesManager):
+        class Base:
+            pass
+
+        class A(Base):
+            pass
+
+        resources.add("/A/a1", A())
+        resources.add("/A/a2", A())
+        assert resources.get("/Base/0").path == "/A/a1"
+
+        # restarted objects go last, as they always sorted by start time
+        resources.started("/A/a1")
+        assert resources.get("/A/0").path == "/A/a2"
+        assert resources.get("/Base/1").path == "/A/a1"
+
+        resources.started("/A/1", bases=["A"])
+        assert [r.path for r in resources.get_by_class("Base")] == ["/A/a2"]
+
+        resources.remove("/A/a2")
+        resources.remove("/A/a1")
+        assert resources.get_by_class("A") == []
+        assert resources.get("/Base/0") is None
+
+        with pytest.raises(KeyError):
+            resources.started("/A/a1")
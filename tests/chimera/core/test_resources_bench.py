@@ -0,0 +1,52 @@
+import time
+
+from rich import print
+
+from chimera.core.resources import ResourcesManager
+
+
+class Base:
+    pass
+
+
+class Camera(Base):
+    pass
+
+
+class Dome(Base):
+    pass
+
+
+def scan(resources: ResourcesManager, cls: str, index: int):
+    # what every lookup did before the indexes
+    found = sorted(
+        (r for _, r in resources.items() if cls == r.cls or cls in r.bases),
+        key=lambda r: r.created,
+    )
+    return found[index] if index < len(found) else None
+
+
+def test_resources_bench():
+    resources = ResourcesManager()
+    for i in range(300):
+        resources.add(f"/Camera/camera{i}", Camera())
+        resources.add(f"/Dome/dome{i}", Dome())
+
+    for cls, index in (("Camera", 0), ("Dome", 299), ("Base", 450), ("Base", 600)):
+        assert resources.get(f"/{cls}/{index}") is scan(resources, cls, index)
+
+    n = 1_000
+    lookups = {
+        "scan by index": lambda: scan(resources, "Camera", 150),
+        "by index": lambda: resources.get("/Camera/150"),
+        "by name": lambda: resources.get("/Camera/camera150"),
+        "contains": lambda: "/Dome/dome299" in resources,
+    }
+    for label, lookup in lookups.items():
+        t0 = time.monotonic()
+        for _ in range(n):
+            lookup()
+        total = time.monotonic() - t0
+        print(
+            f"{label}: {total * 1e6 / n:.3f} us per lookup ({len(resources)} objects)"
+        )
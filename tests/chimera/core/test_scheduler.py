@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+from chimera.core.bus import Bus
+from chimera.core.chimeraobject import ChimeraObject
+from chimera.core.manager import Manager
+from chimera.core.scheduler import LoopScheduler
+
+
+class Counter(ChimeraObject):
+    def __init__(self):
+        ChimeraObject.__init__(self)
+        self.calls = 0
+        self.fail = False
+        self.sleep = 0.0
+        self.stop_after = None
+        self.threads = set()
+
+    def control(self):
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        time.sleep(self.sleep)
+        if self.fail:
+            raise RuntimeError("one bad serial frame")
+        return self.stop_after is None or self.calls < self.stop_after
+
+
+class OwnLoop(Counter):
+    def __main__(self):
+        return True
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = LoopScheduler(workers=2, tick=0.005)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_rates(scheduler, wait_for):
+    fast, slow = Counter(), Counter()
+    fast.set_hz(100)
+    slow.set_hz(10)
+
+    scheduler.add("/Counter/fast", fast)
+    scheduler.add("/Counter/slow", slow)
+    with pytest.raises(ValueError):
+        scheduler.add("/Counter/fast", fast)
+
+    time.sleep(0.5)
+    assert 30 <= fast.calls <= 55
+    assert 4 <= slow.calls <= 7
+
+    stats = scheduler.stats()["loops"]
+    assert stats["/Counter/fast"]["runs"] == pytest.approx(fast.calls, abs=1)
+    assert stats["/Counter/fast"]["overruns"] == 0
+    assert 0 <= stats["/Counter/slow"]["jitter_mean"] < 0.05
+    # both on the two pool workers, no thread each
+    assert len(fast.threads | slow.threads) <= 2
+
+
+def test_sleeps_between_runs(scheduler, wait_for):
+    slow = Counter()
+    slow.set_hz(5)
+    scheduler.add("/Counter/slow", slow)
+    time.sleep(1.0)
+
+    # woken for the runs, not for every 5 ms tick in between
+    assert 5 <= slow.calls <= 7
+    assert scheduler.stats()["wakeups"] <= 2 * slow.calls
+
+    # a faster loop added meanwhile is not held up by the sleep
+    fast = Counter()
+    fast.set_hz(100)
+    scheduler.add("/Counter/fast", fast)
+    assert wait_for(lambda: fast.calls >= 20, timeout=0.5)
+
+
+def test_loop_end(scheduler, wait_for):
+    done = Counter()
+    done.set_hz(100)
+    done.stop_after = 3
+    # one bad cycle does not end the loop
+    flaky = Counter()
+    flaky.set_hz(100)
+    flaky.fail = True
+
+    finished = scheduler.add("/Counter/done", done)
+    running = scheduler.add("/Counter/flaky", flaky)
+
+    assert finished.result(timeout=5) is True
+    assert done.calls == 3
+    assert "/Counter/done" not in scheduler
+
+    assert wait_for(lambda: flaky.calls > 3)
+    assert not running.cancel()
+    scheduler.remove("/Counter/flaky")
+    assert running.result(timeout=5) is True
+    calls = flaky.calls
+    time.sleep(0.1)
+    assert flaky.calls == calls
+
+    # unknown loops
+    scheduler.remove("/Counter/flaky")
+
+
+def test_overrun(scheduler, wait_for):
+    slow = Counter()
+    slow.set_hz(50)
+    slow.sleep = 0.05
+    scheduler.add("/Counter/slow", slow)
+
+    assert wait_for(lambda: slow.calls >= 3)
+    stats = scheduler.stats()["loops"]["/Counter/slow"]
+    assert stats["overruns"] >= 2
+    assert stats["busy"] >= 0.1
+
+    # abort ends it like __main__
+    slow.__abort_loop__()
+    assert wait_for(lambda: "/Counter/slow" not in scheduler)
+
+
+def test_manager():
+    bus = Bus("tcp://127.0.0.1:15115")
+    thread = threading.Thread(target=bus.run_forever, daemon=True)
+    thread.start()
+    assert bus._bus_started.wait(5)
+    manager = Manager(bus, scheduler=2)
+
+    try:
+        manager.add_class(Counter, "shared")
+        manager.add_class(Counter, "own", config={"own_thread": True})
+        manager.add_class(OwnLoop, "loop")
+
+        status = manager.get_status()
+        assert set(status["scheduler"]["loops"]) == {"/Counter/shared"}
+        loops = {entry["path"]: entry["loop"] for entry in status["objects"]}
+        assert loops["/Counter/shared"] == "running"
+        assert loops["/Counter/own"] == "running"
+
+        manager.stop("/Counter/shared")
+        assert manager.get_status()["scheduler"]["loops"] == {}
+        manager.start("/Counter/shared")
+        assert "/Counter/shared" in manager.get_status()["scheduler"]["loops"]
+    finally:
+        manager.shutdown()
+        bus.shutdown()
+        thread.join(10)
@@ -0,0 +1,208 @@
+import json
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures.thread import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from chimera.core import tracing
+from chimera.core.bus import Bus
+from chimera.core.chimeraobject import ChimeraObject
+from chimera.core.event import event
+from chimera.core.manager import Manager
+from chimera.core.protocol import TraceContext
+from chimera.core.proxy import Proxy
+
+
+@pytest.fixture
+def traced(tmp_path: Path) -> Generator[Callable[..., tracing.Tracer]]:
+    def _configure(name: str = "trace.jsonl", sample: float = 1.0) -> tracing.Tracer:
+        return tracing.configure(str(tmp_path / name), sample)
+
+    yield _configure
+    tracing.shutdown()
+
+
+def read(path: str) -> list[dict[str, Any]]:
+    return tracing.load([path])
+
+
+def test_nested_spans(traced: Callable[..., tracing.Tracer]):
+    tracer = traced()
+
+    with tracing.span("outer") as outer:
+        assert outer is not None
+        assert tracing.current() == outer.context
+        with tracing.span("inner", "client", answer=42) as inner:
+            assert inner is not None
+            assert inner.context.trace_id == outer.context.trace_id
+        assert tracing.current() == outer.context
+    assert tracing.current() is None
+
+    with pytest.raises(ValueError):
+        with tracing.span("failing"):
+            raise ValueError()
+
+    spans = {span["name"]: span for span in read(tracer.path)}
+    assert spans["inner"]["parent"] == spans["outer"]["span"]
+    assert spans["inner"]["kind"] == "client"
+    assert spans["inner"]["attrs"] == {"answer": 42}
+    assert spans["outer"]["parent"] is None
+    assert spans["failing"]["attrs"] == {"error": "ValueError"}
+
+
+def test_unsampled_and_untraced(traced: Callable[..., tracing.Tracer]):
+    remote = TraceContext(trace_id=1, span_id=2)
+
+    # no tracer in this process: nothing recorded, a remote parent passes
+    # through unchanged so calls made here still join its trace
+    with tracing.span("root") as span:
+        assert span is None
+        assert tracing.current() is None
+    with tracing.span("child", parent=remote) as span:
+        assert span is None
+        assert tracing.current() == remote
+
+    # never sampled: no trace starts, but remote traces are still recorded
+    tracer = traced(sample=0.0)
+    with tracing.span("root") as span:
+        assert span is None
+        assert tracing.current() is None
+    with tracing.span("child", parent=remote) as span:
+        assert span is not None
+        assert span.parent == 2
+
+    assert [span["name"] for span in read(tracer.path)] == ["child"]
+
+
+def test_chrome_format(traced: Callable[..., tracing.Tracer]):
+    tracer = traced("trace.json")
+    with tracing.span("outer"):
+        with tracing.span("inner"):
+            pass
+    tracer.close()
+
+    # a valid (if unterminated) Chrome trace event array
+    text = Path(tracer.path).read_text()
+    events = json.loads(text.rstrip().rstrip(",") + "]")
+    assert [e["name"] for e in events] == ["inner", "outer"]
+    assert {e["ph"] for e in events} == {"X"}
+
+    spans = {span["name"]: span for span in read(tracer.path)}
+    assert spans["inner"]["parent"] == spans["outer"]["span"]
+    assert spans["outer"]["duration"] >= spans["inner"]["duration"]
+
+
+def test_critical_path():
+    def span(id: str, parent: str | None, name: str, start: float, duration: float):
+        return {
+            "trace": "t",
+            "span": id,
+            "parent": parent,
+            "name": name,
+            "kind": "server",
+            "start": start,
+            "duration": duration,
+        }
+
+    spans = [
+        span("a", None, "expose", 0.0, 10.0),
+        # the parent waited for both; "b" finished last
+        span("b", "a", "readout", 1.0, 8.0),
+        span("c", "a", "headers", 1.0, 2.0),
+        span("d", "b", "save", 5.0, 3.0),
+        # its parent was never recorded: a root of its own
+        span("e", "x", "orphan", 0.0, 5.0),
+    ]
+    breakdown = tracing.critical_path(spans)
+
+    assert breakdown[("server", "expose")]["time"] == pytest.approx(2.0)
+    assert breakdown[("server", "readout")]["time"] == pytest.approx(5.0)
+    assert breakdown[("server", "save")]["time"] == pytest.approx(3.0)
+    assert breakdown[("server", "orphan")]["time"] == pytest.approx(5.0)
+    assert ("server", "headers") not in breakdown
+    assert breakdown[("server", "expose")]["share"] == pytest.approx(2.0 / 15.0)
+
+    # one child after the other: the parent only owns the gaps between them
+    breakdown = tracing.critical_path(
+        [
+            span("a", None, "expose", 0.0, 10.0),
+            span("b", "a", "integrate", 1.0, 4.0),
+            span("c", "a", "readout", 6.0, 3.0),
+        ]
+    )
+    assert breakdown[("server", "expose")]["time"] == pytest.approx(3.0)
+    assert breakdown[("server", "readout")]["time"] == pytest.approx(3.0)
+    assert ("server", "integrate") not in breakdown
+
+
+class Inner(ChimeraObject):
+    def compute(self) -> int:
+        return 42
+
+
+class Outer(ChimeraObject):
+    @event
+    def computed(self, value: int):
+        pass
+
+    def work(self) -> int:
+        value = self.get_proxy("/Inner/inner").compute()
+        self.computed(value)
+        return value
+
+
+def test_trace_across_buses(traced: Callable[..., tracing.Tracer]):
+    """A proxy call, the remote method, the call it makes in turn and the
+    event it fires all land in one trace, linked parent to child."""
+    tracer = traced()
+    server = Bus("tcp://127.0.0.1:15102")
+    client = Bus("tcp://127.0.0.1:15103")
+    manager = Manager(server)
+
+    pool = ThreadPoolExecutor()
+    futures = [pool.submit(bus.run_forever) for bus in (server, client)]
+    assert server._bus_started.wait(5)
+    assert client._bus_started.wait(5)
+
+    manager.add_class(Inner, "inner", start=False)
+    manager.add_class(Outer, "outer", start=False)
+
+    outer = Proxy(f"{server.url.bus}/Outer/outer", client)
+    received = threading.Event()
+    outer.computed += lambda value: received.set()
+
+    assert outer.work() == 42
+    assert received.wait(5)
+
+    # the event callback finishes after the call returned
+    deadline = time.monotonic() + 5
+    while not any(span["kind"] == "event" for span in read(tracer.path)):
+        assert time.monotonic() < deadline, "event span never recorded"
+        time.sleep(0.01)
+
+    spans = read(tracer.path)
+    by_key = {(span["kind"], span["name"]): span for span in spans}
+    call = by_key[("client", "/Outer/outer.work")]
+    work = by_key[("server", "/Outer/outer.work")]
+    nested = by_key[("client", "/Inner/inner.compute")]
+    compute = by_key[("server", "/Inner/inner.compute")]
+    callback = by_key[("event", "computed")]
+
+    assert call["parent"] is None
+    assert work["parent"] == call["span"]
+    assert nested["parent"] == work["span"]
+    assert compute["parent"] == nested["span"]
+    assert callback["parent"] == work["span"]
+    assert {span["trace"] for span in spans} == {call["trace"]}
+    assert "pool_wait" in work["attrs"]
+
+    manager.shutdown()
+    for bus in (server, client):
+        bus.shutdown()
+    for future in futures:
+        future.result()
+    pool.shutdown()
@@ -13,6 +13,20 @@ class TestURL:
         assert url.cls == "Class"
         assert url.name == "name"
 
+    def test_parse_local_url(self):
+        url = parse_url("inproc://manager/Class/name")
+        assert url.bus == "inproc://manager"
+        assert url.host == "manager"
+        assert url.port == 0
+        assert url.url == "inproc://manager/Class/name"
+
+        # ipc addresses are paths: the object path is the last two segments
+        url = parse_url("ipc:///run/chimera/bus.sock/Class/1")
+        assert url.bus == "ipc:///run/chimera/bus.sock"
+        assert url.cls == "Class"
+        assert url.name == "1"
+        assert url.indexed
+
     def test_copy_ctor(self):
         url_1 = parse_url("hostname:1000/Class/name")
         url_2 = parse_url(url_1)
@@ -40,6 +54,8 @@ class TestURL:
             "200.100.100.100:1000/Class/other",
             "200.100.100.100:1000/Class/1",
             "localhost:9000/class/o",
+            "inproc://manager/Class/1",
+            "ipc:///tmp/chimera.sock/Class/other",
         ],
     )
     def test_valid(self, url: str):
@@ -54,6 +70,9 @@ class TestURL:
             "200.100.100.100/Class/name",
             ":1000/Class/name",
             "200.100.100.100:port/Class/name",
+            "http://200.100.100.100:1000/Class/name",
+            "inproc:///Class/name",
+            "ipc:///Class/name",
         ],
     )
     def test_invalid_host(self, url: str):
@@ -69,6 +88,8 @@ class TestURL:
             "200.100.100.100:1000/1234/name",
             "200.100.100.100:1000/12345Class/o",
             "200.100.100.100:1000/Class/1what",
+            "inproc://manager",
+            "inproc://manager/Who/am/I",
         ],
     )
     def test_invalid_path(self, url: str):